@@ -0,0 +1,46 @@
+"""This module contains the batch evaluation, which scores many positions in a single vectorized
+NumPy call from their grid encodings"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from chess_engine.evaluation import SQUARE_SCORES, SQUARES
+from chess_engine.grid import Grid
+
+# White relative score by piece code and square
+SQUARE_SCORE_TABLE = np.array(SQUARE_SCORES, dtype=np.int32)
+_SQUARE_INDEXES = np.arange(SQUARES)
+
+def encode_batch(grids: Iterable[Grid]) -> npt.NDArray[np.int8]:
+    """Encodes the grids for evaluate_batch
+
+    Args:
+        grids (Iterable[Grid]): Grids
+
+    Returns:
+        npt.NDArray[np.int8]: N x 64 array of piece codes, a row per grid, see Grid.encode
+    """
+    encodings = b"".join(grid.encode() for grid in grids)
+    return np.frombuffer(encodings, dtype=np.int8).reshape(-1, SQUARES)
+
+def evaluate_batch(codes: npt.NDArray[np.int8]) -> npt.NDArray[np.int32]:
+    """Evaluates a batch of positions, as Grid.evaluation does for each one
+
+    Args:
+        codes (npt.NDArray[np.int8]): N x 64 array of piece codes, a row per position
+
+    Returns:
+        npt.NDArray[np.int32]: N scores in centipawns, positive when white is ahead
+    """
+    if codes.ndim != 2 or codes.shape[1] != SQUARES:
+        raise ValueError(f"Expected an N x {SQUARES} array, got shape {codes.shape}")
+    if codes.dtype != np.int8:
+        raise ValueError(f"Expected int8 piece codes, got {codes.dtype}")
+    if codes.size > 0 and (codes.min() < 0 or codes.max() >= len(SQUARE_SCORE_TABLE)):
+        raise ValueError("Invalid piece code")
+
+    return SQUARE_SCORE_TABLE[codes, _SQUARE_INDEXES].sum(axis=1, dtype=np.int32)
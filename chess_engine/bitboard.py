@@ -0,0 +1,195 @@
+"""This module contains the bitboard board representation, an optional companion of the Grid
+which answers attack queries with bitwise operations"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from chess_engine.enums import MovSpecialCase, PieceType, SideColor
+from chess_engine.piece import BLACK_MOV_DIR, WHITE_MOV_DIR, Piece
+from chess_engine.structs import BOARD_SIZE, Coord, Dir
+
+SQUARES = BOARD_SIZE * BOARD_SIZE
+FULL_BOARD = (1 << SQUARES) - 1
+
+def get_square(coord: Coord) -> int:
+    """Index of the coordinate in the bitboard, from 0 (a8) to 63 (h1)
+
+    Args:
+        coord (Coord): Coordinate
+
+    Returns:
+        int: Square index
+    """
+    return coord.square
+
+def _in_bounds(row: int, column: int) -> bool:
+    return 0 <= row < BOARD_SIZE and 0 <= column < BOARD_SIZE
+
+def _jump_table(directions: list[Dir]) -> list[int]:
+    table: list[int] = []
+    for square in range(SQUARES):
+        row, column = divmod(square, BOARD_SIZE)
+        mask = 0
+        for direction in directions:
+            d_row, d_column = row + direction.row, column + direction.column
+            if _in_bounds(d_row, d_column):
+                mask |= 1 << (d_row * BOARD_SIZE + d_column)
+        table.append(mask)
+    return table
+
+def _ray_table(direction: Dir) -> list[int]:
+    table: list[int] = []
+    for square in range(SQUARES):
+        row, column = divmod(square, BOARD_SIZE)
+        mask = 0
+        row, column = row + direction.row, column + direction.column
+        while _in_bounds(row, column):
+            mask |= 1 << (row * BOARD_SIZE + column)
+            row, column = row + direction.row, column + direction.column
+        table.append(mask)
+    return table
+
+def _movement_dirs(piece_type: PieceType, mov_case: MovSpecialCase, mov_dir: int=0) -> list[Dir]:
+    movements = Piece.get_type_movements(piece_type, mov_dir)
+    return [direction for direction, case in movements.items() if case is mov_case]
+
+# Attack tables, indexed by square
+KNIGHT_ATTACKS = _jump_table(_movement_dirs(PieceType.KNIGTH, MovSpecialCase.NONE))
+KING_ATTACKS = _jump_table(_movement_dirs(PieceType.KING, MovSpecialCase.NONE))
+PAWN_ATTACKS = {
+    SideColor.WHITE: _jump_table(_movement_dirs(PieceType.PAWN, MovSpecialCase.PAWN_ATTACK,
+                                                WHITE_MOV_DIR)),
+    SideColor.BLACK: _jump_table(_movement_dirs(PieceType.PAWN, MovSpecialCase.PAWN_ATTACK,
+                                                BLACK_MOV_DIR)),
+}
+
+# Sliding rays, pairs of (ray table, whether the ray goes towards higher squares)
+ROOK_RAYS = [(_ray_table(d), d.row * BOARD_SIZE + d.column > 0)
+             for d in _movement_dirs(PieceType.ROOK, MovSpecialCase.NONE)]
+BISHOP_RAYS = [(_ray_table(d), d.row * BOARD_SIZE + d.column > 0)
+               for d in _movement_dirs(PieceType.BISHOP, MovSpecialCase.NONE)]
+
+def _sliding_attacks(square: int, occupied: int, rays: list[tuple[list[int], bool]]) -> int:
+    attacks = 0
+    for ray, increasing in rays:
+        ray_mask = ray[square]
+        blockers = ray_mask & occupied
+        if blockers:
+            if increasing:
+                first_blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                first_blocker = blockers.bit_length() - 1
+            ray_mask ^= ray[first_blocker]
+        attacks |= ray_mask
+    return attacks
+
+def rook_attacks(square: int, occupied: int) -> int:
+    """Squares attacked by a rook in the square, given the occupied squares
+
+    Args:
+        square (int): Square index
+        occupied (int): Occupied squares bitboard
+
+    Returns:
+        int: Attacked squares bitboard
+    """
+    return _sliding_attacks(square, occupied, ROOK_RAYS)
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    """Squares attacked by a bishop in the square, given the occupied squares
+
+    Args:
+        square (int): Square index
+        occupied (int): Occupied squares bitboard
+
+    Returns:
+        int: Attacked squares bitboard
+    """
+    return _sliding_attacks(square, occupied, BISHOP_RAYS)
+
+@dataclass
+class Bitboards:
+    """64 bit integer boards per color and per piece type, kept in sync with a Grid
+
+    Attributes:
+        colors (dict[SideColor, int]): Occupied squares per color.
+        pieces (dict[SideColor, dict[PieceType, int]]): Occupied squares per color and type.
+    """
+
+    colors: dict[SideColor, int] = field(
+        default_factory=lambda: {color: 0 for color in SideColor})
+    pieces: dict[SideColor, dict[PieceType, int]] = field(
+        default_factory=lambda: {color: {typ: 0 for typ in PieceType} for color in SideColor})
+
+    @property
+    def occupied(self) -> int:
+        """Bitboard of all the occupied squares"""
+        return self.colors[SideColor.WHITE] | self.colors[SideColor.BLACK]
+
+    def add(self, piece: Piece, coord: Coord) -> None:
+        """Sets the coordinate's square in the piece's color and type boards
+
+        Args:
+            piece (Piece): Piece
+            coord (Coord): Coordinate of the piece
+        """
+        bit = 1 << get_square(coord)
+        self.colors[piece.color] |= bit
+        self.pieces[piece.color][piece.type] |= bit
+
+    def remove(self, piece: Piece, coord: Coord) -> None:
+        """Clears the coordinate's square in the piece's color and type boards
+
+        Args:
+            piece (Piece): Piece
+            coord (Coord): Coordinate of the piece
+        """
+        mask = FULL_BOARD ^ (1 << get_square(coord))
+        self.colors[piece.color] &= mask
+        self.pieces[piece.color][piece.type] &= mask
+
+    def is_attacked(self, coord: Coord, attacker: SideColor) -> bool:
+        """Whether any of the attacker's pieces attacks the coordinate
+
+        Args:
+            coord (Coord): Coordinate
+            attacker (SideColor): Attacking color
+
+        Returns:
+            bool: Whether is attacked
+        """
+        square = get_square(coord)
+        boards = self.pieces[attacker]
+        defender = SideColor.BLACK if attacker == SideColor.WHITE else SideColor.WHITE
+
+        if KNIGHT_ATTACKS[square] & boards[PieceType.KNIGTH]:
+            return True
+        if KING_ATTACKS[square] & boards[PieceType.KING]:
+            return True
+        # Attacking pawns stand where a defender's pawn on the square would attack
+        if PAWN_ATTACKS[defender][square] & boards[PieceType.PAWN]:
+            return True
+
+        queens = boards[PieceType.QUEEN]
+        occupied = self.occupied
+        if rook_attacks(square, occupied) & (boards[PieceType.ROOK] | queens):
+            return True
+        return bool(bishop_attacks(square, occupied) & (boards[PieceType.BISHOP] | queens))
+
+    @staticmethod
+    def from_pieces(*pieces_sets: Iterable[Piece]) -> Bitboards:
+        """Builds the bitboards from the given pieces
+
+        Args:
+            *pieces_sets (Iterable[Piece]): Pieces, in their current coords
+
+        Returns:
+            Bitboards: Bitboards
+        """
+        bitboards = Bitboards()
+        for pieces in pieces_sets:
+            for piece in pieces:
+                bitboards.add(piece, piece.coord)
+        return bitboards
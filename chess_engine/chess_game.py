@@ -3,20 +3,56 @@
 # Import external libraries
 from __future__ import annotations
 
+from contextlib import contextmanager
 from copy import copy
 from dataclasses import dataclass, field
-from typing import cast
+from typing import Iterator, NamedTuple, cast
 
-from chess_engine.chess_game_data import ChessGameData, GameState, OptMovement
+from chess_engine.chess_game_data import (NULL_EN_PASSANT_CODE, ChessGameData,
+                                          GameState, Movement, OptMovement)
 from chess_engine.chess_validator import (ChessValidator, GridContext,
-                                          ValidationResult)
-from chess_engine.enums import MoveStatus, TurnState
-from chess_engine.grid import Grid
-from chess_engine.piece import OptPiece, Piece, PieceType, SideColor
-from chess_engine.structs import CastlingState, Coord
-from utils.errors import InvalidChessGameError
+                                          LegalMove, ValidationResult)
+from chess_engine.enums import (BoardBackend, CacheScope, MoveStatus,
+                                TurnState)
+from chess_engine.game_journal import GameJournal
+from chess_engine.grid import L_COLUMNS, L_ROWS, Grid, MoveUndo
+from chess_engine.piece import (BLACK_MOV_DIR, WHITE_MOV_DIR, OptPiece, Piece,
+                                PieceType, SideColor)
+from chess_engine.structs import CastlingState, Coord, Dir
+from chess_engine.validation_cache import ValidationCache
+from chess_engine.zobrist import get_state_key
+from utils.errors import (EnumParseError, GridInvalidCoordError,
+                          InvalidChessGameError, InvalidGridError,
+                          InvalidMoveHistoryError)
 from utils.utils import opponent
 
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+# FEN castling flags, king and queen side for white and then black
+FEN_CASTLING = "KQkq"
+FEN_EMPTY_FIELD = '-'
+
+# Compact position encoding, the grid encoding followed by these bytes
+POSITION_TURN_CODES = {SideColor.WHITE : 0, SideColor.BLACK : 1}
+POSITION_BYTES = L_ROWS * L_COLUMNS + 3
+
+class GameUndo(NamedTuple):
+    """Undo record of a move performed by a ChessGame
+
+    Attributes:
+        grid_undos (tuple[MoveUndo, ...]): Grid undo tokens, in the order they were made.
+        white_castle (CastlingState): White castling state previous to the move.
+        black_castle (CastlingState): Black castling state previous to the move.
+        state (GameState): Game state previous to the move.
+        turn_state (TurnState): Turn state previous to the move.
+        halfmove_clock (int): Halfmove clock previous to the move.
+    """
+
+    grid_undos: tuple[MoveUndo, ...]
+    white_castle: CastlingState
+    black_castle: CastlingState
+    state: GameState
+    turn_state: TurnState
+    halfmove_clock: int
 
 @dataclass
 class ChessGame():
@@ -26,20 +62,87 @@ class ChessGame():
     grid: Grid
     data: ChessGameData
     validate: bool = True
+    backend: BoardBackend = BoardBackend.GRID
+    cache_scope: CacheScope = CacheScope.SHARED
+    # Autosave recording every performed and undone move, compacted on construction
+    journal: GameJournal | None = None
     turn_state: TurnState = field(init=False)
+    validation_cache: ValidationCache = field(init=False)
+    _undo_stack: list[GameUndo] = field(init=False, default_factory=list)
+    # While replaying a history terminal states aren't looked for after each move
+    _replaying: bool = field(init=False, default=False)
 
     def __post_init__(self) -> None:
+        # The game reads and modifies the history, a lazy one is built first
+        self.data.load_move_history()
+        if self.backend is BoardBackend.BITBOARD:
+            self.grid.enable_bitboards()
+        if self.cache_scope is CacheScope.GAME:
+            self.validation_cache = ValidationCache()
+        else:
+            self.validation_cache = ChessValidator.shared_cache
+
         if self.validate:
             if not ChessValidator.is_valid_initial_grid():
                 raise InvalidChessGameError("Invalid Initial Grid Constructor")
-            valid_history, mov_grid_ctx = self._validate_history()
-            if not valid_history:
-                raise InvalidChessGameError("Invalid move history")
+            illegal_ply, mov_grid_ctx = self._validate_history()
+            if illegal_ply is not None:
+                raise InvalidMoveHistoryError(illegal_ply)
             if not self._validate_grid(mov_grid_ctx):
                 raise InvalidChessGameError("Invalid grid")
 
-        ChessValidator.clean_cache(self.grid_ctx())
         self._set_turn_state()
+        if self.journal is not None:
+            self.journal.compact(self.data)
+
+    def encode_position(self) -> bytes:
+        """Compact encoding of the position, the grid encoding followed by the side to move,
+        the castling flags and the en passant column, see decode_position
+
+        Returns:
+            bytes: Encoding, POSITION_BYTES long
+        """
+        castling = 0
+        flags = (*self.data.white_castle, *self.data.black_castle)
+        for i, flag in enumerate(flags):
+            castling |= flag << i
+        en_passant = self._get_en_passant_column()
+        en_passant_code = NULL_EN_PASSANT_CODE if en_passant is None else en_passant
+        return self.grid.encode() + bytes((POSITION_TURN_CODES[self.data.turn], castling,
+                                           en_passant_code))
+
+    def to_fen(self) -> str:
+        """FEN string of the position, the en passant target is given after any double pawn
+        move, see from_fen
+
+        Returns:
+            str: FEN string
+        """
+        castling = ''.join(flag for flag, castle in (
+            (FEN_CASTLING[0], self.data.white_castle.right),
+            (FEN_CASTLING[1], self.data.white_castle.left),
+            (FEN_CASTLING[2], self.data.black_castle.right),
+            (FEN_CASTLING[3], self.data.black_castle.left)) if castle)
+
+        en_passant = FEN_EMPTY_FIELD
+        last_mov = self._get_last_move()
+        if self._get_en_passant_column() is not None and last_mov is not None:
+            l_piece, l_dest = last_mov
+            l_dest = cast(Coord, l_dest)
+            target = Coord((l_piece.coord.row + l_dest.row) // 2, l_dest.column)
+            en_passant = Grid.get_coord_str(target)
+
+        return ' '.join((self.grid.to_fen(), self.data.turn.value,
+                         castling if castling else FEN_EMPTY_FIELD, en_passant,
+                         str(self.data.halfmove_clock), str(self.data.fullmove_number)))
+
+    @property
+    def position_key(self) -> int:
+        """Zobrist key of the position, covering the piece placement, side to move, castling
+        states and en passant column, equal positions share the same key"""
+        castling = (self.data.white_castle, self.data.black_castle)
+        state_key = get_state_key(self.data.turn, castling, self._get_en_passant_column())
+        return self.grid.zobrist_key ^ state_key
 
     def attempt_move(self, origin: Coord, destination: Coord) -> MoveStatus:
         """TODO
@@ -50,47 +153,124 @@ class ChessGame():
 
         o_piece, d_piece = self.grid.get_at(origin), self.grid.get_at(destination)
         o_piece = cast(Piece, o_piece)# Already validated origin indeed exists
+        prev_state = self._get_undo_state()
 
         ctx = (origin, destination, o_piece, d_piece)
         if perform_castle:
-            self._perform_castle(ctx)
+            grid_undos = self._perform_castle(ctx)
         else:
-            self._perform_move(ctx)
-
-        ChessValidator.clean_cache(self.opponent_grid_ctx())
+            grid_undos = self._perform_move(ctx)
 
         # Next turn state
         if new_castling is not None:
-            self._set_castling(new_castling)
-        self._set_turn_state()
-        self._check_for_endgame()
-
-        self.data.turn = opponent(self.data.turn)
+            self._set_castling(new_castling, self.data.turn)
+        self._next_turn(GameUndo(grid_undos, *prev_state))
         return MoveStatus.PERFORMED
 
     def attempt_promotion(self, origin: Coord, destination: Coord,
                           piece_type: PieceType) -> MoveStatus:
         """TODO
         """
-        invalid, _, _ = self._is_valid_move(origin, destination)
-        if invalid not in (None, MoveStatus.REQUIRE_PROMOTION):
-            return invalid
+        validation, _, _ = self._is_valid_move(origin, destination)
+        if validation is not MoveStatus.REQUIRE_PROMOTION:
+            return MoveStatus.INVALID
         if not ChessValidator.is_valid_promotion_type(piece_type):
             return MoveStatus.INVALID
 
         o_piece = self.grid.get_at(origin)
         prom_piece = Piece(piece_type, self.data.turn, destination)
         o_piece = cast(Piece, o_piece)# Already validated origin indeed exists
+        prev_state = self._get_undo_state()
 
-        self._perform_promotion((origin, destination, o_piece, prom_piece))
-        ChessValidator.clean_cache(self.opponent_grid_ctx())
+        grid_undos = self._perform_promotion((origin, destination, o_piece, prom_piece))
 
         # Next turn state
-        self._set_turn_state()
-        self._check_for_endgame()
+        self._next_turn(GameUndo(grid_undos, *prev_state))
+        return MoveStatus.PERFORMED
+
+    def attempt_legal_move(self, move: LegalMove) -> MoveStatus:
+        """Attempts the move as yielded by legal_moves, promoting if it has a promotion type
+
+        Args:
+            move (LegalMove): Origin, destination and promotion type
+
+        Returns:
+            MoveStatus: Move status
+        """
+        origin, destination, promotion = move
+        if promotion is None:
+            return self.attempt_move(origin, destination)
+        return self.attempt_promotion(origin, destination, promotion)
+
+    def undo_move(self) -> bool:
+        """Undoes the last move performed by this game, restoring the grid and game data
 
+        Returns:
+            bool: Whether there was a move to undo
+        """
+        if len(self._undo_stack) == 0:
+            return False
+
+        undo = self._undo_stack.pop()
+        for grid_undo in reversed(undo.grid_undos):
+            self.grid.unmake_move(grid_undo)
+        self.data.move_history.pop()
+        self.data.white_castle, self.data.black_castle = undo.white_castle, undo.black_castle
+        self.data.state = undo.state
+        self.turn_state = undo.turn_state
+        self.data.halfmove_clock = undo.halfmove_clock
         self.data.turn = opponent(self.data.turn)
-        return MoveStatus.PERFORMED
+        if self.data.turn == SideColor.BLACK:
+            self.data.fullmove_number -= 1
+        if self.journal is not None:
+            self.journal.record_undo(self.data)
+        return True
+
+    @contextmanager
+    def unjournaled(self) -> Iterator[ChessGame]:
+        """Context manager which stops recording the moves to the journal until exit, for
+        moves which are tried and undone, as in a search
+
+        Yields:
+            ChessGame: This game
+        """
+        journal, self.journal = self.journal, None
+        try:
+            yield self
+        finally:
+            self.journal = journal
+
+    def legal_moves(self) -> Iterator[LegalMove]:
+        """Yields the legal moves of the side to move, see ChessValidator.generate_legal_moves
+
+        Yields:
+            LegalMove: Origin, destination and promotion type, if the move is a promotion
+        """
+        if self.data.state != GameState.PENDING:
+            return iter(())
+
+        last_mov = self._get_last_move()
+        castling_state = self._get_castling_state()
+        context = (last_mov, self.turn_state, castling_state, self.grid_ctx())
+        return ChessValidator.generate_legal_moves(context, self.validation_cache)
+
+    def legal_moves_to(self, destination: Coord) -> Iterator[LegalMove]:
+        """Yields the legal moves of the side to move ending in the destination, see legal_moves
+
+        Args:
+            destination (Coord): Destination
+
+        Yields:
+            LegalMove: Origin, destination and promotion type, if the move is a promotion
+        """
+        if self.data.state != GameState.PENDING:
+            return iter(())
+
+        last_mov = self._get_last_move()
+        castling_state = self._get_castling_state()
+        context = (last_mov, self.turn_state, castling_state, self.grid_ctx())
+        return ChessValidator.generate_legal_moves_to(destination, context,
+                                                      self.validation_cache)
 
     def _is_valid_move(self, origin: Coord, destination: Coord) -> ValidationResult:
         if self.data.state != GameState.PENDING:
@@ -99,75 +279,170 @@ class ChessGame():
         last_mov = self._get_last_move()
         castling_state = self._get_castling_state()
         context = (last_mov, self.turn_state, castling_state, self.grid_ctx())
-        return ChessValidator.is_valid_move(origin, destination, context)
+        return ChessValidator.is_valid_move(origin, destination, context, self.validation_cache)
 
-    def _perform_move(self, context: tuple[Coord, Coord, Piece, OptPiece]) -> None:
+    def _perform_move(self, context: tuple[Coord, Coord, Piece, OptPiece]
+                      ) -> tuple[MoveUndo, ...]:
         origin, destination, o_piece, d_piece = context
         self.data.append_move(copy(o_piece), destination if d_piece is None else copy(d_piece))
-        self.grid.swap_pieces(origin, destination)
 
-    def _perform_castle(self, context: tuple[Coord, Coord, Piece, OptPiece]) -> None:
+        capture = None
+        is_diagonal = origin.column != destination.column
+        if o_piece.type == PieceType.PAWN and d_piece is None and is_diagonal:
+            capture = Coord(origin.row, destination.column)# En passant
+        return (self.grid.make_move(origin, destination, capture),)
+
+    def _perform_castle(self, context: tuple[Coord, Coord, Piece, OptPiece]
+                        ) -> tuple[MoveUndo, ...]:
         origin, destination, _, _ = context
-        self._perform_move(context)
+        king_undo, = self._perform_move(context)
         w_row, b_row = ChessValidator.white_initial_row, ChessValidator.black_initial_row
         row = w_row if self.data.turn == SideColor.WHITE else b_row
         direction = origin.get_dir_to(destination)
         if direction.column < 0:
-            self.grid.swap_pieces(Coord(row, 0), Coord(row, 3))
+            rook_undo = self.grid.make_move(Coord(row, 0), Coord(row, 3))
         else:
-            self.grid.swap_pieces(Coord(row, 7), Coord(row, 5))
+            rook_undo = self.grid.make_move(Coord(row, 7), Coord(row, 5))
+        return king_undo, rook_undo
 
-    def _set_castling(self, new_castling: CastlingState) -> None:
-        if self.data.turn == SideColor.WHITE:
+    def _set_castling(self, new_castling: CastlingState, color: SideColor) -> None:
+        if color == SideColor.WHITE:
             self.data.white_castle = new_castling
         else:
             self.data.black_castle = new_castling
 
-    def _perform_promotion(self, context: tuple[Coord, Coord, Piece, Piece]) -> None:
+    def _revoke_captured_castling(self, grid_undo: MoveUndo) -> None:
+        captured, coord = grid_undo.captured, grid_undo.capture_coord
+        if captured is None or captured.type != PieceType.ROOK:
+            return
+
+        w_row, b_row = ChessValidator.white_initial_row, ChessValidator.black_initial_row
+        is_white = captured.color == SideColor.WHITE
+        if coord.row != (w_row if is_white else b_row):
+            return
+        castle = self.data.white_castle if is_white else self.data.black_castle
+        if coord.column == 0:
+            self._set_castling(CastlingState(False, castle.right), captured.color)
+        elif coord.column == 7:
+            self._set_castling(CastlingState(castle.left, False), captured.color)
+
+    def _perform_promotion(self, context: tuple[Coord, Coord, Piece, Piece]
+                           ) -> tuple[MoveUndo, ...]:
         origin, destination, o_piece, prom_piece = context
         self.data.append_move(copy(o_piece), copy(prom_piece))
-        self.grid.set_at(origin, None)
-        self.grid.set_at(destination, prom_piece)
+        return (self.grid.make_move(origin, destination, promotion=prom_piece),)
+
+    def _get_undo_state(self) -> tuple[CastlingState, CastlingState, GameState, TurnState, int]:
+        return self.data.white_castle, self.data.black_castle, self.data.state, \
+            self.turn_state, self.data.halfmove_clock
+
+    def _next_turn(self, undo: GameUndo) -> None:
+        self._undo_stack.append(undo)
+        move_undo = undo.grid_undos[0]
+        self._revoke_captured_castling(move_undo)
+
+        if move_undo.piece.type == PieceType.PAWN or move_undo.captured is not None:
+            self.data.halfmove_clock = 0
+        else:
+            self.data.halfmove_clock += 1
+        if self.data.turn == SideColor.BLACK:
+            self.data.fullmove_number += 1
+
+        self.data.turn = opponent(self.data.turn)
+        if self._replaying:
+            self.turn_state = ChessValidator.get_check_state(self.grid_ctx())
+            return
+        self._set_turn_state()
+        self._check_for_endgame()
+        if self.journal is not None:
+            self.journal.record_move(self.data)
 
     def _set_turn_state(self) -> None:
         last_mov = self._get_last_move()
         castling_state = self._get_castling_state()
-        context = (last_mov, castling_state, self.opponent_grid_ctx())
+        context = (last_mov, castling_state, self.grid_ctx(), self.validation_cache)
         self.turn_state = ChessValidator.get_board_state(*context)
 
     def _check_for_endgame(self) -> None:
         if self.turn_state == TurnState.CHECKMATE:
             is_black_turn = self.data.turn == SideColor.BLACK
-            player_won = GameState.BLACK_WIN if is_black_turn else GameState.WHITE_WIN
+            player_won = GameState.WHITE_WIN if is_black_turn else GameState.BLACK_WIN
             self.data.state = player_won
 
         if self.turn_state == TurnState.STALEMATE:
             self.data.state = GameState.TIE
 
-    def _validate_history(self) -> tuple[bool, GridContext]:
-        grid = Grid.get_start_grid()
-        game_data = ChessGameData.get_new_data()
-        game_copy = ChessGame(grid, game_data, validate=False)
-        for mov in self.data.move_history:
-            origin = mov[0].coord
-            destination = mov[1] if isinstance(mov[1], Coord) else mov[1].coord
-            mov_status = game_copy.attempt_move(origin, destination)
-
-            if mov_status is MoveStatus.INVALID:
-                return False, game_copy.grid_ctx()
-            if mov_status == MoveStatus.REQUIRE_PROMOTION:
-                dest = cast(Piece, mov[1])
-                prom_status = game_copy.attempt_promotion(origin, destination, dest.type)
-                if prom_status != MoveStatus.PERFORMED:
-                    return False, game_copy.grid_ctx()
-
-        return True, game_copy.grid_ctx()
+    def _validate_history(self) -> tuple[int | None, GridContext]:
+        game_copy = ChessGame.get_start_game(self.data, self.backend)
+        # The replay ends in this game's position, so it warms this game's cache
+        game_copy.validation_cache = self.validation_cache
+        illegal_ply = game_copy.replay_moves(self.data.move_history)
+        return illegal_ply, game_copy.grid_ctx()
+
+    def replay_moves(self, move_history: list[Movement]) -> int | None:
+        """Performs the moves of the history without recording them to the journal, checking
+        the game's end once after the last one
+
+        Args:
+            move_history (list[Movement]): Moves, as recorded by ChessGame
+
+        Returns:
+            int | None: Ply of the first illegal move, None if all were performed
+        """
+        self._replaying = True
+        try:
+            for ply, mov in enumerate(move_history):
+                if not self._replay_move(mov):
+                    return ply
+            return None
+        finally:
+            self._replaying = False
+            self._set_turn_state()
+            self._check_for_endgame()
+
+    def _replay_move(self, mov: Movement) -> bool:
+        o_piece, dest = mov
+        origin = o_piece.coord
+        destination = dest if isinstance(dest, Coord) else dest.coord
+        if not Grid.in_bounds(origin) or not Grid.in_bounds(destination):
+            return False
+        if self.grid.get_at(origin) != o_piece:
+            return False
+
+        mov_status = self.attempt_move(origin, destination)
+        if mov_status is MoveStatus.REQUIRE_PROMOTION:
+            if isinstance(dest, Coord):
+                return False
+            mov_status = self.attempt_promotion(origin, destination, dest.type)
+        return mov_status is MoveStatus.PERFORMED
 
     def _validate_grid(self, mov_grid_ctx: GridContext) -> bool:
         return mov_grid_ctx[0] == self.data.turn and mov_grid_ctx[1] == self.grid
 
     def _get_last_move(self) -> OptMovement:
-        return self.data.move_history[-1] if len(self.data.move_history) > 0 else None
+        if len(self.data.move_history) > 0:
+            return self.data.move_history[-1]
+        if self.data.en_passant_column is None:
+            return None
+        # The double pawn move of the start position's en passant, which precedes the history
+        pawn_color = opponent(self.data.turn)
+        if pawn_color == SideColor.WHITE:
+            origin = Coord(ChessValidator.white_pawn_initial_row, self.data.en_passant_column)
+            mov_dir = WHITE_MOV_DIR
+        else:
+            origin = Coord(ChessValidator.black_pawn_initial_row, self.data.en_passant_column)
+            mov_dir = BLACK_MOV_DIR
+        pawn = Piece(PieceType.PAWN, pawn_color, origin)
+        return (pawn, origin.to_dir(Dir(mov_dir, 0), 2))
+
+    def _get_en_passant_column(self) -> int | None:
+        last_mov = self._get_last_move()
+        if last_mov is None:
+            return None
+        l_piece, l_dest = last_mov
+        if l_piece.type != PieceType.PAWN or not isinstance(l_dest, Coord):
+            return None
+        return l_dest.column if abs(l_dest.row - l_piece.coord.row) == 2 else None
 
     def _get_castling_state(self) -> CastlingState:
         w_castle, b_castle = self.data.white_castle, self.data.black_castle
@@ -184,21 +459,198 @@ class ChessGame():
         return (opponent(self.data.turn), self.grid)
 
     @classmethod
-    def new_game(cls) -> ChessGame:
+    def new_game(cls, backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
         """Returns a ChessGame from start
 
+        Args:
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
         Returns:
             ChessGame: ChessGame
         """
         grid = Grid.get_start_grid()
         game_data = ChessGameData.get_new_data()
-        return ChessGame(grid, game_data)
+        return ChessGame(grid, game_data, backend=backend)
+
+    @classmethod
+    def from_fen(cls, fen: str, backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
+        """Returns a ChessGame from the position of a FEN string, without move history
+        validation, the position is recorded as the start of the history unless it's the
+        standard start, the move counters are optional, defaulting to 0 and 1
+
+        Args:
+            fen (str): FEN string
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+        Returns:
+            ChessGame: ChessGame
+        """
+        fields = fen.split()
+        if len(fields) not in (4, 6):
+            raise InvalidChessGameError(f"Invalid FEN {fen}")
+        placement, turn_str, castling, en_passant = fields[:4]
+        if castling != FEN_EMPTY_FIELD and (len(set(castling)) != len(castling) or
+                                            not set(castling) <= set(FEN_CASTLING)):
+            raise InvalidChessGameError(f"Invalid FEN castling {castling}")
+
+        try:
+            turn = cast(SideColor, SideColor[turn_str])
+            en_passant_column = cls._get_fen_en_passant_column(en_passant, turn)
+            grid = Grid.from_fen(placement)
+            halfmove_clock, fullmove_number = (int(f) for f in fields[4:]) if len(fields) == 6 \
+                else (0, 1)
+        except (EnumParseError, GridInvalidCoordError, InvalidGridError, ValueError) as e:
+            raise InvalidChessGameError(f"Invalid FEN {fen}") from e
+        if halfmove_clock < 0 or fullmove_number < 1:
+            raise InvalidChessGameError(f"Invalid FEN move counters {fen}")
+
+        game_data = ChessGameData(
+            GameState.PENDING,
+            turn,
+            CastlingState(FEN_CASTLING[1] in castling, FEN_CASTLING[0] in castling),
+            CastlingState(FEN_CASTLING[3] in castling, FEN_CASTLING[2] in castling),
+            [],
+            halfmove_clock,
+            fullmove_number,
+            en_passant_column=en_passant_column
+            )
+        return cls._start_from_position(grid, game_data, backend)
 
     @classmethod
-    def load_game(cls, grid: Grid, game_data: ChessGameData) -> ChessGame:
+    def decode_position(cls, encoding: bytes,
+                        backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
+        """Returns a ChessGame from the position of encode_position, without move history
+        validation, the position is recorded as the start of the history unless it's the
+        standard start
+
+        Args:
+            encoding (bytes): Position encoding
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+        Returns:
+            ChessGame: ChessGame
+        """
+        if len(encoding) != POSITION_BYTES:
+            raise InvalidChessGameError("Invalid position encoding length")
+        turn_code, castling, en_passant = encoding[-3:]
+        turns = [turn for turn, code in POSITION_TURN_CODES.items() if code == turn_code]
+        if len(turns) != 1:
+            raise InvalidChessGameError("Invalid position encoding turn")
+
+        try:
+            grid = Grid.decode(encoding[:-3])
+        except InvalidGridError as e:
+            raise InvalidChessGameError("Invalid position encoding grid") from e
+        en_passant_column = None
+        if en_passant != NULL_EN_PASSANT_CODE:
+            if en_passant >= L_COLUMNS:
+                raise InvalidChessGameError("Invalid position encoding en passant")
+            en_passant_column = en_passant
+
+        flags = [bool(castling >> i & 1) for i in range(4)]
+        game_data = ChessGameData(
+            GameState.PENDING,
+            turns[0],
+            CastlingState(flags[0], flags[1]),
+            CastlingState(flags[2], flags[3]),
+            [],
+            en_passant_column=en_passant_column
+            )
+        return cls._start_from_position(grid, game_data, backend)
+
+    @classmethod
+    def _start_from_position(cls, grid: Grid, game_data: ChessGameData,
+                             backend: BoardBackend) -> ChessGame:
+        game = ChessGame(grid, game_data, validate=False, backend=backend)
+        fen = game.to_fen()
+        game_data.start_fen = None if fen == START_FEN else fen
+        return game
+
+    @classmethod
+    def _get_fen_en_passant_column(cls, en_passant: str, turn: SideColor) -> int | None:
+        if en_passant == FEN_EMPTY_FIELD:
+            return None
+        target = Grid.coord_from_str(en_passant)
+        if target.row != cls._get_en_passant_row(turn):
+            raise InvalidChessGameError(f"Invalid FEN en passant {en_passant}")
+        return target.column
+
+    @staticmethod
+    def _get_en_passant_row(turn: SideColor) -> int:
+        # The pawn of the side not to move passed through the target
+        if turn == SideColor.BLACK:
+            return ChessValidator.white_pawn_initial_row + WHITE_MOV_DIR
+        return ChessValidator.black_pawn_initial_row + BLACK_MOV_DIR
+
+    @classmethod
+    def get_start_game(cls, game_data: ChessGameData,
+                       backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
+        """Returns the ChessGame of the position the data's move history starts from, without
+        move history
+
+        Args:
+            game_data (ChessGameData): Game data
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+        Returns:
+            ChessGame: ChessGame
+        """
+        if game_data.start_fen is None:
+            return ChessGame(Grid.get_start_grid(), ChessGameData.get_new_data(),
+                             validate=False, backend=backend)
+        return ChessGame.from_fen(game_data.start_fen, backend)
+
+    @classmethod
+    def replay(cls, game_data: ChessGameData,
+               backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
+        """Returns the ChessGame reached by replaying the data's move history from its start
+        position, the rest of the data isn't used
+
+        Args:
+            game_data (ChessGameData): Game data
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+        Returns:
+            ChessGame: ChessGame
+        """
+        game = ChessGame.get_start_game(game_data, backend)
+        illegal_ply = game.replay_moves(game_data.load_move_history())
+        if illegal_ply is not None:
+            raise InvalidMoveHistoryError(illegal_ply)
+        return game
+
+    @classmethod
+    def recover(cls, journal: GameJournal,
+                backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
+        """Returns the ChessGame of the journal's snapshot with the journal's moves replayed,
+        which are compacted into a new snapshot, the game keeps recording to the journal
+
+        Args:
+            journal (GameJournal): Journal
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+        Returns:
+            ChessGame: ChessGame
+        """
+        game_data, status = journal.recover()
+        if game_data is None:
+            raise InvalidChessGameError(f"Invalid journal snapshot, {status.name}")
+        game = ChessGame.replay(game_data, backend)
+        game.journal = journal
+        journal.compact(game.data)
+        return game
+
+    @classmethod
+    def load_game(cls, grid: Grid, game_data: ChessGameData,
+                  backend: BoardBackend=BoardBackend.GRID) -> ChessGame:
         """Returns a ChessGame from the provided data
 
+        Args:
+            grid (Grid): Grid
+            game_data (ChessGameData): Game data
+            backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
         Returns:
             ChessGame: ChessGame
         """
-        return ChessGame(grid, game_data)
+        return ChessGame(grid, game_data, backend=backend)
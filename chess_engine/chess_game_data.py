@@ -2,21 +2,62 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, cast
+from dataclasses import dataclass, field, fields, replace
+from functools import partial
+from struct import Struct, error
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, cast
 
 from chess_engine.enums import GameState
-from chess_engine.piece import OptPiece, Piece, SerPiece, SideColor
+from chess_engine.grid import L_COLUMNS, L_ROWS, Grid
+from chess_engine.piece import (NULL_PIECE_CODE, PIECE_CODES, TYPE_CODES,
+                                OptPiece, Piece, PieceType, SerPiece, SideColor)
 from chess_engine.structs import CastlingState, Coord
-from serialization.serializable import Serializable
+from game_logic.consts import AssetType
+from serialization.enums import SaveCompression, SaveEncoding
+from serialization.file_format import COMPRESSION_EXTENSIONS, FileFormat
+from serialization.serializable import BinarySerializable
+from serialization.serializer import FILE_EXTENSIONS, Serializer
+from utils.errors import InvalidGridError
 
 Movement = tuple[Piece, Piece | Coord]
 OptMovement = Movement | None
 SerMovement = tuple[SerPiece, SerPiece | tuple[int,int]]
 
+# Binary encoding, a header with the magic, version, state, turn, castling flags, move counters
+# and move count, followed by a 2 byte code per move
+BINARY_MAGIC = b"CGD"
+BINARY_VERSION = 2
+# Followed by the start FEN, of the header's length, and the move codes
+BINARY_HEADER = Struct("<3sBBBBHHIBH")
+BINARY_FEN_ENCODING = "ascii"
+NULL_EN_PASSANT_CODE = 0xFF
+BINARY_MOVE = Struct("<H")
+STATE_CODES = {state: i for i, state in enumerate(GameState)}
+TURN_CODES = {SideColor.WHITE : 0, SideColor.BLACK : 1}
+_CODE_STATES = {code: state for state, code in STATE_CODES.items()}
+_CODE_TURNS = {code: turn for turn, code in TURN_CODES.items()}
+_CODE_TYPES = {code: piece_type for piece_type, code in TYPE_CODES.items()}
+_SQUARE_BITS = 6
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+
+class LazyHistory(NamedTuple):
+    """Move history of a lazy game data, until it's built
+
+    Attributes:
+        source (Callable[[], Iterator[Movement]]): Iterates the movements of the history.
+        plies (int): Length of the history.
+    """
+
+    source: Callable[[], Iterator[Movement]]
+    plies: int
+
 @dataclass
-class ChessGameData(Serializable):
+class ChessGameData(BinarySerializable):
     """TODO
+
+    Game datas deserialized lazily hold the header fields and an empty move history, which is
+    built by load_move_history, or by the ChessGame of the data, see get_from_deserialize. They
+    compare equal to the eagerly deserialized ones
     """
 
     state: GameState
@@ -24,11 +65,69 @@ class ChessGameData(Serializable):
     white_castle: CastlingState
     black_castle: CastlingState
     move_history: list[Movement]
+    # Plies since the last capture or pawn move, and moves since the start, counting from 1
+    halfmove_clock: int = 0
+    fullmove_number: int = 1
+    # FEN of the position the move history starts from, the standard start if None, and the en
+    # passant column of that position, as the move enabling it precedes the history
+    start_fen: str | None = None
+    en_passant_column: int | None = None
+    # Source of the move history of a lazy game data, None once it's built
+    lazy_history: LazyHistory | None = field(default=None, compare=False, repr=False)
+
+    def __eq__(self, other: object) -> bool:
+        # A lazy history compares as the history it builds, without building it
+        if not isinstance(other, ChessGameData):
+            return NotImplemented
+        return self._get_compared_fields() == other._get_compared_fields()
+
+    def _get_compared_fields(self) -> tuple[Any, ...]:
+        return tuple(list(self.iter_moves()) if attr.name == "move_history" else
+                     getattr(self, attr.name) for attr in fields(self) if attr.compare)
+
+    def is_lazy(self) -> bool:
+        """Whether the move history wasn't built yet
+
+        Returns:
+            bool: Whether is lazy
+        """
+        return self.lazy_history is not None
+
+    def load_move_history(self) -> list[Movement]:
+        """Builds the move history of a lazy game data, invalid movements raising ValueError
+
+        Returns:
+            list[Movement]: Move history
+        """
+        if self.lazy_history is not None:
+            self.move_history = list(self.lazy_history.source())
+            self.lazy_history = None
+        return self.move_history
+
+    def get_plies(self) -> int:
+        """Length of the move history, without building a lazy one
+
+        Returns:
+            int: Plies
+        """
+        if self.lazy_history is not None:
+            return self.lazy_history.plies
+        return len(self.move_history)
+
+    def iter_moves(self) -> Iterator[Movement]:
+        """Iterates the move history, without building a lazy one
+
+        Returns:
+            Iterator[Movement]: Movements
+        """
+        if self.lazy_history is not None:
+            return self.lazy_history.source()
+        return iter(self.move_history)
 
     def append_move(self, piece: Piece, destination: Piece | Coord) -> None:
         """TODO
         """
-        self.move_history.append((piece, destination))
+        self.load_move_history().append((piece, destination))
 
     @staticmethod
     def get_new_data() -> ChessGameData:
@@ -42,7 +141,7 @@ class ChessGameData(Serializable):
             )
 
     def get_serialization_attrs(self) -> dict[str, Any]:
-        def serializable_move_history(move_history: list[Movement]) -> list[SerMovement]:
+        def serializable_move_history(move_history: Iterable[Movement]) -> list[SerMovement]:
             ser_move_history: list[SerMovement] = []
             for piece, dest in move_history:
                 ser_dest = dest.to_tupple() if isinstance(dest, Coord) else Piece.serialize(dest)
@@ -56,35 +155,272 @@ class ChessGameData(Serializable):
             "whiteCastle_r" : self.white_castle.right,
             "blackCastle_l" : self.black_castle.left,
             "blackCastle_r" : self.black_castle.right,
-            "moveHistory"   : serializable_move_history(self.move_history)
+            "moveHistory"   : serializable_move_history(self.iter_moves()),
+            "halfmoveClock" : self.halfmove_clock,
+            "fullmoveNumber": self.fullmove_number,
+            "startFen"      : self.start_fen,
+            "enPassantColumn": self.en_passant_column
         }
 
+    def get_save_metadata(self) -> dict[str, Any]:
+        return {
+            "gameStatus": self.state.value,
+            "turn"      : self.turn.value,
+            "plies"     : self.get_plies()
+        }
+
+    def get_snapshot(self) -> ChessGameData:
+        # Moves are recorded with copies of their pieces which aren't modified afterwards, so
+        # copying the history list is enough, a lazy one isn't modified before it's built
+        return replace(self, move_history=list(self.move_history))
+
     @classmethod
     def get_from_deserialize(cls, attrs: dict[str, Any], **kwargs: Any) -> ChessGameData:
         """TODO
-        """
-        def _parse_move_history(ser_move_history: list[SerMovement]) -> list[Movement]:
-            def get_dest(ser_dest: SerPiece | tuple[int,int]) -> OptPiece | Coord:
-                match ser_dest:
-                    case (_, (_, _)):
-                        return Piece.deserialize(ser_dest)
-                    case (_, _):
-                        return Coord(*ser_dest)
-
-            move_history: list[Movement] = []
-            for ser_piece, ser_dest in ser_move_history:
-                piece = Piece.deserialize(ser_piece)
-                dest = get_dest(ser_dest)
-                if piece is None or dest is None:
-                    raise ValueError(f"Invalid piece {ser_piece} or destination \
-                                     {ser_dest} in GameData deserialization")
-                move_history.append((piece, dest))
-            return move_history
 
-        return ChessGameData(
+        Args:
+            attrs (dict[str, Any]): Deserialized data
+            **kwargs (Any): lazy (bool), whether to build the move history on first access,
+                invalid movements raising ValueError then
+
+        Returns:
+            ChessGameData: Game data
+        """
+        ser_move_history: list[SerMovement] = attrs["moveHistory"]
+        game_data = ChessGameData(
             cast(GameState, GameState[attrs["gameStatus"]]),
             cast(SideColor, SideColor[attrs["turn"]]),
             CastlingState(attrs["whiteCastle_l"],attrs["whiteCastle_r"]),
             CastlingState(attrs["blackCastle_l"],attrs["blackCastle_r"]),
-            _parse_move_history(attrs["moveHistory"])
+            [],
+            # Saves previous to the move counters don't have them
+            attrs.get("halfmoveClock", 0),
+            attrs.get("fullmoveNumber", 1),
+            # Saves previous to the start position start from the standard start
+            attrs.get("startFen"),
+            attrs.get("enPassantColumn")
             )
+        if kwargs.get("lazy", False):
+            game_data.lazy_history = LazyHistory(
+                partial(_iter_deserialized_movements, ser_move_history), len(ser_move_history))
+        else:
+            game_data.move_history = list(_iter_deserialized_movements(ser_move_history))
+        return game_data
+
+    def get_serialization_bytes(self) -> bytes:
+        castling = 0
+        flags = (*self.white_castle, *self.black_castle)
+        for i, flag in enumerate(flags):
+            castling |= flag << i
+        en_passant = NULL_EN_PASSANT_CODE if self.en_passant_column is None else \
+            self.en_passant_column
+        start_fen = b"" if self.start_fen is None else \
+            self.start_fen.encode(BINARY_FEN_ENCODING)
+        header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, STATE_CODES[self.state],
+                                    TURN_CODES[self.turn], castling, self.halfmove_clock,
+                                    self.fullmove_number, self.get_plies(), en_passant,
+                                    len(start_fen))
+        codes = b"".join(BINARY_MOVE.pack(ChessGameData.encode_movement(mov))
+                         for mov in self.iter_moves())
+        return header + start_fen + codes
+
+    @classmethod
+    def get_from_bytes(cls, data: bytes, **kwargs: Any) -> ChessGameData:
+        """Constructs the game data from its binary encoding, the move history is rebuilt by
+        replaying the move codes from the start position, see get_serialization_bytes
+
+        Args:
+            data (bytes): Binary encoding
+            **kwargs (Any): lazy (bool), whether to build the move history on first access,
+                invalid movements raising ValueError then
+
+        Returns:
+            ChessGameData: Game data
+        """
+        header, start_fen = _unpack_binary_header(data)
+        flags = [bool(header.castling >> i & 1) for i in range(4)]
+        game_data = ChessGameData(
+            _CODE_STATES[header.state],
+            _CODE_TURNS[header.turn],
+            CastlingState(*flags[:2]),
+            CastlingState(*flags[2:]),
+            [],
+            header.halfmove_clock,
+            header.fullmove_number,
+            start_fen,
+            None if header.en_passant == NULL_EN_PASSANT_CODE else header.en_passant
+            )
+        codes_start = BINARY_HEADER.size + header.fen_size
+        history_source = partial(_iter_binary_movements, bytes(data[codes_start:]), start_fen)
+        if kwargs.get("lazy", False):
+            game_data.lazy_history = LazyHistory(history_source, header.moves_count)
+        else:
+            game_data.move_history = list(history_source())
+        return game_data
+
+    @staticmethod
+    def encode_movement(mov: Movement) -> int:
+        """Integer code of the movement, the origin and destination squares and the promotion
+        type code
+
+        Args:
+            mov (Movement): Movement
+
+        Returns:
+            int: Code, fits in 16 bits
+        """
+        piece, dest = mov
+        dest_coord = dest if isinstance(dest, Coord) else dest.coord
+        # A piece destination is the captured piece, or the promoted one on the last rows
+        is_promotion = piece.type == PieceType.PAWN and isinstance(dest, Piece) and \
+            dest_coord.row in (0, L_ROWS - 1)
+        promotion_code = TYPE_CODES[cast(Piece, dest).type] if is_promotion else 0
+        return piece.coord.square | dest_coord.square << _SQUARE_BITS | \
+            promotion_code << 2 * _SQUARE_BITS
+
+    @staticmethod
+    def decode_movements(codes: Iterable[int], start_fen: str | None = None) -> list[Movement]:
+        """Move history of the movement codes, replaying them from the start position as
+        ChessGame records them, without validating them, see encode_movement
+
+        Args:
+            codes (Iterable[int]): Movement codes
+            start_fen (str | None, optional): FEN of the start position, the standard start if
+                None. Defaults to None.
+
+        Returns:
+            list[Movement]: Move history
+        """
+        return list(ChessGameData.iter_decoded_movements(codes, start_fen))
+
+    @staticmethod
+    def iter_decoded_movements(codes: Iterable[int],
+                               start_fen: str | None = None) -> Iterator[Movement]:
+        """Iterates the movements of the codes as they are decoded, see decode_movements
+
+        Args:
+            codes (Iterable[int]): Movement codes
+            start_fen (str | None, optional): FEN of the start position, the standard start if
+                None. Defaults to None.
+
+        Raises:
+            ValueError: If a code or the start FEN's placement is invalid
+
+        Yields:
+            Movement: Movement
+        """
+        try:
+            start_grid = Grid.get_start_grid() if start_fen is None else \
+                Grid.from_fen(start_fen.split()[0])
+        except (InvalidGridError, IndexError) as e:
+            raise ValueError(f"Invalid start FEN {start_fen}") from e
+        board = bytearray(start_grid.encode())
+        for code in codes:
+            mov, piece_code = _decode_movement(board, code)
+            _make_movement_code(board, code, piece_code, mov[0].type)
+            yield mov
+
+def get_serializer(encoding: SaveEncoding,
+                   compression: SaveCompression = SaveCompression.NONE,
+                   max_saves_count: int = 0) -> Serializer[ChessGameData]:
+    """Game data serializer of the encoding
+
+    Args:
+        encoding (SaveEncoding): Encoding
+        compression (SaveCompression, optional): Compression. Defaults to SaveCompression.NONE.
+        max_saves_count (int, optional): Maximum saves per directory, unlimited if 0.
+            Defaults to 0.
+
+    Returns:
+        Serializer[ChessGameData]: Serializer
+    """
+    file_end = f".{FILE_EXTENSIONS[encoding]}"
+    if compression is not SaveCompression.NONE:
+        file_end += f".{COMPRESSION_EXTENSIONS[compression]}"
+    file_format = FileFormat(file_end, "game_", AssetType.SAVINGS, encoding)
+    return Serializer(file_format, ChessGameData.get_from_deserialize, max_saves_count,
+                      binary_constructor=ChessGameData.get_from_bytes)
+
+class _BinaryHeader(NamedTuple):
+    # Fields of BINARY_HEADER
+    magic: bytes
+    version: int
+    state: int
+    turn: int
+    castling: int
+    halfmove_clock: int
+    fullmove_number: int
+    moves_count: int
+    en_passant: int
+    fen_size: int
+
+def _unpack_binary_header(data: bytes) -> tuple[_BinaryHeader, str | None]:
+    # Validated header of the binary encoding and its start FEN
+    try:
+        header = _BinaryHeader._make(BINARY_HEADER.unpack_from(data))
+    except error as e:
+        raise ValueError("Invalid game data header") from e
+    if header.magic != BINARY_MAGIC or header.version != BINARY_VERSION:
+        raise ValueError("Invalid game data magic or version")
+    codes_start = BINARY_HEADER.size + header.fen_size
+    if len(data) != codes_start + header.moves_count * BINARY_MOVE.size or \
+        header.state not in _CODE_STATES or header.turn not in _CODE_TURNS or \
+        (header.en_passant != NULL_EN_PASSANT_CODE and header.en_passant >= L_COLUMNS):
+        raise ValueError("Invalid game data encoding")
+    # Raises UnicodeDecodeError, a ValueError, if not ascii
+    start_fen = bytes(data[BINARY_HEADER.size:codes_start]).decode(BINARY_FEN_ENCODING) \
+        if header.fen_size > 0 else None
+    return header, start_fen
+
+def _decode_movement(board: bytearray, code: int) -> tuple[Movement, int]:
+    # Movement of the code on the board before it's made, and the code of the moved piece
+    origin, dest = code & _SQUARE_MASK, code >> _SQUARE_BITS & _SQUARE_MASK
+    promotion_code = code >> 2 * _SQUARE_BITS
+    piece_code = board[origin]
+    if piece_code == NULL_PIECE_CODE or origin == dest or \
+        (promotion_code != 0 and promotion_code not in _CODE_TYPES):
+        raise ValueError(f"Invalid move code {code}")
+
+    piece = cast(Piece, Piece.decode(piece_code, Coord.from_square(origin)))
+    dest_coord = Coord.from_square(dest)
+    if promotion_code != 0:
+        piece_code = PIECE_CODES[(_CODE_TYPES[promotion_code], piece.color)]
+        return (piece, cast(Piece, Piece.decode(piece_code, dest_coord))), piece_code
+    return (piece, Piece.decode(board[dest], dest_coord) or dest_coord), piece_code
+
+def _make_movement_code(board: bytearray, code: int, piece_code: int,
+                        piece_type: PieceType) -> None:
+    # Makes the movement of the code on the board, with the en passant capture or castling
+    origin, dest = code & _SQUARE_MASK, code >> _SQUARE_BITS & _SQUARE_MASK
+    d_piece_code = board[dest]
+    board[origin], board[dest] = NULL_PIECE_CODE, piece_code
+    o_row, o_column = divmod(origin, L_COLUMNS)
+    d_column = dest % L_COLUMNS
+    is_diagonal = o_column != d_column
+    if piece_type == PieceType.PAWN and d_piece_code == NULL_PIECE_CODE and is_diagonal:
+        board[o_row * L_COLUMNS + d_column] = NULL_PIECE_CODE# En passant
+    if piece_type == PieceType.KING and abs(d_column - o_column) == 2:
+        rook_column, rook_dest_column = (0, 3) if d_column < o_column else (7, 5)
+        rook, rook_dest = o_row * L_COLUMNS + rook_column, o_row * L_COLUMNS + \
+            rook_dest_column
+        board[rook], board[rook_dest] = NULL_PIECE_CODE, board[rook]
+
+def _iter_deserialized_movements(ser_move_history: list[SerMovement]) -> Iterator[Movement]:
+    def get_dest(ser_dest: SerPiece | tuple[int,int]) -> OptPiece | Coord:
+        match ser_dest:
+            case (_, (_, _)):
+                return Piece.deserialize(ser_dest)
+            case (_, _):
+                return Coord(*ser_dest)
+
+    for ser_piece, ser_dest in ser_move_history:
+        piece = Piece.deserialize(ser_piece)
+        dest = get_dest(ser_dest)
+        if piece is None or dest is None:
+            raise ValueError(f"Invalid piece {ser_piece} or destination \
+                             {ser_dest} in GameData deserialization")
+        yield piece, dest
+
+def _iter_binary_movements(codes: bytes, start_fen: str | None) -> Iterator[Movement]:
+    return ChessGameData.iter_decoded_movements(
+        (code for code, in BINARY_MOVE.iter_unpack(codes)), start_fen)
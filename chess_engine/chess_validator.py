@@ -2,20 +2,22 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import cast
+from typing import Iterator, cast
 
 from chess_engine.chess_game_data import Movement, OptMovement
 from chess_engine.enums import MoveStatus, TurnState, ValidationStatus
-from chess_engine.grid import COLUMNS, ROWS, Grid
-from chess_engine.piece import (MovSpecialCase, OptPiece, Piece, PieceType,
-                                SideColor)
-from chess_engine.structs import CastlingState, Coord, Dir
+from chess_engine.grid import Grid
+from chess_engine.move_tables import get_path, get_rays, get_target
+from chess_engine.piece import MovSpecialCase, Piece, PieceType, SideColor
+from chess_engine.structs import CastlingState, Coord
+from chess_engine.validation_cache import ValidationCache
+from chess_engine.zobrist import BLACK_TURN_KEY
 from utils.errors import StaticClassInstanceError
 from utils.utils import opponent
 
 GridContext = tuple[SideColor, Grid]
 ValidationResult = tuple[MoveStatus | None, CastlingState | None, bool]
+LegalMove = tuple[Coord, Coord, PieceType | None]
 class ChessValidator:
     """TODO
     """
@@ -28,31 +30,28 @@ class ChessValidator:
         PieceType.QUEEN : 1,
         PieceType.KING : 1
     }
-    white_initial_row = 1
-    white_pawn_initial_row = 2
-    black_initial_row = 8
-    black_pawn_initial_row = 7
+    promotion_types = (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGTH)
+    white_initial_row = 7
+    white_pawn_initial_row = 6
+    black_initial_row = 0
+    black_pawn_initial_row = 1
+    king_initial_column = 4
 
-    _cached_grid_ctx: GridContext
-    _cached_movements: dict[tuple[Coord, Coord], ValidationStatus] = {}
+    shared_cache = ValidationCache()
 
     @classmethod
-    def clean_cache(cls, new_grid_ctx: GridContext) -> None:
-        """TODO
-        """
-        cls._cached_grid_ctx = new_grid_ctx
-        cls._cached_movements = {}
+    def get_ctx_key(cls, grid_ctx: GridContext) -> int:
+        """Zobrist key of the grid context, the piece placement and side to move
 
-    @classmethod
-    def _access_cache(cls, mov: tuple[Coord, Coord],
-                      grid_ctx: GridContext) -> ValidationStatus | None:
-        if cls._cached_grid_ctx == grid_ctx:
-            return cls._cached_movements[mov]
-        return None
+        Args:
+            grid_ctx (GridContext): Grid context
 
-    @classmethod
-    def _save_to_cache(cls, mov: tuple[Coord, Coord], status: ValidationStatus) -> None:
-        cls._cached_movements[mov] = status
+        Returns:
+            int: Key
+        """
+        turn, grid = grid_ctx
+        key = grid.zobrist_key
+        return key ^ BLACK_TURN_KEY if turn == SideColor.BLACK else key
 
     @classmethod
     def is_valid_initial_grid(cls) -> bool:
@@ -61,18 +60,18 @@ class ChessValidator:
         grid = Grid.get_start_grid()
 
         white_pieces = {piece_type: 0 for piece_type in PieceType}
-        for piece in grid.white_pieces:
+        for piece in grid.get_pieces(SideColor.WHITE):
             white_pieces[piece.type] += 1
-            if piece.type == PieceType.PAWN and piece.coord.column != cls.white_pawn_initial_row:
+            if piece.type == PieceType.PAWN and piece.coord.row != cls.white_pawn_initial_row:
                 return False
-            if piece.type != PieceType.PAWN and piece.coord.column != cls.white_initial_row:
+            if piece.type != PieceType.PAWN and piece.coord.row != cls.white_initial_row:
                 return False
         black_pieces = {piece_type: 0 for piece_type in PieceType}
-        for piece in grid.black_pieces:
+        for piece in grid.get_pieces(SideColor.BLACK):
             black_pieces[piece.type] += 1
-            if piece.type == PieceType.PAWN and piece.coord.column != cls.black_pawn_initial_row:
+            if piece.type == PieceType.PAWN and piece.coord.row != cls.black_pawn_initial_row:
                 return False
-            if piece.type != PieceType.PAWN and piece.coord.column != cls.black_initial_row:
+            if piece.type != PieceType.PAWN and piece.coord.row != cls.black_initial_row:
                 return False
 
         for piece_type, ideal_count in cls.initial_piece_count.items():
@@ -88,15 +87,12 @@ class ChessValidator:
 
     @classmethod
     def is_valid_move(cls, origin: Coord, dest: Coord,
-                      context: tuple[OptMovement, TurnState, CastlingState, GridContext]
-                      ) -> ValidationResult:
+                      context: tuple[OptMovement, TurnState, CastlingState, GridContext],
+                      cache: ValidationCache | None = None) -> ValidationResult:
         """TODO
         """
         last_mov, turn_state, castling_state, grid_ctx = context
-        validation = cls._access_cache((origin, dest), grid_ctx)
-        if validation is None:
-            validation = cls._is_valid_move(origin, dest, grid_ctx)
-            cls._save_to_cache((origin, dest), validation)
+        validation = cls._get_cached_validation(origin, dest, grid_ctx, cache)
 
         validation_result: ValidationResult
         match validation:
@@ -123,6 +119,17 @@ class ChessValidator:
                 validation_result = (MoveStatus.REQUIRE_PROMOTION, None, True)
         return validation_result
 
+    @classmethod
+    def _get_cached_validation(cls, origin: Coord, dest: Coord, grid_ctx: GridContext,
+                               cache: ValidationCache | None) -> ValidationStatus:
+        cache = cls.shared_cache if cache is None else cache
+        ctx_key = cls.get_ctx_key(grid_ctx)
+        validation = cache.get(ctx_key, (origin, dest))
+        if validation is None:
+            validation = cls._is_valid_move(origin, dest, grid_ctx)
+            cache.save(ctx_key, (origin, dest), validation)
+        return validation
+
     @classmethod
     def _is_valid_move(cls, origin: Coord, dest: Coord, grid_ctx: GridContext) -> ValidationStatus:
         turn, grid = grid_ctx
@@ -134,34 +141,34 @@ class ChessValidator:
         if o_piece is None or o_piece.color != turn:
             return ValidationStatus.INVALID
 
-        direction = origin.get_dir_to(dest)
-        if o_piece.can_extend():
-            direction = direction.normalized()
+        target = get_target(o_piece, origin, dest)
+        if target is None:
+            return ValidationStatus.INVALID
 
         d_piece = grid.get_at(dest)
         if d_piece is not None and d_piece.color == o_piece.color:
             return ValidationStatus.INVALID
 
-        mov_case = o_piece.movements.get(direction, None)
-        if mov_case is None:
-            return ValidationStatus.INVALID
+        mov_case = target.mov_case
 
         if mov_case is MovSpecialCase.CASTLE:
             return ValidationStatus.NEED_CASTLING_STATE
 
         #pawn special cases
         if mov_case is MovSpecialCase.DOUBLE_PAWN_MOVE:
-            if not cls._has_clear_path(origin, dest, grid) or d_piece is not None:
+            if origin.row != cls._pawn_initial_row(o_piece.color):
+                return ValidationStatus.INVALID
+            if d_piece is not None:
                 return ValidationStatus.INVALID
         elif mov_case is MovSpecialCase.PAWN_ATTACK and d_piece is None: #possible en passant move
             return ValidationStatus.NEED_LAST_MOVE
         elif mov_case is MovSpecialCase.PAWN_MOVE and d_piece is not None:
             return ValidationStatus.INVALID
 
-        if o_piece.can_extend() and not cls._has_clear_path(origin, dest, grid):
+        if not cls._is_path_clear(target.path, grid):
             return ValidationStatus.INVALID
 
-        if cls._is_left_in_check((origin, dest, d_piece, grid_ctx)):
+        if cls._is_left_in_check((origin, dest, None, grid_ctx)):
             return ValidationStatus.INVALID
 
         # From here the move is valid
@@ -178,16 +185,25 @@ class ChessValidator:
         p_row = cls.black_initial_row if piece.color == SideColor.WHITE else cls.white_initial_row
         return piece.type == PieceType.PAWN and p_row == dest.row
 
+    @classmethod
+    def _initial_row(cls, color: SideColor) -> int:
+        return cls.white_initial_row if color == SideColor.WHITE else cls.black_initial_row
+
+    @classmethod
+    def _pawn_initial_row(cls, color: SideColor) -> int:
+        if color == SideColor.WHITE:
+            return cls.white_pawn_initial_row
+        return cls.black_pawn_initial_row
+
     @classmethod
     def _has_clear_path(cls, origin: Coord, dest: Coord, grid: Grid) -> bool:
-        _coord = origin
-        direction = origin.get_dir_to(dest).normalized()
-        _dest = dest.to_dir(direction, -1)
-        while _coord != _dest:
-            if grid.get_at(_coord) is not None:
-                return False
-            _coord = _coord.to_dir(direction)
+        return cls._is_path_clear(get_path(origin, dest), grid)
 
+    @classmethod
+    def _is_path_clear(cls, path: tuple[Coord, ...], grid: Grid) -> bool:
+        for coord in path:
+            if grid.get_at(coord) is not None:
+                return False
         return True
 
     @classmethod
@@ -198,14 +214,14 @@ class ChessValidator:
         l_piece, l_dest = last_mov
         if l_piece.type != PieceType.PAWN or not isinstance(l_dest, Coord):
             return False
-        l_piece_dir = l_piece.coord.get_dir_to(l_dest)
-        if l_piece.movements[l_piece_dir] != MovSpecialCase.DOUBLE_PAWN_MOVE:
+        l_target = get_target(l_piece, l_piece.coord, l_dest)
+        if l_target is None or l_target.mov_case is not MovSpecialCase.DOUBLE_PAWN_MOVE:
             return False
-        l_mov_dir = l_piece_dir.normalized().row
-        if l_dest.column != dest.column or l_dest.row-l_mov_dir != dest.row:
+        if dest not in l_target.path:
             return False
 
-        if cls._is_left_in_check((origin, dest, None, grid_ctx)):
+        capture = Coord(origin.row, dest.column)
+        if cls._is_left_in_check((origin, dest, capture, grid_ctx)):
             return False
         return True
 
@@ -214,26 +230,30 @@ class ChessValidator:
                          context: tuple[TurnState, CastlingState, GridContext]
                          ) -> tuple[bool, CastlingState | None]:
         turn_state, castling_state, grid_ctx = context
-        _, grid = grid_ctx
+        turn, grid = grid_ctx
         if turn_state != TurnState.MOVE_TURN:
             return False, None
+        if origin != Coord(cls._initial_row(turn), cls.king_initial_column):
+            return False, None
 
-        king_column_in_path = origin.get_dir_to(dest).normalized().column
-        is_left_dir = king_column_in_path < 0
+        is_left_dir = dest.column < origin.column
         if (is_left_dir and not castling_state.left) or \
             (not is_left_dir and not castling_state.right):
             return False, None
 
         rook_coord = Coord(origin.row, 0 if is_left_dir else 7)
         rook__dest_coord = Coord(origin.row, 3 if is_left_dir else 5)
+        rook = grid.get_at(rook_coord)
+        if rook is None or rook.type != PieceType.ROOK or rook.color != turn:
+            return False, None
         if not cls._has_clear_path(rook_coord, rook__dest_coord, grid):
             return False, None
         if not cls._has_clear_path(origin, dest, grid):
             return False, None
 
-        path_coord = Coord(origin.row, king_column_in_path)
-        if cls._is_coord_attacked(path_coord, grid_ctx):
-            return False, None
+        for path_coord in get_path(origin, dest):
+            if cls._is_coord_attacked(path_coord, grid_ctx):
+                return False, None
 
         if cls._is_left_in_check((origin, dest, None, grid_ctx)):
             return False, None
@@ -241,16 +261,15 @@ class ChessValidator:
         return True, CastlingState(False, False)
 
     @classmethod
-    def _is_left_in_check(cls, context: tuple[Coord, Coord, OptPiece, GridContext]) -> bool:
-        origin, dest, d_piece, grid_ctx = context
+    def _is_left_in_check(cls, context: tuple[Coord, Coord, Coord | None, GridContext]) -> bool:
+        origin, dest, capture, grid_ctx = context
         turn, grid = grid_ctx
-        grid_copy = deepcopy(grid)
-        if d_piece is not None:
-            grid_copy.set_at(dest, None)
-        grid_copy.swap_pieces(origin, dest)
-        pieces = grid_copy.white_pieces if turn == SideColor.WHITE else grid_copy.black_pieces
-        king = [p for p in pieces if p.type == PieceType.KING][0]
-        return cls._is_coord_attacked(king.coord, (turn, grid_copy))
+        undo = grid.make_move(origin, dest, capture)
+        try:
+            king = grid.get_king(turn)
+            return king is not None and cls._is_coord_attacked(king.coord, grid_ctx)
+        finally:
+            grid.unmake_move(undo)
 
     @classmethod
     def _get_castling_state(cls, origin: Coord, grid: Grid,
@@ -258,28 +277,22 @@ class ChessValidator:
         piece = cast(Piece, grid.get_at(origin))
         if piece.type == PieceType.KING:
             return CastlingState(False, False)
-        if piece.type == PieceType.ROOK:
-            rook_pos = origin.get_dir_to(Coord(0, 4)).column
-            if castling_state.left and rook_pos < 0:
+        if piece.type == PieceType.ROOK and origin.row == cls._initial_row(piece.color):
+            if castling_state.left and origin.column == 0:
                 return CastlingState(False, castling_state.right)
-            if castling_state.right and rook_pos > 0:
+            if castling_state.right and origin.column == 7:
                 return CastlingState(castling_state.left, False)
         return None
 
     @classmethod
     def get_board_state(cls, last_mov: OptMovement, castling_state: CastlingState,
-                        grid_ctx: GridContext) -> TurnState:
+                        grid_ctx: GridContext, cache: ValidationCache | None = None) -> TurnState:
         """TODO
         """
-        turn, grid = grid_ctx
-
-        pieces = grid.white_pieces if turn == SideColor.WHITE else grid.black_pieces
-        king = [p for p in pieces if p.type == PieceType.KING][0]
-        is_in_check = cls._is_coord_attacked(king.coord, grid_ctx)
-
-        temp_state = TurnState.CHECK if is_in_check else TurnState.MOVE_TURN
+        temp_state = cls.get_check_state(grid_ctx)
+        is_in_check = temp_state is TurnState.CHECK
         context = (last_mov, temp_state, castling_state, grid_ctx)
-        any_valid_move = any(cls._any_valid_move(context, p) for p in pieces)
+        any_valid_move = next(cls.generate_legal_moves(context, cache), None) is not None
 
         if not any_valid_move:
             if is_in_check:
@@ -287,44 +300,105 @@ class ChessValidator:
             return TurnState.STALEMATE
         return temp_state
 
+    @classmethod
+    def get_check_state(cls, grid_ctx: GridContext) -> TurnState:
+        """Turn state of the side to move without looking for terminal states, CHECK if the
+        king is attacked and MOVE_TURN otherwise
+
+        Args:
+            grid_ctx (GridContext): Grid context
+
+        Returns:
+            TurnState: Turn state
+        """
+        turn, grid = grid_ctx
+        king = grid.get_king(turn)
+        if king is not None and cls._is_coord_attacked(king.coord, grid_ctx):
+            return TurnState.CHECK
+        return TurnState.MOVE_TURN
+
     @classmethod
     def _is_coord_attacked(cls, coord: Coord, grid_ctx: GridContext) -> bool:
         turn, grid = grid_ctx
         attacker = opponent(turn)
-        attacker_pieces = grid.white_pieces if attacker == SideColor.WHITE else grid.black_pieces
-        return any(cls._attacks_coord(p, coord, grid_ctx) for p in attacker_pieces)
+        if grid.bitboards is not None:
+            return grid.bitboards.is_attacked(coord, attacker)
 
-    @classmethod
-    def _attacks_coord(cls, piece: Piece, coord: Coord, grid_ctx: GridContext) -> bool:
-        origin = piece.coord
-        validation = cls._is_valid_move(origin, coord, grid_ctx)
-        return validation in (ValidationStatus.VALID, ValidationStatus.CHECKS_KING)
+        return any(cls._attacks_coord(p, coord, grid) for p in grid.get_pieces(attacker))
 
     @classmethod
-    def _any_valid_move(cls, context: tuple[OptMovement,TurnState,CastlingState,GridContext],
-                        piece: Piece) -> bool:
-        origin = piece.coord
-        def extend_validation(direction: Dir) -> bool:
-            i = 1
-            dest = origin.to_dir(direction, i)
-            while 0 < dest.row < len(ROWS) and 0 < dest.column < len(COLUMNS):
-                validation, _, _ = cls.is_valid_move(origin, dest, context)
-                if validation in (None, MoveStatus.REQUIRE_PROMOTION):
-                    return True
-                i += 1
-                dest = origin.to_dir(direction, i)
+    def _attacks_coord(cls, piece: Piece, coord: Coord, grid: Grid) -> bool:
+        target = get_target(piece, piece.coord, coord)
+        if target is None or target.mov_case not in (MovSpecialCase.NONE,
+                                                     MovSpecialCase.PAWN_ATTACK):
             return False
+        return cls._is_path_clear(target.path, grid)
+
+    @classmethod
+    def generate_legal_moves(cls, context: tuple[OptMovement, TurnState, CastlingState,
+                                                 GridContext],
+                             cache: ValidationCache | None = None) -> Iterator[LegalMove]:
+        """Yields every legal move of the side to move, a promotion move is yielded once per
+        promotion type, the grid must not be modified while iterating
+
+        Args:
+            context (tuple[OptMovement, TurnState, CastlingState, GridContext]): Last move,
+                turn state, castling state of the side to move and grid context
+            cache (ValidationCache | None, optional): Validation cache, the shared one if None.
+                Defaults to None.
+
+        Yields:
+            LegalMove: Origin, destination and promotion type, if the move is a promotion
+        """
+        turn, grid = context[3]
+        for piece in tuple(grid.get_pieces(turn)):
+            for dest in cls._candidate_dests(piece, grid):
+                yield from cls._get_legal_moves(piece.coord, dest, context, cache)
 
-        def non_extend_validation(direction: Dir) -> bool:
-            dest = origin.to_dir(direction)
-            validation, _, _ = cls.is_valid_move(origin, dest, context)
-            return validation in (None, MoveStatus.REQUIRE_PROMOTION)
+    @classmethod
+    def generate_legal_moves_to(cls, dest: Coord,
+                                context: tuple[OptMovement, TurnState, CastlingState,
+                                               GridContext],
+                                cache: ValidationCache | None = None) -> Iterator[LegalMove]:
+        """Yields every legal move of the side to move ending in the destination, see
+        generate_legal_moves
+
+        Args:
+            dest (Coord): Destination
+            context (tuple[OptMovement, TurnState, CastlingState, GridContext]): Last move,
+                turn state, castling state of the side to move and grid context
+            cache (ValidationCache | None, optional): Validation cache, the shared one if None.
+                Defaults to None.
+
+        Yields:
+            LegalMove: Origin, destination and promotion type, if the move is a promotion
+        """
+        turn, grid = context[3]
+        for piece in tuple(grid.get_pieces(turn)):
+            if get_target(piece, piece.coord, dest) is not None:
+                yield from cls._get_legal_moves(piece.coord, dest, context, cache)
+
+    @classmethod
+    def _get_legal_moves(cls, origin: Coord, dest: Coord,
+                         context: tuple[OptMovement, TurnState, CastlingState, GridContext],
+                         cache: ValidationCache | None) -> Iterator[LegalMove]:
+        validation, _, _ = cls.is_valid_move(origin, dest, context, cache)
+        if validation is None:
+            yield origin, dest, None
+        elif validation is MoveStatus.REQUIRE_PROMOTION:
+            for piece_type in cls.promotion_types:
+                yield origin, dest, piece_type
 
-        validate_direction = extend_validation if piece.can_extend() else non_extend_validation
-        for possible_dir in piece.movements:
-            if validate_direction(possible_dir):
-                return True
-        return False
+    @classmethod
+    def _candidate_dests(cls, piece: Piece, grid: Grid) -> Iterator[Coord]:
+        for ray in get_rays(piece, piece.coord):
+            for dest in ray:
+                d_piece = grid.get_at(dest)
+                if d_piece is not None and d_piece.color == piece.color:
+                    break
+                yield dest
+                if d_piece is not None:
+                    break
 
     def __init__(self) -> None:
         raise StaticClassInstanceError(ChessValidator)
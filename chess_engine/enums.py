@@ -30,6 +30,25 @@ class MovSpecialCase(Enum):
     PAWN_ATTACK = auto()
     PAWN_MOVE = auto()
 
+class BoardBackend(Enum):
+    """Enum for the board representation answering attack queries
+    """
+    GRID = auto()
+    BITBOARD = auto()
+
+class CacheScope(Enum):
+    """Enum for the scope of a game's validation cache
+    """
+    SHARED = auto()
+    GAME = auto()
+
+class BoundType(Enum):
+    """Enum for how a searched score bounds the position's true score
+    """
+    EXACT = auto()
+    LOWER = auto()
+    UPPER = auto()
+
 class ValidationStatus(Enum):
     """TODO
     """
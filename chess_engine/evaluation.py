@@ -0,0 +1,116 @@
+"""This module contains the static evaluation tables, material plus piece-square tables, combined
+into a score per piece code and square"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from chess_engine.enums import PieceType, SideColor
+from chess_engine.piece import CODE_PIECES
+from chess_engine.structs import BOARD_SIZE
+
+if TYPE_CHECKING:
+    from chess_engine.grid import Grid
+
+# Centipawn values by piece type, the king's is only used for ordering captures
+PIECE_VALUES = {
+    PieceType.PAWN : 100,
+    PieceType.KNIGTH : 320,
+    PieceType.BISHOP : 330,
+    PieceType.ROOK : 500,
+    PieceType.QUEEN : 900,
+    PieceType.KING : 0
+}
+
+# Centipawn bonus by square for white pieces, rank 8 first, black pieces use the mirrored square
+PIECE_SQUARE_TABLES = {
+    PieceType.PAWN : [
+          0,   0,   0,   0,   0,   0,   0,   0,
+         50,  50,  50,  50,  50,  50,  50,  50,
+         10,  10,  20,  30,  30,  20,  10,  10,
+          5,   5,  10,  25,  25,  10,   5,   5,
+          0,   0,   0,  20,  20,   0,   0,   0,
+          5,  -5, -10,   0,   0, -10,  -5,   5,
+          5,  10,  10, -20, -20,  10,  10,   5,
+          0,   0,   0,   0,   0,   0,   0,   0,
+    ],
+    PieceType.KNIGTH : [
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20,   0,   0,   0,   0, -20, -40,
+        -30,   0,  10,  15,  15,  10,   0, -30,
+        -30,   5,  15,  20,  20,  15,   5, -30,
+        -30,   0,  15,  20,  20,  15,   0, -30,
+        -30,   5,  10,  15,  15,  10,   5, -30,
+        -40, -20,   0,   5,   5,   0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ],
+    PieceType.BISHOP : [
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,  10,  10,   5,   0, -10,
+        -10,   5,   5,  10,  10,   5,   5, -10,
+        -10,   0,  10,  10,  10,  10,   0, -10,
+        -10,  10,  10,  10,  10,  10,  10, -10,
+        -10,   5,   0,   0,   0,   0,   5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ],
+    PieceType.ROOK : [
+          0,   0,   0,   0,   0,   0,   0,   0,
+          5,  10,  10,  10,  10,  10,  10,   5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+         -5,   0,   0,   0,   0,   0,   0,  -5,
+          0,   0,   0,   5,   5,   0,   0,   0,
+    ],
+    PieceType.QUEEN : [
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+        -10,   0,   0,   0,   0,   0,   0, -10,
+        -10,   0,   5,   5,   5,   5,   0, -10,
+         -5,   0,   5,   5,   5,   5,   0,  -5,
+          0,   0,   5,   5,   5,   5,   0,  -5,
+        -10,   5,   5,   5,   5,   5,   0, -10,
+        -10,   0,   5,   0,   0,   0,   0, -10,
+        -20, -10, -10,  -5,  -5, -10, -10, -20,
+    ],
+    PieceType.KING : [
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+         20,  20,   0,   0,   0,   0,  20,  20,
+         20,  30,  10,   0,   0,  10,  30,  20,
+    ],
+}
+
+SQUARES = BOARD_SIZE * BOARD_SIZE
+# Piece codes are below this
+CODES_COUNT = 16
+
+def _get_square_scores(code: int) -> list[int]:
+    if code not in CODE_PIECES:
+        return [0] * SQUARES
+    piece_type, color = CODE_PIECES[code]
+    table = PIECE_SQUARE_TABLES[piece_type]
+    if color == SideColor.WHITE:
+        return [PIECE_VALUES[piece_type] + bonus for bonus in table]
+    # Mirroring the rows gives black's bonus
+    return [-PIECE_VALUES[piece_type] - table[square ^ (SQUARES - BOARD_SIZE)]
+            for square in range(SQUARES)]
+
+# White relative score by piece code and square, material plus piece-square bonus
+SQUARE_SCORES = [_get_square_scores(code) for code in range(CODES_COUNT)]
+
+def evaluate_grid(grid: Grid) -> int:
+    """Evaluation of the grid from scratch, see Grid.evaluation for the incremental one
+
+    Args:
+        grid (Grid): Grid
+
+    Returns:
+        int: Score in centipawns, positive when white is ahead
+    """
+    return sum(SQUARE_SCORES[code][square] for square, code in enumerate(grid.encode()))
@@ -0,0 +1,116 @@
+"""This module contains the GameJournal class, an append-only autosave of a game, which appends a
+fixed size record per move to the journal of a snapshot instead of rewriting the whole save"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from struct import Struct
+
+from chess_engine.chess_game_data import BINARY_MOVE, ChessGameData
+from serialization.enums import DeserializeStatus, SerializeStatus
+from serialization.serializer import Serializer
+
+DEFAULT_COMPACTION_RECORDS = 256
+# Record of an undone move, the code of a move to its own square, which isn't a movement code
+UNDO_RECORD_CODE = 0
+JOURNAL_RECORD: Struct = BINARY_MOVE
+
+@dataclass
+class GameJournal:
+    """Append-only journal of a game, a record per performed or undone move, compacted into a
+    snapshot of the game data every compaction_records records, and when there's no snapshot to
+    append to, the serializer's journal records must be JOURNAL_RECORD sized
+
+    Attributes:
+        serializer (Serializer[ChessGameData]): Serializer in journal mode
+        filename (str): Filename of the snapshot
+        directories (tuple[str, ...]): Sub directories in the serializer's Asset Type
+        compaction_records (int): Records appended before compacting
+        records (int): Records appended since the last compaction
+    """
+
+    serializer: Serializer[ChessGameData]
+    filename: str
+    directories: tuple[str, ...] = ()
+    compaction_records: int = DEFAULT_COMPACTION_RECORDS
+    records: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        if self.serializer.journal_record_size != JOURNAL_RECORD.size:
+            raise ValueError(f"Journal records must be {JOURNAL_RECORD.size} bytes")
+
+    def record_move(self, game_data: ChessGameData) -> SerializeStatus:
+        """Records the last move of the game data
+
+        Args:
+            game_data (ChessGameData): Game data after the move
+
+        Returns:
+            SerializeStatus: Result status
+        """
+        return self._append(ChessGameData.encode_movement(game_data.move_history[-1]),
+                            game_data)
+
+    def record_undo(self, game_data: ChessGameData) -> SerializeStatus:
+        """Records the undo of the last move
+
+        Args:
+            game_data (ChessGameData): Game data after the undo
+
+        Returns:
+            SerializeStatus: Result status
+        """
+        return self._append(UNDO_RECORD_CODE, game_data)
+
+    def _append(self, code: int, game_data: ChessGameData) -> SerializeStatus:
+        if self.records + 1 >= self.compaction_records:
+            return self.compact(game_data)
+        status = self.serializer.append_journal(JOURNAL_RECORD.pack(code), self.filename,
+                                                *self.directories)
+        if status is SerializeStatus.NOT_FOUND:
+            # Records without the snapshot they follow couldn't be recovered
+            return self.compact(game_data)
+        self.records += status is SerializeStatus.SUCCESFULL
+        return status
+
+    def compact(self, game_data: ChessGameData) -> SerializeStatus:
+        """Saves the game data as the snapshot, emptying the journal
+
+        Args:
+            game_data (ChessGameData): Game data
+
+        Returns:
+            SerializeStatus: Result status
+        """
+        status = self.serializer.compact_journal(game_data, self.filename, *self.directories)
+        if status is SerializeStatus.SUCCESFULL:
+            self.records = 0
+        return status
+
+    def recover(self) -> tuple[ChessGameData | None, DeserializeStatus]:
+        """Game data of the snapshot with the moves of the journal replayed on its history, the
+        rest of the data is the snapshot's, replay the history to bring it up to date
+
+        Returns:
+            tuple[ChessGameData | None, DeserializeStatus]: Game data if valid and result status
+        """
+        snapshot, status = self.serializer.deserialize(self.filename, *self.directories)
+        if snapshot is None:
+            return None, status
+
+        records = self.serializer.read_journal(self.filename, *self.directories)
+        if len(records) == 0:
+            return snapshot, status
+        codes = [ChessGameData.encode_movement(mov) for mov in snapshot.move_history]
+        for record in records:
+            code, = JOURNAL_RECORD.unpack(record)
+            if code != UNDO_RECORD_CODE:
+                codes.append(code)
+            elif len(codes) > 0:
+                codes.pop()
+        try:
+            snapshot.move_history = ChessGameData.decode_movements(codes, snapshot.start_fen)
+        except ValueError:
+            return None, DeserializeStatus.CORRUPTED
+        self.records = len(records)
+        return snapshot, status
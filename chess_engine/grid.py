@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Collection, Iterator, NamedTuple, cast
 
-from chess_engine.piece import OptPiece, Piece, SideColor
+from chess_engine.bitboard import Bitboards
+from chess_engine.evaluation import SQUARE_SCORES
+from chess_engine.piece import (NULL_PIECE_STR, OptPiece, Piece, PieceType,
+                                SideColor)
 from chess_engine.structs import Coord
+from chess_engine.zobrist import get_piece_key
 from serialization.serializable import Serializable
 from utils.errors import GridInvalidCoordError, InvalidGridError
 
@@ -25,7 +30,34 @@ BOARD_START = [
     ['wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP', 'wP'], # 2
     ['wR', 'wK', 'wB', 'wQ', 'w@', 'wB', 'wK', 'wR']  # 1
 ]#    a     b     c     d      e     f     g     h
-EMPTY_GRID = [['' for _ in range(L_COLUMNS)] for _ in range(L_ROWS)]
+EMPTY_GRID = [[NULL_PIECE_STR for _ in range(L_COLUMNS)] for _ in range(L_ROWS)]
+# FEN piece letters, in upper case for white and lower case for black
+FEN_PIECES = {
+    'P': PieceType.PAWN,
+    'B': PieceType.BISHOP,
+    'N': PieceType.KNIGTH,
+    'R': PieceType.ROOK,
+    'Q': PieceType.QUEEN,
+    'K': PieceType.KING
+}
+FEN_ROW_SEPARATOR = '/'
+
+class MoveUndo(NamedTuple):
+    """Undo token of a move applied in place with Grid.make_move
+
+    Attributes:
+        origin (Coord): Origin of the moved piece.
+        destination (Coord): Destination of the moved piece.
+        piece (Piece): Moved piece.
+        capture_coord (Coord): Coordinate of the captured piece.
+        captured (OptPiece): Captured piece or None if there wasn't any.
+    """
+
+    origin: Coord
+    destination: Coord
+    piece: Piece
+    capture_coord: Coord
+    captured: OptPiece
 
 class Grid(Serializable):
     """TODO
@@ -38,20 +70,29 @@ class Grid(Serializable):
             if len(column) != len(COLUMNS):
                 raise InvalidGridError("Invalid column count")
 
-        self.__grid = grid
+        # Cells indexed by square
+        self.__cells: list[OptPiece] = [piece for row in grid for piece in row]
+        self.bitboards: Bitboards | None = None
+        self.zobrist_key = 0
+        # Material plus piece-square score, positive when white is ahead
+        self.evaluation = 0
+        # Pieces and kings by coordinate per color, updated on every placement
+        self._pieces: dict[SideColor, dict[Coord, Piece]] = {color: {} for color in SideColor}
+        self._kings: dict[SideColor, dict[Coord, Piece]] = {color: {} for color in SideColor}
 
         for piece, coord in GridIter(self):
-            if piece is not None and piece.coord != coord:
+            if piece is None:
+                continue
+            if piece.coord != coord:
                 error_msg = f"Piece's coord does not match coord in grid, Piece: {piece}"
                 raise InvalidGridError(error_msg)
-
-        self.white_pieces: set[Piece]
-        self.black_pieces: set[Piece]
-        self._categorize_lists()
+            self._index(coord, piece)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Grid):
             return False
+        if self.zobrist_key != other.zobrist_key:
+            return False
 
         for piece, coord in GridIter(self):
             if other.get_at(coord) != piece:
@@ -62,9 +103,9 @@ class Grid(Serializable):
     def get_at(self, coord: Coord) -> OptPiece:
         """TODO
         """
-        if coord.row < 0 or coord.row >= L_ROWS or coord.column < 0 or coord.column >= L_COLUMNS:
+        if not Grid.in_bounds(coord):
             raise GridInvalidCoordError
-        return self.__grid[coord.row][coord.column]
+        return self.__cells[coord.row * L_COLUMNS + coord.column]
 
     def set_at(self, coord: Coord, piece: OptPiece) -> OptPiece:
         """Sets the grid coordinate to the given piece, and return whatever was contained
@@ -76,17 +117,54 @@ class Grid(Serializable):
         Returns:
             OptPiece: Previous piece in the coordinate or None if it was empty
         """
-        prev_piece = self._set_at(coord, piece)
-        self._categorize_lists()
-        return prev_piece
-
-    def _set_at(self, coord: Coord, piece: OptPiece) -> OptPiece:
+        prev_piece = self._lift(coord)
         if piece is not None:
-            piece.coord = coord
-        prev_piece = self.get_at(coord)
-        self.__grid[coord.row][coord.column] = piece
+            self._drop(coord, piece)
         return prev_piece
 
+    @property
+    def white_pieces(self) -> set[Piece]:
+        """Set of the white pieces, built on access"""
+        return set(self._pieces[SideColor.WHITE].values())
+
+    @property
+    def black_pieces(self) -> set[Piece]:
+        """Set of the black pieces, built on access"""
+        return set(self._pieces[SideColor.BLACK].values())
+
+    def get_pieces(self, color: SideColor) -> Collection[Piece]:
+        """Live view of the pieces of the color, must not be iterated while modifying the grid
+
+        Args:
+            color (SideColor): Color
+
+        Returns:
+            Collection[Piece]: Pieces
+        """
+        return self._pieces[color].values()
+
+    def get_king(self, color: SideColor) -> OptPiece:
+        """King of the color, without scanning the pieces
+
+        Args:
+            color (SideColor): Color
+
+        Returns:
+            OptPiece: King or None if the color has no king
+        """
+        kings = self._kings[color]
+        return next(iter(kings.values())) if len(kings) > 0 else None
+
+    def enable_bitboards(self) -> Bitboards:
+        """Builds the bitboard representation of the grid, which is kept in sync from then on
+
+        Returns:
+            Bitboards: Bitboards of the grid
+        """
+        if self.bitboards is None:
+            self.bitboards = Bitboards.from_pieces(*(p.values() for p in self._pieces.values()))
+        return self.bitboards
+
     def swap_pieces(self, coord1: Coord, coord2: Coord) -> None:
         """Swaps the pieces in the given coordinates
 
@@ -97,19 +175,97 @@ class Grid(Serializable):
         if coord1 == coord2:
             raise GridInvalidCoordError
 
-        piece1 = self._set_at(coord1, self.get_at(coord2))
-        self._set_at(coord2, piece1)
+        self.get_at(coord2) # Raises GridInvalidCoordError before mutating the grid
+        piece1 = self._lift(coord1)
+        piece2 = self._lift(coord2)
+        if piece2 is not None:
+            self._drop(coord1, piece2)
+        if piece1 is not None:
+            self._drop(coord2, piece1)
 
-    def _categorize_lists(self) -> None:
-        self.white_pieces = set()
-        self.black_pieces = set()
-        for piece, _ in GridIter(self):
-            if not isinstance(piece, Piece):
-                continue
-            if piece.color == SideColor.WHITE:
-                self.white_pieces.add(piece)
-            else:
-                self.black_pieces.add(piece)
+    def make_move(self, origin: Coord, destination: Coord, capture: Coord | None = None,
+                  promotion: OptPiece = None) -> MoveUndo:
+        """Moves the piece in origin to destination in place, capturing whatever piece is in
+        the capture coordinate, the returned token restores the grid with unmake_move
+
+        Args:
+            origin (Coord): Coordinate of the piece to move
+            destination (Coord): Destination coordinate
+            capture (Coord | None, optional): Coordinate of the captured piece if it's not the
+                destination, as in en passant. Defaults to None.
+            promotion (OptPiece, optional): Piece placed in destination instead of the moved
+                one. Defaults to None.
+
+        Returns:
+            MoveUndo: Undo token
+        """
+        if self.get_at(origin) is None or origin == destination:
+            raise GridInvalidCoordError("Invalid move coordinates")
+
+        capture_coord = destination if capture is None else capture
+        captured = self._lift(capture_coord)
+        piece = cast(Piece, self._lift(origin))
+        self._drop(destination, piece if promotion is None else promotion)
+        return MoveUndo(origin, destination, piece, capture_coord, captured)
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """Restores the grid to the state previous to the move of the undo token, must be called
+        in the reverse order of the make_move calls
+
+        Args:
+            undo (MoveUndo): Undo token returned by make_move
+        """
+        self._lift(undo.destination)
+        self._drop(undo.origin, undo.piece)
+        if undo.captured is not None:
+            self._drop(undo.capture_coord, undo.captured)
+
+    @contextmanager
+    def try_move(self, origin: Coord, destination: Coord,
+                 capture: Coord | None = None) -> Iterator[Grid]:
+        """Context manager which applies the move on enter and restores it on exit
+
+        Args:
+            origin (Coord): Coordinate of the piece to move
+            destination (Coord): Destination coordinate
+            capture (Coord | None, optional): Coordinate of the captured piece if it's not the
+                destination. Defaults to None.
+
+        Yields:
+            Grid: This grid with the move applied
+        """
+        undo = self.make_move(origin, destination, capture)
+        try:
+            yield self
+        finally:
+            self.unmake_move(undo)
+
+    def _lift(self, coord: Coord) -> OptPiece:
+        piece = self.get_at(coord)
+        if piece is not None:
+            self.__cells[coord.square] = None
+            del self._pieces[piece.color][coord]
+            if piece.type == PieceType.KING:
+                del self._kings[piece.color][coord]
+            self.zobrist_key ^= get_piece_key(piece, coord)
+            self.evaluation -= SQUARE_SCORES[piece.code][coord.square]
+            if self.bitboards is not None:
+                self.bitboards.remove(piece, coord)
+        return piece
+
+    def _drop(self, coord: Coord, piece: Piece) -> None:
+        piece.coord = coord
+        self.__cells[coord.square] = piece
+        self._index(coord, piece)
+
+    def _index(self, coord: Coord, piece: Piece) -> None:
+        self._pieces[piece.color][coord] = piece
+        if piece.type == PieceType.KING:
+            self._kings[piece.color][coord] = piece
+        self.zobrist_key ^= get_piece_key(piece, coord)
+        self.evaluation += SQUARE_SCORES[piece.code][coord.square]
+        if self.bitboards is not None:
+            self.bitboards.add(piece, coord)
 
     def print_grid(self) -> None:
         """TODO
@@ -118,15 +274,61 @@ class Grid(Serializable):
         for piece, _ in GridIter(self, on_new_row=lambda r : print(ROWS[r])):
             print(f" {Piece.get_str(piece)} ", end="")
 
+    def encode(self) -> bytes:
+        """Compact encoding of the grid, the piece code of each square
+
+        Returns:
+            bytes: Piece codes indexed by square
+        """
+        return bytes(Piece.encode(piece) for piece in self.__cells)
+
     def get_str_grid(self) -> list[list[str]]:
         """TODO
         """
-        str_grid: list[list[str]] = [[]]
-        for piece, coord in GridIter(self, on_new_row=lambda _: str_grid.append([])):
+        str_grid: list[list[str]] = [[] for _ in range(L_ROWS)]
+        for piece, coord in GridIter(self):
             str_grid[coord.row].append(Piece.get_str(piece))
 
         return str_grid
 
+    @staticmethod
+    def in_bounds(coord: Coord) -> bool:
+        """Whether the coordinate is inside the grid
+
+        Args:
+            coord (Coord): Coordinate
+
+        Returns:
+            bool: Whether is inside
+        """
+        return 0 <= coord.row < L_ROWS and 0 <= coord.column < L_COLUMNS
+
+    @staticmethod
+    def get_coord_str(coord: Coord) -> str:
+        """Algebraic name of the coordinate, e.g. e4
+
+        Args:
+            coord (Coord): Coordinate
+
+        Returns:
+            str: Coordinate name
+        """
+        return f"{COLUMNS[coord.column]}{ROWS[coord.row]}"
+
+    @staticmethod
+    def coord_from_str(coord_str: str) -> Coord:
+        """Coordinate of the algebraic name, e.g. e4
+
+        Args:
+            coord_str (str): Coordinate name
+
+        Returns:
+            Coord: Coordinate
+        """
+        if len(coord_str) != 2 or coord_str[0] not in COLUMNS or coord_str[1] not in ROWS:
+            raise GridInvalidCoordError(f"Invalid coordinate name {coord_str}")
+        return Coord(ROWS.index(coord_str[1]), COLUMNS.index(coord_str[0]))
+
     @staticmethod
     def get_start_grid() -> Grid:
         """TODO
@@ -158,9 +360,80 @@ class Grid(Serializable):
         return Grid(grid)
 
 
+    @staticmethod
+    def decode(codes: bytes) -> Grid:
+        """Builds the grid from its compact encoding
+
+        Args:
+            codes (bytes): Piece codes indexed by square
+
+        Returns:
+            Grid: Grid
+        """
+        if len(codes) != L_ROWS * L_COLUMNS:
+            raise InvalidGridError("Invalid square count")
+        try:
+            return Grid([[Piece.decode(codes[Coord(r, c).square], Coord(r, c))
+                          for c in range(L_COLUMNS)] for r in range(L_ROWS)])
+        except ValueError as e:
+            raise InvalidGridError(str(e)) from e
+
+    @staticmethod
+    def from_fen(placement: str) -> Grid:
+        """Builds the grid from the piece placement field of a FEN string
+
+        Args:
+            placement (str): FEN piece placement, e.g. rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR
+
+        Returns:
+            Grid: Grid
+        """
+        fen_rows = placement.split(FEN_ROW_SEPARATOR)
+        if len(fen_rows) != L_ROWS:
+            raise InvalidGridError("Invalid row count")
+
+        grid: list[list[OptPiece]] = []
+        for r, fen_row in enumerate(fen_rows):
+            grid.append([])
+            for char in fen_row:
+                if char.isdigit():
+                    grid[r].extend(None for _ in range(int(char)))
+                    continue
+                if char.upper() not in FEN_PIECES:
+                    raise InvalidGridError(f"Invalid FEN piece {char}")
+                color = SideColor.WHITE if char.isupper() else SideColor.BLACK
+                grid[r].append(Piece(FEN_PIECES[char.upper()], color, Coord(r, len(grid[r]))))
+
+            if len(grid[r]) != L_COLUMNS:
+                raise InvalidGridError("Invalid column count")
+
+        return Grid(grid)
+
+    def to_fen(self) -> str:
+        """Piece placement field of a FEN string of the grid, see from_fen
+
+        Returns:
+            str: FEN piece placement
+        """
+        fen_letters = {piece_type: letter for letter, piece_type in FEN_PIECES.items()}
+        fen_rows: list[str] = []
+        for r in range(L_ROWS):
+            fen_row, empty = "", 0
+            for c in range(L_COLUMNS):
+                piece = self.get_at(Coord(r, c))
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty > 0:
+                    fen_row, empty = fen_row + str(empty), 0
+                letter = fen_letters[piece.type]
+                fen_row += letter if piece.color == SideColor.WHITE else letter.lower()
+            fen_rows.append(fen_row + (str(empty) if empty > 0 else ""))
+        return FEN_ROW_SEPARATOR.join(fen_rows)
+
     def get_serialization_attrs(self) -> dict[str, Any]:
         return {
-            "grid": self.get_start_grid()
+            "grid": self.get_str_grid()
         }
 
     @classmethod
@@ -0,0 +1,124 @@
+"""This module contains the precomputed movement tables, the rays and reachable squares of each
+piece type and color from every square, shared by all the pieces and never modified"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from chess_engine.bitboard import BOARD_SIZE, SQUARES
+from chess_engine.enums import MovSpecialCase, PieceType, SideColor
+from chess_engine.piece import PIECE_CODES, TYPE_MOVEMENTS, Piece
+from chess_engine.structs import SQUARE_COORDS, Coord, Dir
+
+Ray = tuple[Coord, ...]
+
+class MoveTarget(NamedTuple):
+    """Movement of a piece to a reachable square
+
+    Attributes:
+        mov_case (MovSpecialCase): Special case of the movement.
+        path (tuple[Coord, ...]): Coordinates between the origin and the destination.
+    """
+
+    mov_case: MovSpecialCase
+    path: tuple[Coord, ...]
+
+def _in_bounds(row: int, column: int) -> bool:
+    return 0 <= row < BOARD_SIZE and 0 <= column < BOARD_SIZE
+
+def _get_path(origin: int, dest: int) -> tuple[Coord, ...]:
+    o_row, o_column = divmod(origin, BOARD_SIZE)
+    d_row, d_column = divmod(dest, BOARD_SIZE)
+    row_diff, column_diff = d_row - o_row, d_column - o_column
+    if row_diff != 0 and column_diff != 0 and abs(row_diff) != abs(column_diff):
+        return ()
+
+    steps = max(abs(row_diff), abs(column_diff))
+    if steps == 0:
+        return ()
+    row_dir, column_dir = row_diff // steps, column_diff // steps
+    return tuple(SQUARE_COORDS[(o_row + row_dir*i) * BOARD_SIZE + o_column + column_dir*i]
+                 for i in range(1, steps))
+
+# Coordinates between two squares sharing a row, column or diagonal, indexed by both squares
+PATHS = tuple(tuple(_get_path(origin, dest) for dest in range(SQUARES))
+              for origin in range(SQUARES))
+
+def _get_ray(square: int, direction: Dir, extends: bool) -> Ray:
+    row, column = divmod(square, BOARD_SIZE)
+    ray: list[Coord] = []
+    row, column = row + direction.row, column + direction.column
+    while _in_bounds(row, column):
+        ray.append(SQUARE_COORDS[row * BOARD_SIZE + column])
+        if not extends:
+            break
+        row, column = row + direction.row, column + direction.column
+    return tuple(ray)
+
+def _build_tables(piece_type: PieceType, color: SideColor
+                  ) -> tuple[tuple[tuple[Ray, ...], ...], tuple[Mapping[int, MoveTarget], ...]]:
+    movements = TYPE_MOVEMENTS[PIECE_CODES[(piece_type, color)]]
+    extends = Piece(piece_type, color, SQUARE_COORDS[0]).can_extend()
+    rays_table: list[tuple[Ray, ...]] = []
+    targets_table: list[Mapping[int, MoveTarget]] = []
+    for square in range(SQUARES):
+        rays: list[Ray] = []
+        targets: dict[int, MoveTarget] = {}
+        for direction, mov_case in movements.items():
+            ray = _get_ray(square, direction, extends)
+            if len(ray) == 0:
+                continue
+            rays.append(ray)
+            for dest in ray:
+                dest_square = dest.square
+                targets[dest_square] = MoveTarget(mov_case, PATHS[square][dest_square])
+        rays_table.append(tuple(rays))
+        targets_table.append(MappingProxyType(targets))
+    return tuple(rays_table), tuple(targets_table)
+
+_TABLES = {code: _build_tables(piece_type, color)
+           for (piece_type, color), code in PIECE_CODES.items()}
+
+# Rays by piece code, indexed by square, ordered from the closest coordinate
+MOVE_RAYS = {key: rays for key, (rays, _) in _TABLES.items()}
+# Reachable squares by piece code, indexed by origin square and keyed by destination square
+MOVE_TARGETS = {key: targets for key, (_, targets) in _TABLES.items()}
+
+def get_rays(piece: Piece, origin: Coord) -> tuple[Ray, ...]:
+    """Rays of the piece from the origin, on an empty board
+
+    Args:
+        piece (Piece): Piece
+        origin (Coord): Origin
+
+    Returns:
+        tuple[Ray, ...]: Rays, each ordered from the closest coordinate
+    """
+    return MOVE_RAYS[piece.code][origin.square]
+
+def get_target(piece: Piece, origin: Coord, dest: Coord) -> MoveTarget | None:
+    """Movement of the piece from the origin to the destination, on an empty board
+
+    Args:
+        piece (Piece): Piece
+        origin (Coord): Origin
+        dest (Coord): Destination
+
+    Returns:
+        MoveTarget | None: Movement, None if the destination isn't reachable
+    """
+    return MOVE_TARGETS[piece.code][origin.square].get(dest.square, None)
+
+def get_path(origin: Coord, dest: Coord) -> tuple[Coord, ...]:
+    """Coordinates between the origin and the destination, empty if they don't share a row,
+    column or diagonal
+
+    Args:
+        origin (Coord): Origin
+        dest (Coord): Destination
+
+    Returns:
+        tuple[Coord, ...]: Coordinates in the path
+    """
+    return PATHS[origin.square][dest.square]
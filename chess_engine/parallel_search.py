@@ -0,0 +1,160 @@
+"""This module contains the parallel search, which splits the root moves of a position across a
+process pool, every worker searching the positions after its root moves
+
+Execute
+py -m chess_engine.parallel_search --depth N [--fen FEN] [--workers 1,2,4]
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from os import cpu_count
+from time import perf_counter
+
+from chess_engine.chess_game import START_FEN, ChessGame
+from chess_engine.chess_validator import LegalMove
+from chess_engine.enums import BoardBackend
+from chess_engine.perft import get_move_str
+from chess_engine.search import (MATE_SCORE, MAX_DEPTH, Searcher,
+                                 SearchLimits, SearchResult, best_move)
+from chess_engine.transposition import (TranspositionTable, decode_move,
+                                        encode_move)
+
+# Transposition table size of each root move search
+ROOT_MOVE_TABLE_MB = 4
+
+# Root move task, the position encoding, move code, depth, nodes and time budgets and backend
+RootMoveTask = tuple[bytes, int, int, int | None, float | None, str]
+# Root move iteration, the score for the root side and the principal variation move codes
+RootMoveIteration = tuple[int, list[int]]
+# Root move result, the completed iterations by depth, searched nodes and whether the score is
+# final at any depth, as the root move ends the game or leads to a mate, its only iteration
+# being the final one if the root move ends the game
+RootMoveResult = tuple[list[RootMoveIteration], int, bool]
+
+def parallel_best_move(game: ChessGame, limits: SearchLimits | None = None,
+                       workers: int | None = None) -> SearchResult:
+    """Searches the best move of the side to move, searching the root moves in parallel
+
+    The node and time budgets are split among the root moves, each one getting its fair share
+    of the workers. Root moves are compared at the deepest iteration all of them completed,
+    as a sequential search compares them within one iteration, and results are merged in
+    root move order, so equal depth or node budgets give equal results regardless of the
+    worker count. The depth reached within a time budget depends on the worker count
+
+    Args:
+        game (ChessGame): Game, it isn't modified
+        limits (SearchLimits | None, optional): Budget, defaults to DEFAULT_DEPTH plies.
+            Defaults to None.
+        workers (int | None, optional): Worker processes, the cpu count if None.
+            Defaults to None.
+
+    Returns:
+        SearchResult: Merged result of the root moves
+    """
+    start = perf_counter()
+    limits = SearchLimits() if limits is None else limits
+    workers = (cpu_count() or 1) if workers is None else workers
+    root_moves = sorted(game.legal_moves(), key=encode_move)
+    if len(root_moves) == 0 or limits.max_depth() <= 1:
+        return best_move(game, limits)
+
+    encoding = game.encode_position()
+    nodes = None if limits.nodes is None else max(1, limits.nodes // len(root_moves))
+    time = None if limits.time is None else limits.time / ceil(len(root_moves) / workers)
+    tasks: list[RootMoveTask] = [(encoding, encode_move(move), limits.max_depth() - 1, nodes,
+                                  time, game.backend.name) for move in root_moves]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(search_root_move, tasks))
+
+    result = merge_results(root_moves, results, limits.max_depth())
+    result.time = perf_counter() - start
+    return result
+
+def merge_results(root_moves: list[LegalMove], results: list[RootMoveResult],
+                  max_depth: int) -> SearchResult:
+    """Merges the results of the root moves, comparing them at the deepest iteration all the
+    root moves without a final score completed
+
+    Args:
+        root_moves (list[LegalMove]): Root moves
+        results (list[RootMoveResult]): Results, in root move order
+        max_depth (int): Depth limit of the search, including the root move
+
+    Returns:
+        SearchResult: Merged result, without time
+    """
+    total_nodes = 1 + sum(result[1] for result in results)
+    completed = [i for i, result in enumerate(results) if len(result[0]) > 0]
+    if len(completed) == 0:
+        # No root move was searched to depth 1, nothing to compare
+        return SearchResult(root_moves[0], 0, 0, [], total_nodes, 0)
+
+    # Final scores hold at any depth
+    depth = min((len(results[i][0]) for i in completed if not results[i][2]),
+                default=max_depth - 1)
+    iterations = {i: results[i][0][min(depth, len(results[i][0])) - 1] for i in completed}
+    best_index = max(completed, key=lambda i: (iterations[i][0], -i))
+    score, pv_codes = iterations[best_index]
+    pv = [root_moves[best_index]] + [decode_move(code) for code in pv_codes]
+    return SearchResult(pv[0], score, 1 + depth, pv, total_nodes, 0)
+
+def search_root_move(task: RootMoveTask) -> RootMoveResult:
+    """Searches the position after a root move, runs in the worker processes
+
+    Args:
+        task (RootMoveTask): Root move task
+
+    Returns:
+        RootMoveResult: Root move result
+    """
+    encoding, move_code, depth, nodes, time, backend = task
+    game = ChessGame.decode_position(encoding, BoardBackend[backend])
+    game.attempt_legal_move(decode_move(move_code))
+
+    terminal = len(list(game.legal_moves())) == 0
+    searcher = Searcher(game, SearchLimits(depth, nodes, time),
+                        TranspositionTable(ROOT_MOVE_TABLE_MB))
+    result = searcher.search()
+    if terminal:
+        return [(_to_parent_score(result.score), [])], result.nodes, True
+    iterations = [(_to_parent_score(iteration.score), [encode_move(m) for m in iteration.pv])
+                  for iteration in searcher.iterations]
+    is_mate = len(iterations) > 0 and abs(result.score) >= MATE_SCORE - MAX_DEPTH
+    return iterations, result.nodes, is_mate
+
+def _to_parent_score(score: int) -> int:
+    # Mates are one ply further away from the root
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return -score + 1
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return -score - 1
+    return -score
+
+def main(args: list[str] | None = None) -> None:
+    """Benchmarks the parallel search by worker count from the command line arguments
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.parallel_search", description=__doc__)
+    parser.add_argument("--depth", type=int, required=True, help="Depth in plies")
+    parser.add_argument("--fen", default=START_FEN, help="Position, defaults to the start")
+    parser.add_argument("--workers", default=f"1,{cpu_count() or 1}",
+                        help="Comma separated worker counts, defaults to 1 and the cpu count")
+    parsed = parser.parse_args(args)
+
+    game = ChessGame.from_fen(parsed.fen)
+    base_time = None
+    for workers in sorted({int(w) for w in parsed.workers.split(',')}):
+        result = parallel_best_move(game, SearchLimits(depth=parsed.depth), workers)
+        base_time = result.time if base_time is None else base_time
+        best = "none" if result.best_move is None else get_move_str(result.best_move)
+        print(f"Workers: {workers}, Best move: {best}, Score: {result.score}, "
+              f"Nodes: {result.nodes}, Time: {result.time:.3f}s, "
+              f"Nodes/s: {result.nps:.0f}, Speedup: {base_time / result.time:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""This module contains the perft benchmark, which counts the leaf nodes of the legal move tree
+of a position, for proving the move generation correctness and measuring the engine throughput
+
+Execute
+py -m chess_engine.perft --depth N [--fen FEN] [--divide] [--backend bitboard]
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+from chess_engine.chess_game import START_FEN, ChessGame
+from chess_engine.chess_validator import LegalMove
+from chess_engine.enums import BoardBackend
+from chess_engine.grid import FEN_PIECES, Grid
+
+# Reference positions with their node counts by depth, starting at depth 1
+REFERENCE_POSITIONS: dict[str, tuple[str, list[int]]] = {
+    "start" : (START_FEN, [20, 400, 8902, 197281, 4865609]),
+    "kiwipete" : ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+                  [48, 2039, 97862, 4085603]),
+    "position3" : ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+                   [14, 191, 2812, 43238, 674624]),
+    "position4" : ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+                   [6, 264, 9467, 422333]),
+    "position4_mirrored" : ("r2q1rk1/pP1p2pp/Q4n2/bbp1p3/Np6/1B3NBn/pPPP1PPP/R3K2R b KQ - 0 1",
+                            [6, 264, 9467, 422333]),
+    "position5" : ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+                   [44, 1486, 62379, 2103487]),
+    "position6" : ("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+                   [46, 2079, 89890, 3894594]),
+}
+
+def perft(game: ChessGame, depth: int) -> int:
+    """Counts the leaf nodes of the legal move tree of the game's position
+
+    Args:
+        game (ChessGame): Game, left in the same position when done
+        depth (int): Depth in plies
+
+    Returns:
+        int: Leaf nodes count
+    """
+    moves = list(game.legal_moves())
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1
+
+    nodes = 0
+    for move in moves:
+        game.attempt_legal_move(move)
+        nodes += perft(game, depth - 1)
+        game.undo_move()
+    return nodes
+
+def divide(game: ChessGame, depth: int) -> dict[str, int]:
+    """Counts the leaf nodes under each legal move of the game's position
+
+    Args:
+        game (ChessGame): Game, left in the same position when done
+        depth (int): Depth in plies, counting the root move
+
+    Returns:
+        dict[str, int]: Leaf nodes count by root move name
+    """
+    nodes: dict[str, int] = {}
+    for move in list(game.legal_moves()):
+        game.attempt_legal_move(move)
+        nodes[get_move_str(move)] = perft(game, depth - 1)
+        game.undo_move()
+    return nodes
+
+def get_move_str(move: LegalMove) -> str:
+    """Coordinate notation of the move, e.g. e2e4 or e7e8q
+
+    Args:
+        move (LegalMove): Move
+
+    Returns:
+        str: Move name
+    """
+    origin, destination, promotion = move
+    move_str = Grid.get_coord_str(origin) + Grid.get_coord_str(destination)
+    if promotion is not None:
+        move_str += next(c for c, t in FEN_PIECES.items() if t is promotion).lower()
+    return move_str
+
+def main(args: list[str] | None = None) -> None:
+    """Runs perft from the command line arguments
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.perft", description=__doc__)
+    parser.add_argument("--depth", type=int, required=True, help="Depth in plies")
+    parser.add_argument("--fen", default=START_FEN, help="Position, defaults to the start")
+    parser.add_argument("--divide", action="store_true", help="Print nodes per root move")
+    parser.add_argument("--backend", default=BoardBackend.GRID.name.lower(),
+                        choices=[b.name.lower() for b in BoardBackend], help="Board backend")
+    parsed = parser.parse_args(args)
+
+    game = ChessGame.from_fen(parsed.fen, BoardBackend[parsed.backend.upper()])
+    start = perf_counter()
+    if parsed.divide:
+        root_nodes = divide(game, parsed.depth)
+        for move_str, count in sorted(root_nodes.items()):
+            print(f"{move_str}: {count}")
+        nodes = sum(root_nodes.values())
+    else:
+        nodes = perft(game, parsed.depth)
+    elapsed = perf_counter() - start
+
+    print(f"Nodes: {nodes}")
+    print(f"Time: {elapsed:.3f}s")
+    print(f"Nodes/s: {nodes / elapsed if elapsed > 0 else 0:.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""This module contains the PGN import and export, a streaming reader yielding a game at a time
+from the lines of a PGN file, resolving its SAN moves through the legal moves, and a writer
+converting a game's move history to SAN
+
+Games from a set up position are read from and written with their FEN tag
+
+Execute
+py -m chess_engine.pgn FILE [--output DIR] [--encoding JSON|BINARY] [--skip-invalid]
+"""
+
+from __future__ import annotations
+
+import re
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from os import path
+from textwrap import wrap
+from time import perf_counter
+from typing import Iterable, Iterator, Mapping, NamedTuple, TextIO
+
+from chess_engine.chess_game import START_FEN, ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from chess_engine.chess_validator import LegalMove
+from chess_engine.enums import (BoardBackend, GameState, MoveStatus, PieceType,
+                                SideColor, TurnState)
+from chess_engine.grid import COLUMNS, FEN_PIECES, L_ROWS, ROWS, Grid
+from chess_engine.structs import Coord
+from serialization.enums import SaveEncoding, SerializeStatus
+from serialization.serializer import ENCODING
+from utils.errors import (InvalidChessGameError, InvalidMoveHistoryError,
+                          InvalidPgnError)
+
+# Result tokens by game state
+PGN_RESULTS = {
+    GameState.PENDING : "*",
+    GameState.WHITE_WIN : "1-0",
+    GameState.BLACK_WIN : "0-1",
+    GameState.TIE : "1/2-1/2"
+}
+RESULT_STATES = {result: state for state, result in PGN_RESULTS.items()}
+
+# Seven tag roster with the default values of unknown tags
+DEFAULT_TAGS = {
+    "Event" : "?",
+    "Site" : "?",
+    "Date" : "????.??.??",
+    "Round" : "?",
+    "White" : "?",
+    "Black" : "?",
+    "Result" : "*"
+}
+PGN_LINE_LENGTH = 80
+
+SAN_LETTERS = {piece_type: letter for letter, piece_type in FEN_PIECES.items()}
+KING_CASTLE = "O-O"
+QUEEN_CASTLE = "O-O-O"
+
+_TAG_RE = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]\s*$')
+_TOKEN_RE = re.compile(r"\s*(?:([{};()])|([^\s{};()]+))")
+_MOVE_NUMBER_RE = re.compile(r"^\d+\.*")
+_SAN_RE = re.compile(r"^([NBRQK])?([a-h])?([1-8])?x?([a-h][1-8])(?:=?([NBRQ]))?$")
+
+class PgnGame(NamedTuple):
+    """Game as read from a PGN file, before resolving its moves
+
+    Attributes:
+        tags (dict[str, str]): Tag pairs.
+        moves (list[str]): SAN moves of the main line.
+        result (str): Result token.
+    """
+
+    tags: dict[str, str]
+    moves: list[str]
+    result: str
+
+def iter_pgn(lines: Iterable[str]) -> Iterator[PgnGame]:
+    """Yields the games of the lines of a PGN file, keeping a single game in memory, comments,
+    variations and annotations are skipped
+
+    Args:
+        lines (Iterable[str]): Lines, e.g. an open file
+
+    Yields:
+        PgnGame: Game
+    """
+    parser = _PgnParser()
+    for line in lines:
+        yield from parser.parse_line(line)
+    yield from parser.finish()
+
+@dataclass
+class _PgnParser:
+    # State of iter_pgn between lines, the game being read and the open comment or variations
+    tags: dict[str, str] = field(default_factory=dict)
+    moves: list[str] = field(default_factory=list)
+    in_comment: bool = False
+    variation_depth: int = 0
+
+    def parse_line(self, line: str) -> Iterator[PgnGame]:
+        """Yields the games ended by the line
+
+        Args:
+            line (str): Line
+
+        Yields:
+            PgnGame: Game
+        """
+        if not self.in_comment and line.startswith('%'):
+            return
+        tag = _TAG_RE.match(line) if not self.in_comment else None
+        if tag is None:
+            yield from self._parse_movetext(line)
+            return
+        if len(self.moves) > 0:
+            # Game without result token
+            yield self._end_game(self.tags.get("Result", PGN_RESULTS[GameState.PENDING]))
+        self.tags[tag[1]] = re.sub(r"\\(.)", r"\1", tag[2])
+
+    def finish(self) -> Iterator[PgnGame]:
+        """Yields the game left without result token at the end of the file, if any
+
+        Yields:
+            PgnGame: Game
+        """
+        if len(self.moves) > 0 or len(self.tags) > 0:
+            yield self._end_game(self.tags.get("Result", PGN_RESULTS[GameState.PENDING]))
+
+    def _end_game(self, result: str) -> PgnGame:
+        game = PgnGame(self.tags, self.moves, result)
+        self.tags, self.moves, self.variation_depth = {}, [], 0
+        return game
+
+    def _parse_movetext(self, line: str) -> Iterator[PgnGame]:
+        pos = 0
+        while pos < len(line):
+            if self.in_comment:
+                end = line.find('}', pos)
+                if end < 0:
+                    break
+                self.in_comment, pos = False, end + 1
+                continue
+
+            token = _TOKEN_RE.match(line, pos)
+            if token is None:
+                break
+            pos = token.end()
+            symbol, word = token.groups()
+            if symbol == '{':
+                self.in_comment = True
+            elif symbol == ';':
+                break
+            elif symbol == '(':
+                self.variation_depth += 1
+            elif symbol == ')':
+                self.variation_depth = max(0, self.variation_depth - 1)
+            elif word is not None and self.variation_depth == 0:
+                if word in RESULT_STATES:
+                    yield self._end_game(word)
+                    continue
+                san = _MOVE_NUMBER_RE.sub("", word).rstrip("!?")
+                if len(san) > 0 and not san.startswith('$'):
+                    self.moves.append(san)
+
+def read_pgn(lines: Iterable[str], skip_invalid: bool = False,
+             backend: BoardBackend = BoardBackend.GRID) -> Iterator[ChessGameData]:
+    """Yields the game data of the games of the lines of a PGN file, see iter_pgn
+
+    Args:
+        lines (Iterable[str]): Lines, e.g. an open file
+        skip_invalid (bool, optional): Whether to skip games that can't be read instead of
+            raising. Defaults to False.
+        backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+    Yields:
+        ChessGameData: Game data
+    """
+    for pgn_game in iter_pgn(lines):
+        try:
+            yield get_game_data(pgn_game, backend)
+        except InvalidPgnError:
+            if not skip_invalid:
+                raise
+
+def get_game_data(pgn_game: PgnGame,
+                  backend: BoardBackend = BoardBackend.GRID) -> ChessGameData:
+    """Game data of the game, resolving its moves from the FEN tag's position if any, a
+    decisive result without checkmate, e.g. a resignation, is kept as the game state
+
+    Args:
+        pgn_game (PgnGame): Game
+        backend (BoardBackend, optional): Board backend. Defaults to BoardBackend.GRID.
+
+    Returns:
+        ChessGameData: Game data
+    """
+    if pgn_game.result not in RESULT_STATES:
+        raise InvalidPgnError(f"Invalid result {pgn_game.result}")
+    fen = pgn_game.tags.get("FEN", START_FEN)
+    try:
+        game = ChessGame.from_fen(fen, backend)
+    except InvalidChessGameError as e:
+        raise InvalidPgnError(f"Invalid FEN tag {fen}") from e
+
+    for ply, san in enumerate(pgn_game.moves):
+        try:
+            move = parse_san(game, san)
+        except InvalidPgnError as e:
+            raise InvalidPgnError(f"{e} at ply {ply}") from e
+        game.attempt_legal_move(move)
+
+    if game.data.state == GameState.PENDING:
+        game.data.state = RESULT_STATES[pgn_game.result]
+    return game.data
+
+class _SanMove(NamedTuple):
+    # Move named by a SAN, with the origin's column and row letters given to disambiguate
+    piece_type: PieceType
+    dest: Coord
+    promotion: PieceType | None
+    from_column: str | None
+    from_row: str | None
+
+def parse_san(game: ChessGame, san: str) -> LegalMove:
+    """Legal move of the side to move named by the SAN, e.g. Nbd7, exd8=Q+ or O-O
+
+    Args:
+        game (ChessGame): Game
+        san (str): SAN
+
+    Returns:
+        LegalMove: Move
+    """
+    san = san.rstrip("+#").replace('0', 'O')
+    san_move = _get_san_move(game, san)
+    moves: list[LegalMove] = []
+    if Grid.in_bounds(san_move.dest):
+        moves = [move for move in game.legal_moves_to(san_move.dest)
+                 if _is_san_move(game, move, san_move)]
+
+    if len(moves) == 0:
+        raise InvalidPgnError(f"Illegal move {san}")
+    if len(moves) > 1:
+        raise InvalidPgnError(f"Ambiguous move {san}")
+    return moves[0]
+
+def _get_san_move(game: ChessGame, san: str) -> _SanMove:
+    if san in (KING_CASTLE, QUEEN_CASTLE):
+        king = game.grid.get_king(game.data.turn)
+        if king is None:
+            raise InvalidPgnError(f"Illegal move {san}")
+        column = king.coord.column + (2 if san == KING_CASTLE else -2)
+        return _SanMove(PieceType.KING, Coord(king.coord.row, column), None, None, None)
+
+    match = _SAN_RE.match(san)
+    if match is None:
+        raise InvalidPgnError(f"Invalid SAN {san}")
+    letter, from_column, from_row, dest_str, promotion_letter = match.groups()
+    piece_type = PieceType.PAWN if letter is None else FEN_PIECES[letter]
+    promotion = None if promotion_letter is None else FEN_PIECES[promotion_letter]
+    return _SanMove(piece_type, Grid.coord_from_str(dest_str), promotion, from_column, from_row)
+
+def _is_san_move(game: ChessGame, move: LegalMove, san_move: _SanMove) -> bool:
+    origin, _, promotion = move
+    piece = game.grid.get_at(origin)
+    if piece is None or piece.type != san_move.piece_type or promotion != san_move.promotion:
+        return False
+    if san_move.from_column is not None and origin.column != COLUMNS.index(san_move.from_column):
+        return False
+    return san_move.from_row is None or origin.row == ROWS.index(san_move.from_row)
+
+def get_san(game: ChessGame, move: LegalMove) -> str:
+    """SAN of a legal move of the side to move, e.g. Nbd7, exd8=Q+ or O-O
+
+    Args:
+        game (ChessGame): Game, left in the same position when done
+        move (LegalMove): Move
+
+    Returns:
+        str: SAN
+    """
+    san = _get_san_body(game, move)
+    with game.unjournaled():
+        game.attempt_legal_move(move)
+        try:
+            return san + _get_check_suffix(game)
+        finally:
+            game.undo_move()
+
+def _get_san_body(game: ChessGame, move: LegalMove) -> str:
+    origin, dest, promotion = move
+    piece = game.grid.get_at(origin)
+    if piece is None:
+        raise ValueError(f"No piece at {Grid.get_coord_str(origin)}")
+    if piece.type == PieceType.KING and abs(dest.column - origin.column) == 2:
+        return KING_CASTLE if dest.column > origin.column else QUEEN_CASTLE
+
+    dest_str = Grid.get_coord_str(dest)
+    if piece.type == PieceType.PAWN:
+        if origin.column == dest.column:
+            san = dest_str
+        else:
+            san = f"{COLUMNS[origin.column]}x{dest_str}"
+        return san if promotion is None else f"{san}={SAN_LETTERS[promotion]}"
+
+    others = []
+    for other, _, _ in game.legal_moves_to(dest):
+        other_piece = game.grid.get_at(other)
+        if other != origin and other_piece is not None and other_piece.type == piece.type:
+            others.append(other)
+    disambiguation = ""
+    if len(others) > 0:
+        if all(other.column != origin.column for other in others):
+            disambiguation = COLUMNS[origin.column]
+        elif all(other.row != origin.row for other in others):
+            disambiguation = ROWS[origin.row]
+        else:
+            disambiguation = Grid.get_coord_str(origin)
+    capture = "x" if game.grid.get_at(dest) is not None else ""
+    return f"{SAN_LETTERS[piece.type]}{disambiguation}{capture}{dest_str}"
+
+def _get_check_suffix(game: ChessGame) -> str:
+    if game.turn_state == TurnState.CHECKMATE:
+        return "#"
+    return "+" if game.turn_state == TurnState.CHECK else ""
+
+def iter_san(game_data: ChessGameData) -> Iterator[str]:
+    """Yields the SAN of each move of the data's move history, replaying it from its start
+    position
+
+    Args:
+        game_data (ChessGameData): Game data
+
+    Yields:
+        str: SAN
+    """
+    game = ChessGame.get_start_game(game_data)
+    for ply, (piece, dest) in enumerate(game_data.iter_moves()):
+        destination = dest if isinstance(dest, Coord) else dest.coord
+        # A piece destination is the captured piece, or the promoted one on the last rows
+        is_promotion = piece.type == PieceType.PAWN and destination.row in (0, L_ROWS - 1)
+        promotion = dest.type if is_promotion and not isinstance(dest, Coord) else None
+        move = (piece.coord, destination, promotion)
+        if not Grid.in_bounds(piece.coord) or not Grid.in_bounds(destination) or \
+            game.grid.get_at(piece.coord) != piece:
+            raise InvalidMoveHistoryError(ply)
+
+        san = _get_san_body(game, move)
+        if game.attempt_legal_move(move) is not MoveStatus.PERFORMED:
+            raise InvalidMoveHistoryError(ply)
+        yield san + _get_check_suffix(game)
+
+def write_pgn(file: TextIO, game_data: ChessGameData,
+              tags: Mapping[str, str] | None = None) -> None:
+    """Writes the game to a PGN file, after the seven tag roster and the FEN tag of a set up
+    start position, the result is the data's state
+
+    Args:
+        file (TextIO): PGN file
+        game_data (ChessGameData): Game data
+        tags (Mapping[str, str] | None, optional): Tag pairs, unknown tags of the seven tag
+            roster are written with their default value. Defaults to None.
+    """
+    result = PGN_RESULTS[game_data.state]
+    all_tags = {**DEFAULT_TAGS, **({} if tags is None else tags), "Result": result}
+    start = ChessGame.get_start_game(game_data)
+    if game_data.start_fen is not None:
+        all_tags.update(SetUp="1", FEN=game_data.start_fen)
+    for name, value in all_tags.items():
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+        file.write(f'[{name} "{escaped}"]\n')
+
+    tokens: list[str] = []
+    # Plies from the first white move of the start position's move number
+    first_ply = 0 if start.data.turn == SideColor.WHITE else 1
+    for ply, san in enumerate(iter_san(game_data), first_ply):
+        move_number = start.data.fullmove_number + ply // 2
+        if ply % 2 == 0:
+            tokens.append(f"{move_number}.")
+        elif ply == first_ply:
+            tokens.append(f"{move_number}...")
+        tokens.append(san)
+    tokens.append(result)
+    movetext = wrap(' '.join(tokens), PGN_LINE_LENGTH, break_long_words=False,
+                    break_on_hyphens=False)
+    file.write('\n' + '\n'.join(movetext) + '\n\n')
+
+def main(args: list[str] | None = None) -> None:
+    """Reads a PGN file from the command line arguments, optionally saving its games
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.pgn", description=__doc__)
+    parser.add_argument("file", help="PGN file")
+    parser.add_argument("--output", default=None, help="Directory to save the games to")
+    parser.add_argument("--encoding", default=SaveEncoding.JSON.name,
+                        choices=[encoding.name for encoding in SaveEncoding],
+                        help="Encoding of the saved games, defaults to JSON")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="Skip games that can't be read")
+    parsed = parser.parse_args(args)
+    serializer = get_serializer(SaveEncoding[parsed.encoding])
+    # An absolute directory isn't joined to the serializer's Asset Type
+    output = None if parsed.output is None else path.abspath(parsed.output)
+
+    start = perf_counter()
+    games, plies = 0, 0
+    with open(parsed.file, "r", encoding=ENCODING, errors="replace") as file:
+        for game_data in read_pgn(file, parsed.skip_invalid):
+            if output is not None:
+                status = serializer.serialize(game_data, f"{games:08d}", output)
+                if status is not SerializeStatus.SUCCESFULL:
+                    parser.error(f"Can't save to {parsed.output}, {status.name}")
+            games += 1
+            plies += len(game_data.move_history)
+    elapsed = perf_counter() - start
+
+    print(f"Games: {games}, Plies: {plies}")
+    print(f"Time: {elapsed:.3f}s")
+    print(f"Games/s: {games / elapsed if elapsed > 0 else 0:.0f}")
+    print(f"Plies/s: {plies / elapsed if elapsed > 0 else 0:.0f}")
+
+if __name__ == "__main__":
+    main()
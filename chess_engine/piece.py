@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import cast
+from types import MappingProxyType
+from typing import Any, Mapping, cast
 
 from chess_engine.enums import MovSpecialCase, PieceType, SideColor
 from chess_engine.structs import Coord, Dir
@@ -17,18 +18,38 @@ NULL_PIECE_STR = " "*PIECE_STR_LENGTH
 
 SerPiece = tuple[str, tuple[int,int]]
 
-@dataclass
+# Integer encoding of pieces, the type code plus the black flag, 0 encodes no piece
+NULL_PIECE_CODE = 0
+BLACK_CODE_FLAG = 8
+TYPE_CODES = {
+    PieceType.PAWN : 1,
+    PieceType.BISHOP : 2,
+    PieceType.KNIGTH : 3,
+    PieceType.ROOK : 4,
+    PieceType.QUEEN : 5,
+    PieceType.KING : 6
+}
+PIECE_CODES = {(piece_type, color): code | (BLACK_CODE_FLAG if color == SideColor.BLACK else 0)
+               for piece_type, code in TYPE_CODES.items() for color in SideColor}
+CODE_PIECES = {code: piece for piece, code in PIECE_CODES.items()}
+
+@dataclass(slots=True)
 class Piece():
     """TODO
     """
     type: PieceType
     color: SideColor
     coord: Coord
-    movements: dict[Dir, MovSpecialCase]= field(init=False)
+    movements: Mapping[Dir, MovSpecialCase]= field(init=False)
+    code: int = field(init=False)
 
     def __post_init__(self) -> None:
-        moving_dir = WHITE_MOV_DIR if self.color == SideColor.WHITE else BLACK_MOV_DIR
-        self.movements = Piece.get_type_movements(self.type, moving_dir)
+        self.code = PIECE_CODES[(self.type, self.color)]
+        self.movements = TYPE_MOVEMENTS[self.code]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Copies and pickles rebuild the piece, sharing the movements table"""
+        return (Piece, (self.type, self.color, self.coord))
 
     def __str__(self) -> str:
         piece_str = f"{self.color.value}{self.type.value}"
@@ -38,14 +59,14 @@ class Piece():
 
     def __hash__(self) -> int:
         """Hash on type, color and coordinate"""
-        return hash((self.type, self.color, self.coord.row, self.coord.column))
+        return hash((self.code, self.coord))
 
     def __eq__(self, other: object) -> bool:
         """Equality on type, color and coordinate"""
         if not isinstance(other, Piece):
             return False
 
-        return hash(self) == hash(other)
+        return self.code == other.code and self.coord == other.coord
 
     def __ne__(self, other: object) -> bool:
         return not self == other
@@ -56,7 +77,7 @@ class Piece():
         if not isinstance(other, Piece):
             return False
 
-        return (self.type, self.color) == (other.type, other.color)
+        return self.code == other.code
 
     def can_extend(self) -> bool:
         """Get whether the piece has or not extendable movement
@@ -67,7 +88,7 @@ class Piece():
         Returns:
             bool: Extendable
         """
-        return self.type not in (PieceType.PAWN, PieceType.KING)
+        return self.type not in (PieceType.PAWN, PieceType.KNIGTH, PieceType.KING)
 
     @staticmethod
     def get_type_movements(piece_type: PieceType, mov_dir: int=0) -> dict[Dir, MovSpecialCase]:
@@ -145,6 +166,36 @@ class Piece():
         except EnumParseError:
             return None
 
+    @staticmethod
+    def encode(piece: OptPiece) -> int:
+        """Integer code of the piece, ignoring its coordinate
+
+        Args:
+            piece (OptPiece): Piece or None
+
+        Returns:
+            int: Code, NULL_PIECE_CODE for None
+        """
+        return NULL_PIECE_CODE if piece is None else piece.code
+
+    @staticmethod
+    def decode(code: int, coord: Coord) -> OptPiece:
+        """Piece of the integer code
+
+        Args:
+            code (int): Code
+            coord (Coord): Coordinate of the piece
+
+        Returns:
+            OptPiece: Piece, None for NULL_PIECE_CODE
+        """
+        if code == NULL_PIECE_CODE:
+            return None
+        if code not in CODE_PIECES:
+            raise ValueError(f"Invalid piece code {code}")
+        piece_type, color = CODE_PIECES[code]
+        return Piece(piece_type, color, coord)
+
     @staticmethod
     def get_str(piece: OptPiece) -> str:
         """TODO
@@ -164,3 +215,11 @@ class Piece():
         return Piece.from_str(ser[0], Coord(*ser[1]))
 
 OptPiece = Piece | None
+
+def _get_color_movements(piece_type: PieceType, color: SideColor) -> Mapping[Dir, MovSpecialCase]:
+    moving_dir = WHITE_MOV_DIR if color == SideColor.WHITE else BLACK_MOV_DIR
+    return MappingProxyType(Piece.get_type_movements(piece_type, moving_dir))
+
+# Movements by piece code, shared by every piece
+TYPE_MOVEMENTS = {code: _get_color_movements(piece_type, color)
+                  for (piece_type, color), code in PIECE_CODES.items()}
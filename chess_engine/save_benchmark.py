@@ -0,0 +1,153 @@
+"""This module contains the save benchmark, which compares the file size and the save and load
+times of the game data file formats of the Serializer, uncompressed and with every compression,
+and of a binary archive of the games, by history length. Compressed formats report their
+compression ratio and their throughput of uncompressed save data
+
+Execute
+py -m chess_engine.save_benchmark [--games N] [--plies 100,1000,10000]
+"""
+
+from __future__ import annotations
+
+import random
+from argparse import ArgumentParser
+from os import path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from chess_engine.enums import GameState
+from serialization.enums import (DeserializeStatus, SaveCompression,
+                                 SaveEncoding, SerializeStatus)
+from serialization.serializer import ARCHIVE_FILE_END, Serializer
+
+DEFAULT_GAMES = 5
+DEFAULT_PLIES = "100,1000,10000"
+
+def get_benchmark_game(plies: int, seed: int) -> ChessGameData:
+    """Game data of a random game, avoiding the moves which end the game while possible
+
+    Args:
+        plies (int): Plies of the game
+        seed (int): Random seed
+
+    Returns:
+        ChessGameData: Game data
+    """
+    rng = random.Random(seed)
+    game = ChessGame.new_game()
+    for _ in range(plies):
+        moves = list(game.legal_moves())
+        rng.shuffle(moves)
+        for move in moves:
+            game.attempt_legal_move(move)
+            if game.data.state == GameState.PENDING:
+                break
+            game.undo_move()
+        else:
+            break
+    return game.data
+
+def benchmark_serializer(serializer: Serializer[ChessGameData], datas: list[ChessGameData],
+                         dir_path: str) -> tuple[int, float, float]:
+    """Saves and loads the game datas
+
+    Args:
+        serializer (Serializer[ChessGameData]): Serializer
+        datas (list[ChessGameData]): Game datas
+        dir_path (str): Absolute directory to save to
+
+    Returns:
+        tuple[int, float, float]: Total size in bytes, and save and load times in seconds
+    """
+    start = perf_counter()
+    for i, data in enumerate(datas):
+        # An absolute directory replaces the asset type directory
+        if serializer.serialize(data, str(i), dir_path) is not SerializeStatus.SUCCESFULL:
+            raise RuntimeError(f"Game {i} couldn't be saved")
+    save_time = perf_counter() - start
+
+    start = perf_counter()
+    for i, data in enumerate(datas):
+        loaded, status = serializer.deserialize(str(i), dir_path)
+        if status is not DeserializeStatus.SUCCESFULL or loaded != data:
+            raise RuntimeError(f"Game {i} didn't load back")
+    load_time = perf_counter() - start
+
+    size = sum(path.getsize(path.join(dir_path, serializer.format.get_fullname(str(i))))
+               for i in range(len(datas)))
+    return size, save_time, load_time
+
+def benchmark_archive(serializer: Serializer[ChessGameData], datas: list[ChessGameData],
+                      dir_path: str) -> tuple[int, float, float]:
+    """Appends the game datas to an archive and loads them in random order
+
+    Args:
+        serializer (Serializer[ChessGameData]): Binary serializer
+        datas (list[ChessGameData]): Game datas
+        dir_path (str): Absolute directory to save to
+
+    Returns:
+        tuple[int, float, float]: Archive size in bytes, and save and load times in seconds
+    """
+    start = perf_counter()
+    with serializer.open_archive("archive", dir_path, writable=True) as archive:
+        archive.append(datas)
+    save_time = perf_counter() - start
+
+    indexes = list(range(len(datas)))
+    random.Random(0).shuffle(indexes)
+    start = perf_counter()
+    with serializer.open_archive("archive", dir_path) as archive:
+        for i in indexes:
+            if archive[i] != datas[i]:
+                raise RuntimeError(f"Game {i} didn't load back")
+    load_time = perf_counter() - start
+
+    archive_path = path.join(dir_path, serializer.format.get_fullname("archive"))
+    return path.getsize(archive_path + ARCHIVE_FILE_END), save_time, load_time
+
+def main(args: list[str] | None = None) -> None:
+    """Runs the save benchmark from the command line arguments
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.save_benchmark", description=__doc__)
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES,
+                        help="Games saved per history length")
+    parser.add_argument("--plies", default=DEFAULT_PLIES,
+                        help="Comma separated plies per game, defaults to 100, 1000 and 10000")
+    parsed = parser.parse_args(args)
+
+    for plies in sorted({int(p) for p in parsed.plies.split(',')}):
+        datas = [get_benchmark_game(plies, seed) for seed in range(parsed.games)]
+        for encoding in SaveEncoding:
+            # Uncompressed first, its size is the save data size
+            data_size = 0
+            for compression in SaveCompression:
+                with TemporaryDirectory() as dir_path:
+                    size, save_time, load_time = benchmark_serializer(
+                        get_serializer(encoding, compression), datas, dir_path)
+                if compression is SaveCompression.NONE:
+                    data_size = size
+                    name = encoding.name
+                else:
+                    name = f"{encoding.name}+{compression.name}"
+                print(f"Plies: {plies}, {name}: Size: {size / len(datas):.0f}B/game, "
+                      f"Ratio: {data_size / size:.2f}, "
+                      f"Save: {save_time / len(datas) * 1000:.3f}ms/game "
+                      f"({data_size / save_time / 1e6:.1f}MB/s), "
+                      f"Load: {load_time / len(datas) * 1000:.3f}ms/game "
+                      f"({data_size / load_time / 1e6:.1f}MB/s)")
+
+        with TemporaryDirectory() as dir_path:
+            size, save_time, load_time = benchmark_archive(get_serializer(SaveEncoding.BINARY),
+                                                           datas, dir_path)
+        print(f"Plies: {plies}, ARCHIVE: Size: {size / len(datas):.0f}B/game, "
+              f"Save: {save_time / len(datas) * 1000:.3f}ms/game, "
+              f"Load: {load_time / len(datas) * 1000:.3f}ms/game")
+
+if __name__ == "__main__":
+    main()
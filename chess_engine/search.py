@@ -0,0 +1,384 @@
+"""This module contains the search engine, an iterative deepening alpha-beta (negamax) search over
+the ChessGame rules for choosing a move
+
+Execute
+py -m chess_engine.search [--fen FEN] [--depth N] [--nodes N] [--time SECONDS] [--hash MB]
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from chess_engine.chess_game import START_FEN, ChessGame
+from chess_engine.chess_validator import LegalMove
+from chess_engine.enums import BoundType, GameState, SideColor, TurnState
+from chess_engine.evaluation import PIECE_VALUES
+from chess_engine.grid import Grid
+from chess_engine.perft import get_move_str
+from chess_engine.transposition import (DEFAULT_TABLE_MB, TableEntry,
+                                        TranspositionTable)
+from utils.errors import SearchLimitError
+
+DEFAULT_DEPTH = 4
+MAX_DEPTH = 64
+MATE_SCORE = 100_000
+INFINITE_SCORE = MATE_SCORE + 1
+# Nodes searched between time budget checks
+TIME_CHECK_INTERVAL = 256
+KILLERS_PER_PLY = 2
+
+# Move ordering scores, the table's move first, captures and promotions, then killer moves
+TABLE_MOVE_ORDER = INFINITE_SCORE - 1
+CAPTURE_ORDER = 10_000
+PROMOTION_ORDER = 9_000
+KILLER_ORDER = 8_000
+
+@dataclass
+class SearchLimits:
+    """Budget of a search, it stops at whichever limit is reached first, with no limit given it
+    searches up to DEFAULT_DEPTH
+
+    Attributes:
+        depth (int | None): Maximum depth in plies.
+        nodes (int | None): Maximum searched nodes.
+        time (float | None): Maximum time in seconds.
+    """
+
+    depth: int | None = None
+    nodes: int | None = None
+    time: float | None = None
+
+    def max_depth(self) -> int:
+        """Deepest iteration allowed by the limits
+
+        Returns:
+            int: Depth in plies
+        """
+        if self.depth is not None:
+            return min(self.depth, MAX_DEPTH)
+        return DEFAULT_DEPTH if self.nodes is None and self.time is None else MAX_DEPTH
+
+@dataclass
+class SearchResult:
+    """Result of a search
+
+    Attributes:
+        best_move (LegalMove | None): Best move found, None if there are no legal moves.
+        score (int): Score in centipawns for the side to move, mates are MATE_SCORE minus the
+            plies to mate.
+        depth (int): Depth of the last completed iteration.
+        pv (list[LegalMove]): Principal variation, starting with the best move.
+        nodes (int): Searched nodes.
+        time (float): Elapsed time in seconds.
+    """
+
+    best_move: LegalMove | None
+    score: int
+    depth: int
+    pv: list[LegalMove]
+    nodes: int
+    time: float
+
+    @property
+    def nps(self) -> float:
+        """Searched nodes per second"""
+        return self.nodes / self.time if self.time > 0 else 0
+
+def evaluate(game: ChessGame) -> int:
+    """Static evaluation of the game's position, material plus piece-square tables, kept up to
+    date by the grid on every move
+
+    Args:
+        game (ChessGame): Game
+
+    Returns:
+        int: Score in centipawns for the side to move
+    """
+    score = game.grid.evaluation
+    return score if game.data.turn == SideColor.WHITE else -score
+
+def best_move(game: ChessGame, limits: SearchLimits | None = None,
+              table: TranspositionTable | None = None) -> SearchResult:
+    """Searches the best move of the side to move
+
+    Args:
+        game (ChessGame): Game, left in the same position when done
+        limits (SearchLimits | None, optional): Budget, defaults to DEFAULT_DEPTH plies.
+            Defaults to None.
+        table (TranspositionTable | None, optional): Transposition table, reuse it across
+            searches of the same game to keep its entries, a new one if None. Defaults to None.
+
+    Returns:
+        SearchResult: Result of the deepest completed iteration
+    """
+    limits = SearchLimits() if limits is None else limits
+    table = TranspositionTable() if table is None else table
+    with game.unjournaled():
+        return Searcher(game, limits, table).search()
+
+def _to_table_score(score: int, ply: int) -> int:
+    # Mate scores are stored relative to the position, not to the root
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score + ply
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return score - ply
+    return score
+
+def _from_table_score(score: int, ply: int) -> int:
+    if score >= MATE_SCORE - MAX_DEPTH:
+        return score - ply
+    if score <= -(MATE_SCORE - MAX_DEPTH):
+        return score + ply
+    return score
+
+def _get_bound(score: int, alpha: int, beta: int) -> BoundType:
+    # Bound of a node's score given its alpha-beta window
+    if score <= alpha:
+        return BoundType.UPPER
+    if score >= beta:
+        return BoundType.LOWER
+    return BoundType.EXACT
+
+@dataclass
+class PvLine:
+    """Principal variation buffers of a node
+
+    Attributes:
+        previous (list[LegalMove]): Principal variation of the previous iteration, searched
+            first, empty if the node isn't on it.
+        moves (list[LegalMove]): Principal variation found from the node.
+    """
+
+    previous: list[LegalMove]
+    moves: list[LegalMove] = field(default_factory=list)
+
+    def get_previous_move(self, ply: int) -> LegalMove | None:
+        """Move of the previous principal variation at the ply
+
+        Args:
+            ply (int): Ply
+
+        Returns:
+            LegalMove | None: Move, None if the node isn't on the previous principal variation
+        """
+        return self.previous[ply] if ply < len(self.previous) else None
+
+    def get_child(self, ply: int, move: LegalMove) -> PvLine:
+        """Buffers of the child node reached by the move
+
+        Args:
+            ply (int): Ply of the node
+            move (LegalMove): Move
+
+        Returns:
+            PvLine: Child buffers, following the previous principal variation if the move is on
+                it
+        """
+        return PvLine(self.previous if move == self.get_previous_move(ply) else [])
+
+    def update(self, move: LegalMove, child: PvLine) -> None:
+        """Sets the node's principal variation to the move followed by the child's
+
+        Args:
+            move (LegalMove): Move
+            child (PvLine): Buffers of the child node reached by the move
+        """
+        self.moves[:] = [move] + child.moves
+
+@dataclass
+class Searcher:
+    """Iterative deepening negamax search with alpha-beta pruning over a game
+
+    Attributes:
+        game (ChessGame): Game searched, restored after every move tried.
+        limits (SearchLimits): Budget.
+        table (TranspositionTable): Transposition table.
+        nodes (int): Searched nodes.
+        iterations (list[SearchResult]): Results of the completed iterations, by depth.
+    """
+
+    game: ChessGame
+    limits: SearchLimits
+    table: TranspositionTable = field(default_factory=TranspositionTable)
+    nodes: int = field(init=False, default=0)
+    iterations: list[SearchResult] = field(init=False, default_factory=list)
+    _start: float = field(init=False, default=0)
+    _killers: list[list[LegalMove]] = field(init=False, default_factory=list)
+
+    def search(self) -> SearchResult:
+        """Runs the iterative deepening until the limits are reached
+
+        Returns:
+            SearchResult: Result of the deepest completed iteration
+        """
+        self._start = perf_counter()
+        self.nodes = 0
+        self.iterations = []
+        max_depth = self.limits.max_depth()
+        self._killers = [[] for _ in range(max_depth + 1)]
+
+        root_moves = list(self.game.legal_moves())
+        result = SearchResult(root_moves[0] if root_moves else None,
+                              self._terminal_score(0) if not root_moves else 0, 0, [], 0, 0)
+        pv: list[LegalMove] = []
+        for depth in range(1, max_depth + 1):
+            if not root_moves:
+                break
+            try:
+                line = PvLine(pv)
+                score = self._negamax(depth, 0, -INFINITE_SCORE, INFINITE_SCORE, line)
+            except SearchLimitError:
+                break
+            pv = line.moves
+            result = SearchResult(pv[0], score, depth, pv, self.nodes, 0)
+            self.iterations.append(result)
+            if abs(score) >= MATE_SCORE - MAX_DEPTH:
+                break
+
+        result.nodes = self.nodes
+        result.time = perf_counter() - self._start
+        return result
+
+    def _negamax(self, depth: int, ply: int, alpha: int, beta: int, line: PvLine) -> int:
+        self._count_node()
+        if depth == 0 or self._is_terminal():
+            return self._leaf_score(ply)
+
+        table_move, alpha, beta, table_score = self._probe_table(depth, ply, alpha, beta)
+        if table_score is not None:
+            return table_score
+
+        alpha_start = alpha
+        best_score, best = -INFINITE_SCORE, None
+        for move in self._ordered_moves(ply, line.get_previous_move(ply), table_move):
+            child = line.get_child(ply, move)
+            self.game.attempt_legal_move(move)
+            try:
+                score = -self._negamax(depth - 1, ply + 1, -beta, -alpha, child)
+            finally:
+                self.game.undo_move()
+
+            if score > best_score:
+                best_score, best = score, move
+            if score > alpha:
+                alpha = score
+                line.update(move, child)
+            if alpha >= beta:
+                self._save_killer(move, ply)
+                break
+
+        self.table.store(self.game.position_key, TableEntry(
+            depth, _get_bound(best_score, alpha_start, beta), _to_table_score(best_score, ply),
+            best))
+        return best_score
+
+    def _probe_table(self, depth: int, ply: int, alpha: int, beta: int
+                     ) -> tuple[LegalMove | None, int, int, int | None]:
+        # The table's move, the window narrowed by its bound, and its score if it cuts the node
+        entry = self.table.probe(self.game.position_key)
+        if entry is None:
+            return None, alpha, beta, None
+        if ply == 0 or entry.depth < depth:
+            return entry.move, alpha, beta, None
+
+        score = _from_table_score(entry.score, ply)
+        if entry.bound is BoundType.EXACT:
+            return entry.move, alpha, beta, score
+        if entry.bound is BoundType.LOWER:
+            alpha = max(alpha, score)
+        else:
+            beta = min(beta, score)
+        return entry.move, alpha, beta, score if alpha >= beta else None
+
+    def _is_terminal(self) -> bool:
+        if self.game.data.state != GameState.PENDING:
+            return True
+        return self.game.turn_state in (TurnState.CHECKMATE, TurnState.STALEMATE)
+
+    def _leaf_score(self, ply: int) -> int:
+        if self._is_terminal():
+            return self._terminal_score(ply)
+        return evaluate(self.game)
+
+    def _terminal_score(self, ply: int) -> int:
+        if self.game.turn_state == TurnState.CHECKMATE:
+            return -(MATE_SCORE - ply)
+        return 0
+
+    def _ordered_moves(self, ply: int, pv_move: LegalMove | None,
+                       table_move: LegalMove | None) -> list[LegalMove]:
+        grid = self.game.grid
+        killers = self._killers[ply] if ply < len(self._killers) else []
+
+        def order(move: LegalMove) -> int:
+            if move == pv_move:
+                return INFINITE_SCORE
+            if move == table_move:
+                return TABLE_MOVE_ORDER
+            return self._get_move_order(move, grid, killers)
+
+        return sorted(self.game.legal_moves(), key=order, reverse=True)
+
+    @staticmethod
+    def _get_move_order(move: LegalMove, grid: Grid, killers: list[LegalMove]) -> int:
+        origin, dest, promotion = move
+        o_piece, d_piece = grid.get_at(origin), grid.get_at(dest)
+        if d_piece is not None and o_piece is not None:
+            # Most valuable victim, least valuable attacker
+            return CAPTURE_ORDER + PIECE_VALUES[d_piece.type] - PIECE_VALUES[o_piece.type] // 10
+        if promotion is not None:
+            return PROMOTION_ORDER + PIECE_VALUES[promotion]
+        if move in killers:
+            return KILLER_ORDER
+        return 0
+
+    def _save_killer(self, move: LegalMove, ply: int) -> None:
+        if ply >= len(self._killers) or self.game.grid.get_at(move[1]) is not None:
+            return
+        killers = self._killers[ply]
+        if move in killers:
+            return
+        killers.insert(0, move)
+        del killers[KILLERS_PER_PLY:]
+
+    def _count_node(self) -> None:
+        self.nodes += 1
+        if self.limits.nodes is not None and self.nodes > self.limits.nodes:
+            raise SearchLimitError
+        if self.limits.time is not None and self.nodes % TIME_CHECK_INTERVAL == 0:
+            if perf_counter() - self._start >= self.limits.time:
+                raise SearchLimitError
+
+def main(args: list[str] | None = None) -> None:
+    """Runs a search from the command line arguments
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.search", description=__doc__)
+    parser.add_argument("--fen", default=START_FEN, help="Position, defaults to the start")
+    parser.add_argument("--depth", type=int, default=None, help="Maximum depth in plies")
+    parser.add_argument("--nodes", type=int, default=None, help="Maximum searched nodes")
+    parser.add_argument("--time", type=float, default=None, help="Maximum time in seconds")
+    parser.add_argument("--hash", type=float, default=DEFAULT_TABLE_MB,
+                        help="Transposition table size in MB")
+    parsed = parser.parse_args(args)
+
+    game = ChessGame.from_fen(parsed.fen)
+    table = TranspositionTable(parsed.hash)
+    result = best_move(game, SearchLimits(parsed.depth, parsed.nodes, parsed.time), table)
+
+    best = "none" if result.best_move is None else get_move_str(result.best_move)
+    print(f"Best move: {best}")
+    print(f"Score: {result.score}")
+    print(f"Depth: {result.depth}")
+    print(f"PV: {' '.join(get_move_str(move) for move in result.pv)}")
+    print(f"Nodes: {result.nodes}")
+    print(f"Time: {result.time:.3f}s")
+    print(f"Nodes/s: {result.nps:.0f}")
+    print(f"Table hit rate: {table.hit_rate:.2%}")
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from math import copysign
 from typing import NamedTuple
 
+BOARD_SIZE = 8
 
 class Coord(NamedTuple):
     """Represents a coordinate
@@ -32,15 +33,22 @@ class Coord(NamedTuple):
         """
         return Coord(self.row+(direction.row*factor), self.column+(direction.column*factor))
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Coord):
-            return False
-        return self.row == other.row and self.column == other.column
+    @property
+    def square(self) -> int:
+        """Index of the coordinate, from 0 (a8) to 63 (h1)"""
+        return self.row * BOARD_SIZE + self.column
 
-    def __ne__(self, other: object) -> bool:
-        if not isinstance(other, Coord):
-            return True
-        return self.row != other.row or self.column != other.column
+    @staticmethod
+    def from_square(square: int) -> Coord:
+        """Coordinate of the square index, shared by every caller
+
+        Args:
+            square (int): Square index, from 0 (a8) to 63 (h1)
+
+        Returns:
+            Coord: Coordinate
+        """
+        return SQUARE_COORDS[square]
 
 class Dir(NamedTuple):
     """Represents a direction
@@ -56,7 +64,7 @@ class Dir(NamedTuple):
     def normalized(self) -> Dir:
         """TODO
         """
-        if self.row != 0 and self.column != 0 and self.row != self.column:
+        if self.row != 0 and self.column != 0 and abs(self.row) != abs(self.column):
             return self
         row = 0 if self.row == 0 else int(copysign(1, self.row))
         column = 0 if self.column == 0 else int(copysign(1, self.column))
@@ -67,18 +75,8 @@ class Dir(NamedTuple):
         """
         return (self.row, self.column)
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Dir):
-            return False
-        return self.row == other.row and self.column == other.column
-
-    def __ne__(self, other: object) -> bool:
-        if not isinstance(other, Dir):
-            return True
-        return self.row != other.row or self.column != other.column
-
-    def __hash__(self) -> int:
-        return hash((self.row, self.column))
+# Coordinates by square index
+SQUARE_COORDS = tuple(Coord(*divmod(square, BOARD_SIZE)) for square in range(BOARD_SIZE**2))
 
 class CastlingState(NamedTuple):
     """Represents the castling state of a player
@@ -0,0 +1,183 @@
+"""This module contains the TranspositionTable class, a fixed size table of searched positions by
+position key, preallocated from a memory budget"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from chess_engine.chess_validator import LegalMove
+from chess_engine.enums import BoundType
+from chess_engine.piece import TYPE_CODES
+from chess_engine.structs import Coord
+
+DEFAULT_TABLE_MB = 16
+BUCKET_SIZE = 2
+# Bytes per entry, key (8), score (4), depth (1), bound (1) and move (2)
+ENTRY_BYTES = 16
+NULL_MOVE_CODE = 0
+_EMPTY_BOUND = 0
+_SQUARE_BITS = 6
+_SQUARE_MASK = (1 << _SQUARE_BITS) - 1
+_CODE_TYPES = {code: piece_type for piece_type, code in TYPE_CODES.items()}
+_BOUND_CODES = {bound: i for i, bound in enumerate(BoundType, start=1)}
+_CODE_BOUNDS = {i: bound for bound, i in _BOUND_CODES.items()}
+
+def encode_move(move: LegalMove) -> int:
+    """Integer code of the move, the origin and destination squares and the promotion type code
+
+    Args:
+        move (LegalMove): Move
+
+    Returns:
+        int: Code, fits in 16 bits
+    """
+    origin, dest, promotion = move
+    promotion_code = 0 if promotion is None else TYPE_CODES[promotion]
+    return origin.square | dest.square << _SQUARE_BITS | promotion_code << 2 * _SQUARE_BITS
+
+def decode_move(code: int) -> LegalMove:
+    """Move of the integer code
+
+    Args:
+        code (int): Code
+
+    Returns:
+        LegalMove: Move
+    """
+    origin = Coord.from_square(code & _SQUARE_MASK)
+    dest = Coord.from_square(code >> _SQUARE_BITS & _SQUARE_MASK)
+    promotion_code = code >> 2 * _SQUARE_BITS
+    return origin, dest, None if promotion_code == 0 else _CODE_TYPES[promotion_code]
+
+class TableEntry(NamedTuple):
+    """Searched position
+
+    Attributes:
+        depth (int): Depth searched in plies.
+        bound (BoundType): How the score bounds the position's true score.
+        score (int): Score for the side to move.
+        move (LegalMove | None): Best move found, if any.
+    """
+
+    depth: int
+    bound: BoundType
+    score: int
+    move: LegalMove | None
+
+@dataclass
+class TranspositionTable:
+    """Searched positions by position key, in buckets of a depth preferred slot, replaced only
+    by deeper searches, and an always replaced slot
+
+    Attributes:
+        size_mb (float): Memory budget in megabytes.
+        hits (int): Probes which found the position.
+        misses (int): Probes which didn't find the position.
+        stores (int): Stored entries.
+        overwrites (int): Stored entries which replaced another position.
+    """
+
+    size_mb: float = DEFAULT_TABLE_MB
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    stores: int = field(init=False, default=0)
+    overwrites: int = field(init=False, default=0)
+    _buckets: int = field(init=False)
+    _keys: array[int] = field(init=False)
+    _scores: array[int] = field(init=False)
+    _depths: array[int] = field(init=False)
+    _bounds: array[int] = field(init=False)
+    _moves: array[int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._buckets = int(self.size_mb * 2**20) // (ENTRY_BYTES * BUCKET_SIZE)
+        if self._buckets <= 0:
+            raise ValueError("The table must hold at least one bucket")
+
+        entries = self._buckets * BUCKET_SIZE
+        self._keys = array('Q', bytes(8 * entries))
+        self._scores = array('i', bytes(4 * entries))
+        self._depths = array('b', bytes(entries))
+        self._bounds = array('B', bytes(entries))
+        self._moves = array('H', bytes(2 * entries))
+
+    @property
+    def capacity(self) -> int:
+        """Maximum amount of entries"""
+        return self._buckets * BUCKET_SIZE
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the probes which found the position"""
+        probes = self.hits + self.misses
+        return self.hits / probes if probes > 0 else 0
+
+    def usage(self) -> float:
+        """Fraction of the entries in use, counted by scanning the table
+
+        Returns:
+            float: Usage
+        """
+        return (self.capacity - self._bounds.count(_EMPTY_BOUND)) / self.capacity
+
+    def probe(self, key: int) -> TableEntry | None:
+        """Entry of the position
+
+        Args:
+            key (int): Position key
+
+        Returns:
+            TableEntry | None: Entry, None if the position isn't stored
+        """
+        index = self._find(key)
+        if index is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        move_code = self._moves[index]
+        move = None if move_code == NULL_MOVE_CODE else decode_move(move_code)
+        return TableEntry(self._depths[index], _CODE_BOUNDS[self._bounds[index]],
+                          self._scores[index], move)
+
+    def store(self, key: int, entry: TableEntry) -> None:
+        """Stores the entry of the position, in place if already stored, else in the depth
+        preferred slot if it's empty or holds a shallower search, and in the always replaced slot
+        otherwise
+
+        Args:
+            key (int): Position key
+            entry (TableEntry): Entry
+        """
+        first = (key % self._buckets) * BUCKET_SIZE
+        index = self._find(key)
+        if index is None:
+            preferred = self._bounds[first] == _EMPTY_BOUND or self._depths[first] <= entry.depth
+            index = first if preferred else first + 1
+            if self._bounds[index] != _EMPTY_BOUND:
+                self.overwrites += 1
+
+        self.stores += 1
+        self._keys[index] = key
+        self._scores[index] = entry.score
+        self._depths[index] = entry.depth
+        self._bounds[index] = _BOUND_CODES[entry.bound]
+        self._moves[index] = NULL_MOVE_CODE if entry.move is None else encode_move(entry.move)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters
+        """
+        self._bounds = array('B', bytes(self.capacity))
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def _find(self, key: int) -> int | None:
+        first = (key % self._buckets) * BUCKET_SIZE
+        for index in range(first, first + BUCKET_SIZE):
+            if self._keys[index] == key and self._bounds[index] != _EMPTY_BOUND:
+                return index
+        return None
@@ -0,0 +1,185 @@
+"""This module contains the archive validation, which validates a directory of saved games in a
+process pool, writing a JSONL report with a record per save
+
+A save is a Serializer[ChessGameData] file of any encoding and compression, loaded through the
+Serializer, its move history must replay legally from its start position and reach the saved
+turn, castling states and move counters
+
+Execute
+py -m chess_engine.validate_archive DIR [--workers N] [--output REPORT]
+"""
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from json import dumps
+from os import cpu_count, path, scandir
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, TextIO, TypeVar
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from chess_engine.enums import GameState
+from serialization.enums import SaveCompression, SaveEncoding
+from serialization.serializer import ENCODING, Serializer
+from utils.errors import (EnumParseError, GridInvalidCoordError,
+                          InvalidChessGameError, InvalidGridError,
+                          InvalidMoveHistoryError)
+
+# Saves submitted to the pool per worker ahead of the report
+PENDING_PER_WORKER = 8
+
+def _get_save_serializer(encoding: SaveEncoding,
+                         compression: SaveCompression) -> Serializer[ChessGameData]:
+    serializer = get_serializer(encoding, compression)
+    # Validating doesn't write an index into the directory
+    serializer.use_index = False
+    return serializer
+
+# Serializers of every save format
+SAVE_SERIALIZERS = [_get_save_serializer(encoding, compression)
+                    for encoding in SaveEncoding for compression in SaveCompression]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def iter_saves(dir_path: str) -> Iterator[str]:
+    """Yields the paths of the save files in the directory, of any save format, sorted by name,
+    without reading them
+
+    Args:
+        dir_path (str): Directory
+
+    Yields:
+        str: Save file path
+    """
+    with scandir(dir_path) as entries:
+        names = sorted(e.name for e in entries
+                       if e.is_file() and get_save_serializer(e.name) is not None)
+    for name in names:
+        yield path.join(dir_path, name)
+
+def get_save_serializer(name: str) -> Serializer[ChessGameData] | None:
+    """Serializer of the save file's format
+
+    Args:
+        name (str): Full filename
+
+    Returns:
+        Serializer[ChessGameData] | None: Serializer, None if isn't a save
+    """
+    for serializer in SAVE_SERIALIZERS:
+        if serializer.format.is_of_format(name):
+            return serializer
+    return None
+
+def validate_save(file_path: str) -> dict[str, Any]:
+    """Validates a save file, runs in the worker processes
+
+    Args:
+        file_path (str): Save file path
+
+    Returns:
+        dict[str, Any]: Report record, with the file, whether is valid, the plies of its history,
+            the first illegal ply and the error, if any
+    """
+    record: dict[str, Any] = {"file": file_path, "valid": False, "plies": None,
+                              "first_bad_ply": None, "error": None}
+    dir_path, name = path.split(file_path)
+    serializer = get_save_serializer(name)
+    if serializer is None:
+        record["error"] = "Not a save file"
+        return record
+    file_format = serializer.format
+    try:
+        game_data, status = serializer.deserialize(
+            name[len(file_format.file_prefix):-len(file_format.file_end)], path.abspath(dir_path))
+        if game_data is None:
+            record["error"] = f"Can't load the save, {status.name}"
+            return record
+        record["plies"] = len(game_data.move_history)
+
+        game = ChessGame.replay(game_data)
+        # The saved data over the replayed grid, a decisive state may be a resignation
+        saved_fen = ChessGame(game.grid, game_data, validate=False).to_fen()
+        if saved_fen != game.to_fen():
+            record["error"] = f"Saved position {saved_fen} doesn't match the move history's " \
+                f"{game.to_fen()}"
+        elif game.data.state not in (GameState.PENDING, game_data.state):
+            record["error"] = "Saved state doesn't match the move history"
+        else:
+            record["valid"] = True
+    except InvalidMoveHistoryError as e:
+        record["first_bad_ply"] = e.ply
+        record["error"] = str(e)
+    except (OSError, TypeError, ValueError, EnumParseError, GridInvalidCoordError,
+            InvalidGridError, InvalidChessGameError) as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+def _bounded_map(executor: Executor, func: Callable[[T], R], items: Iterable[T],
+                 max_pending: int) -> Iterator[R]:
+    pending: deque[Future[R]] = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def validate_archive(dir_path: str, workers: int, report: TextIO) -> tuple[int, int]:
+    """Validates the saves in the directory, writing a report record per save in file order
+
+    Args:
+        dir_path (str): Directory
+        workers (int): Worker processes, validates in this process if 1
+        report (TextIO): JSONL report output
+
+    Returns:
+        tuple[int, int]: Validated saves and valid saves counts
+    """
+    saves = iter_saves(dir_path)
+    if workers <= 1:
+        return _write_records(map(validate_save, saves), report)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        records = _bounded_map(executor, validate_save, saves, workers * PENDING_PER_WORKER)
+        return _write_records(records, report)
+
+def _write_records(records: Iterator[dict[str, Any]], report: TextIO) -> tuple[int, int]:
+    total, valid = 0, 0
+    for record in records:
+        report.write(dumps(record) + "\n")
+        total += 1
+        valid += record["valid"]
+    return total, valid
+
+def main(args: list[str] | None = None) -> None:
+    """Runs the archive validation from the command line arguments
+
+    Args:
+        args (list[str] | None, optional): Arguments, defaults to sys.argv. Defaults to None.
+    """
+    parser = ArgumentParser(prog="chess_engine.validate_archive", description=__doc__)
+    parser.add_argument("dir", help="Directory of saves")
+    parser.add_argument("--workers", type=int, default=cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--output", default=None, help="JSONL report file, defaults to stdout")
+    parsed = parser.parse_args(args)
+
+    start = perf_counter()
+    if parsed.output is None:
+        total, valid = validate_archive(parsed.dir, parsed.workers, sys.stdout)
+    else:
+        with open(parsed.output, "w", encoding=ENCODING) as report:
+            total, valid = validate_archive(parsed.dir, parsed.workers, report)
+    elapsed = perf_counter() - start
+
+    print(f"Games: {total}, Valid: {valid}, Invalid: {total - valid}", file=sys.stderr)
+    print(f"Time: {elapsed:.3f}s", file=sys.stderr)
+    print(f"Games/s: {total / elapsed if elapsed > 0 else 0:.0f}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
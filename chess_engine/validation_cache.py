@@ -0,0 +1,99 @@
+"""This module contains the ValidationCache class, a bounded cache of move validations by position
+key, shared between games or owned by a single one"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from chess_engine.enums import ValidationStatus
+from chess_engine.structs import Coord
+
+DEFAULT_MAX_POSITIONS = 4096
+
+CachedMovements = dict[tuple[Coord, Coord], ValidationStatus]
+
+@dataclass
+class ValidationCache:
+    """Move validations by position key, evicting the least recently used position when full
+
+    Attributes:
+        max_positions (int): Maximum amount of positions cached.
+        hits (int): Lookups which found a cached validation.
+        misses (int): Lookups which didn't find a cached validation.
+    """
+
+    max_positions: int = DEFAULT_MAX_POSITIONS
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    _positions: OrderedDict[int, CachedMovements] = field(init=False, default_factory=OrderedDict)
+    # Shortcut for the consecutive lookups on the same position
+    _last_key: int | None = field(init=False, default=None)
+    _last_movements: CachedMovements = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.max_positions <= 0:
+            raise ValueError("The cache must hold at least one position")
+
+    def get(self, key: int, mov: tuple[Coord, Coord]) -> ValidationStatus | None:
+        """Cached validation of the move in the position
+
+        Args:
+            key (int): Position key
+            mov (tuple[Coord, Coord]): Origin and destination
+
+        Returns:
+            ValidationStatus | None: Validation, None if not cached
+        """
+        movements = self._find_movements(key)
+        status = None if movements is None else movements.get(mov, None)
+        if status is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return status
+
+    def save(self, key: int, mov: tuple[Coord, Coord], status: ValidationStatus) -> None:
+        """Caches the validation of the move in the position
+
+        Args:
+            key (int): Position key
+            mov (tuple[Coord, Coord]): Origin and destination
+            status (ValidationStatus): Validation
+        """
+        movements = self._find_movements(key)
+        if movements is None:
+            movements = {}
+            self._positions[key] = movements
+            if len(self._positions) > self.max_positions:
+                self._positions.popitem(last=False)
+            self._last_key, self._last_movements = key, movements
+        movements[mov] = status
+
+    def clear(self) -> None:
+        """Removes every cached position and resets the counters
+        """
+        self._positions.clear()
+        self._last_key = None
+        self._last_movements = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of the lookups which found a cached validation"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _find_movements(self, key: int) -> CachedMovements | None:
+        if key == self._last_key:
+            return self._last_movements
+
+        movements = self._positions.get(key, None)
+        if movements is not None:
+            self._positions.move_to_end(key)
+            self._last_key, self._last_movements = key, movements
+        return movements
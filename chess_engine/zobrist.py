@@ -0,0 +1,58 @@
+"""This module contains the Zobrist keys, which hash chess positions into 64 bit integers that
+can be updated incrementally by xoring the keys of what changed"""
+
+from random import Random
+
+from chess_engine.bitboard import BOARD_SIZE, SQUARES
+from chess_engine.enums import PieceType, SideColor
+from chess_engine.piece import PIECE_CODES, Piece
+from chess_engine.structs import CastlingState, Coord
+
+# Fixed seed, so keys are stable across runs and processes
+ZOBRIST_SEED = 0x5EED_C4E55
+_random = Random(ZOBRIST_SEED)
+
+_TYPE_KEYS = {(color, piece_type): [_random.getrandbits(64) for _ in range(SQUARES)]
+              for color in SideColor for piece_type in PieceType}
+# Keys by piece code, indexed by square
+PIECE_KEYS = {PIECE_CODES[(piece_type, color)]: keys
+              for (color, piece_type), keys in _TYPE_KEYS.items()}
+BLACK_TURN_KEY = _random.getrandbits(64)
+# Pairs of (left, right) castling keys
+CASTLING_KEYS = {color: (_random.getrandbits(64), _random.getrandbits(64)) for color in SideColor}
+EN_PASSANT_KEYS = [_random.getrandbits(64) for _ in range(BOARD_SIZE)]
+
+def get_piece_key(piece: Piece, coord: Coord) -> int:
+    """Key of the piece placed in the coordinate
+
+    Args:
+        piece (Piece): Piece
+        coord (Coord): Coordinate
+
+    Returns:
+        int: Key
+    """
+    return PIECE_KEYS[piece.code][coord.square]
+
+def get_state_key(turn: SideColor, castling: tuple[CastlingState, CastlingState],
+                  en_passant_column: int | None) -> int:
+    """Key of the position state besides the piece placement
+
+    Args:
+        turn (SideColor): Side to move
+        castling (tuple[CastlingState, CastlingState]): White and black castling states
+        en_passant_column (int | None): Column of the en passant target, if any
+
+    Returns:
+        int: Key
+    """
+    key = BLACK_TURN_KEY if turn == SideColor.BLACK else 0
+    for color, castling_state in zip(SideColor, castling):
+        left_key, right_key = CASTLING_KEYS[color]
+        if castling_state.left:
+            key ^= left_key
+        if castling_state.right:
+            key ^= right_key
+    if en_passant_column is not None:
+        key ^= EN_PASSANT_KEYS[en_passant_column]
+    return key
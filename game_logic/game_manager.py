@@ -5,9 +5,13 @@ from typing import Any, Type
 import pygame
 
 from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from game_logic.consts import MAX_GAMES_SAVED
 from game_logic.events import Event, Pyevent
 from game_logic.input_manager import InputManager
 from game_logic.scene import Scene
+from serialization.enums import SaveEncoding, SaveState
+from serialization.save_queue import SaveQueue
 from ui.font import Font
 from utils.errors import StaticClassInstanceError
 
@@ -22,6 +26,8 @@ class GameManager():
     current_scene: Scene
     current_game: ChessGame
     loaded_game: int = -1
+    save_queue = SaveQueue[ChessGameData](
+        get_serializer(SaveEncoding.JSON, max_saves_count=MAX_GAMES_SAVED))
     pygame_events: dict[int, Event[Pyevent]] = {
         pygame.QUIT : Event[Pyevent](),
         pygame.MOUSEBUTTONDOWN : Event[Pyevent](),
@@ -68,11 +74,24 @@ class GameManager():
         """
         cls.current_scene = scene_type(cls.screen, **kwargs)
 
+    @classmethod
+    def autosave(cls) -> None:
+        """Requests the save of the current game as the loaded game, written in the background
+        """
+        cls.save_queue.save(cls.current_game.data, str(cls.loaded_game))
+
+    @classmethod
+    def get_save_state(cls) -> SaveState:
+        """State of the save of the loaded game, for showing it's saved
+        """
+        return cls.save_queue.get_state(str(cls.loaded_game))
+
     @classmethod
     def quit(cls) -> None:
-        """Get's out of the game loop
+        """Get's out of the game loop, waiting for the requested saves
         """
         cls.running = False
+        cls.save_queue.close()
 
     def __init__(self) -> None:
         raise StaticClassInstanceError(GameManager)
@@ -0,0 +1,198 @@
+"""This module contains the Archive class, a single file of many binary encoded objects, read
+through a memory map with random access to any of them
+
+The archive is a header with the magic and version, the records, an index with the offset of
+each record and a footer with the offset of the index and the records count. Records are the
+object's binary encoding prefixed by its size and checksum, so an archive whose index was lost
+by a crash while appending is rebuilt scanning them"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from mmap import ACCESS_READ, mmap
+from os import path
+from struct import Struct
+from typing import Any, BinaryIO, Callable, Generic, Iterable, Iterator, TypeVar
+from zlib import crc32
+
+from serialization.serializable import BinarySerializable
+
+ARCHIVE_MAGIC = b"SARC"
+ARCHIVE_VERSION = 1
+ARCHIVE_HEADER = Struct("<4sI")
+# Size and checksum of the record
+RECORD_HEADER = Struct("<II")
+INDEX_ENTRY = Struct("<Q")
+INDEX_MAGIC = b"AIDX"
+# Offset of the index, records count and magic
+ARCHIVE_FOOTER = Struct("<QQ4s")
+
+Obj = TypeVar("Obj")
+
+@dataclass
+class Archive(Generic[Obj]):
+    """Archive file of binary encoded objects, open until closed, which may be used as a context
+    manager. Objects are decoded straight from the memory map of the file, the constructor must
+    copy the parts of its data it keeps
+
+    Attributes:
+        file_path (str): Path of the archive
+        constructor (Callable[..., Obj]): Constructor of the objects from their binary encoding
+        writable (bool): Whether objects can be appended
+    """
+
+    file_path: str
+    constructor: Callable[..., Obj]
+    writable: bool = False
+    _file: BinaryIO = field(init=False, repr=False)
+    _map: mmap | None = field(init=False, repr=False, default=None)
+    _offsets: array[int] = field(init=False, repr=False, default_factory=lambda: array("Q"))
+    _index_offset: int = field(init=False, repr=False, default=ARCHIVE_HEADER.size)
+
+    def __post_init__(self) -> None:
+        if self.writable and not path.isfile(self.file_path):
+            with open(self.file_path, "wb") as file:
+                file.write(ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION))
+                file.write(ARCHIVE_FOOTER.pack(ARCHIVE_HEADER.size, 0, INDEX_MAGIC))
+        # Kept open until closed, or closed here if it can't be mapped
+        # pylint: disable-next=consider-using-with
+        self._file = open(self.file_path, "r+b" if self.writable else "rb")
+        try:
+            self._map_file()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self) -> Archive[Obj]:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> Obj:
+        return self.get(index)
+
+    def __iter__(self) -> Iterator[Obj]:
+        return self.iter_objs()
+
+    def get(self, index: int, **kwargs: Any) -> Obj:
+        """Decodes the object at the index of the archive
+
+        Args:
+            index (int): Index, negative ones count from the end
+            **kwargs (Any): Additional arguments for the constructor
+
+        Returns:
+            Obj: Object
+        """
+        if self._map is None:
+            raise ValueError("Archive is closed")
+        offset = self._offsets[index]
+        size, _ = RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + RECORD_HEADER.size
+        with memoryview(self._map) as view, view[start:start + size] as data:
+            return self.constructor(data, **kwargs)
+
+    def iter_objs(self, **kwargs: Any) -> Iterator[Obj]:
+        """Iterates the objects of the archive in order
+
+        Args:
+            **kwargs (Any): Additional arguments for the constructor
+
+        Yields:
+            Obj: Object
+        """
+        for index in range(len(self)):
+            yield self.get(index, **kwargs)
+
+    def append(self, objs: Iterable[BinarySerializable]) -> int:
+        """Appends the objects to the archive, rewriting the index once
+
+        Args:
+            objs (Iterable[BinarySerializable]): Objects
+
+        Returns:
+            int: Objects appended
+        """
+        if not self.writable:
+            raise ValueError("Archive isn't writable")
+        count = len(self)
+        offsets = array("Q", self._offsets)
+        offset = self._index_offset
+        self._unmap_file()
+        try:
+            self._file.seek(offset)
+            for obj in objs:
+                data = obj.get_serialization_bytes()
+                self._file.write(RECORD_HEADER.pack(len(data), crc32(data)))
+                self._file.write(data)
+                offsets.append(offset)
+                offset += RECORD_HEADER.size + len(data)
+
+            self._file.write(_pack_offsets(offsets))
+            self._file.write(ARCHIVE_FOOTER.pack(offset, len(offsets), INDEX_MAGIC))
+            self._file.truncate()
+        finally:
+            # Rebuilds the index of the records written if interrupted
+            self._file.flush()
+            self._map_file()
+        return len(self) - count
+
+    def close(self) -> None:
+        """Closes the archive"""
+        self._unmap_file()
+        self._file.close()
+
+    def _map_file(self) -> None:
+        self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        if len(self._map) < ARCHIVE_HEADER.size or \
+            ARCHIVE_HEADER.unpack_from(self._map) != (ARCHIVE_MAGIC, ARCHIVE_VERSION):
+            self._unmap_file()
+            raise ValueError(f"{self.file_path} isn't an archive")
+
+        if len(self._map) >= ARCHIVE_HEADER.size + ARCHIVE_FOOTER.size:
+            index_offset, count, magic = ARCHIVE_FOOTER.unpack_from(
+                self._map, len(self._map) - ARCHIVE_FOOTER.size)
+            index_end = index_offset + count * INDEX_ENTRY.size
+            if magic == INDEX_MAGIC and index_end == len(self._map) - ARCHIVE_FOOTER.size:
+                self._index_offset = index_offset
+                self._offsets = _unpack_offsets(self._map[index_offset:index_end])
+                return
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        # Scans the records up to the first incomplete one
+        assert self._map is not None
+        self._offsets = array("Q")
+        offset = ARCHIVE_HEADER.size
+        while offset + RECORD_HEADER.size <= len(self._map):
+            size, checksum = RECORD_HEADER.unpack_from(self._map, offset)
+            start = offset + RECORD_HEADER.size
+            if start + size > len(self._map) or crc32(self._map[start:start + size]) != checksum:
+                break
+            self._offsets.append(offset)
+            offset = start + size
+        self._index_offset = offset
+
+    def _unmap_file(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+def _pack_offsets(offsets: array[int]) -> bytes:
+    if sys.byteorder == "little":
+        return offsets.tobytes()
+    offsets = array("Q", offsets)
+    offsets.byteswap()
+    return offsets.tobytes()
+
+def _unpack_offsets(data: bytes) -> array[int]:
+    offsets = array("Q", data)
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    return offsets
@@ -17,3 +17,27 @@ class DeserializeStatus(Enum):
     SUCCESFULL = auto()
     NOT_FOUND = auto()
     MISSING_ATTRS = auto()
+    CORRUPTED = auto()
+
+class SaveEncoding(Enum):
+    """Encoding of the saved files
+    """
+    JSON = auto()
+    BINARY = auto()
+
+class SaveCompression(Enum):
+    """Compression of the saved files, selected by their extension
+    """
+    NONE = auto()
+    ZLIB = auto()
+    LZMA = auto()
+    BZ2 = auto()
+
+class SaveState(Enum):
+    """State of the saves requested to a SaveQueue
+    """
+    NOT_REQUESTED = auto()
+    PENDING = auto()
+    SAVING = auto()
+    SAVED = auto()
+    FAILED = auto()
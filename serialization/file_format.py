@@ -1,8 +1,29 @@
 """This module contains the FileFormat class """
 
+import bz2
+import gzip
+import lzma
 from dataclasses import dataclass
+from typing import IO, Any, Callable
+from zlib import error as ZlibError
 
 from game_logic.consts import AssetType
+from serialization.enums import SaveCompression, SaveEncoding
+
+# Extension of the compressed files, after the format's, and their stream opener, ZLIB files are
+# gzip streams, the zlib deflate stream in the gzip container
+COMPRESSION_EXTENSIONS = {
+    SaveCompression.ZLIB : "gz",
+    SaveCompression.LZMA : "xz",
+    SaveCompression.BZ2 : "bz2"
+}
+COMPRESSION_OPENERS: dict[SaveCompression, Callable[..., IO[Any]]] = {
+    SaveCompression.ZLIB : gzip.open,
+    SaveCompression.LZMA : lzma.open,
+    SaveCompression.BZ2 : bz2.open
+}
+# Raised reading invalid or truncated compressed files
+COMPRESSION_ERRORS = (EOFError, OSError, lzma.LZMAError, ZlibError)
 
 
 @dataclass
@@ -10,14 +31,16 @@ class FileFormat():
     """Represents the naming format for serialization
 
     Attributes:
-        file_end (str): _description_
+        file_end (str): _description_, ending in a compression extension for compressed files
         file_prefix (str): _description_
         asset_type (AssetType): _description_
+        encoding (SaveEncoding): Encoding of the files, JSON or the objects' binary encoding
 
     """
     file_end: str
     file_prefix: str
     asset_type: AssetType
+    encoding: SaveEncoding = SaveEncoding.JSON
 
     def is_valid_format(self, extension: str) -> bool:
         """Whether the format matches the extension
@@ -28,7 +51,39 @@ class FileFormat():
         Returns:
             bool: Whether is valid
         """
-        return self.file_end.endswith(extension)
+        return self.payload_end.endswith(extension)
+
+    @property
+    def compression(self) -> SaveCompression:
+        """Compression of the files, by the extension of the file end"""
+        for compression, extension in COMPRESSION_EXTENSIONS.items():
+            if self.file_end.endswith(f".{extension}"):
+                return compression
+        return SaveCompression.NONE
+
+    @property
+    def payload_end(self) -> str:
+        """File end without the compression extension"""
+        if self.compression is SaveCompression.NONE:
+            return self.file_end
+        return self.file_end[:-len(COMPRESSION_EXTENSIONS[self.compression]) - 1]
+
+    def open_file(self, file_path: str, mode: str, encoding: str | None = None) -> IO[Any]:
+        """Opens a file of this format, compressing or decompressing its contents as they are
+        streamed if compressed
+
+        Args:
+            file_path (str): Path
+            mode (str): "r" or "w", plus "b" for binary
+            encoding (str | None, optional): Text encoding. Defaults to None.
+
+        Returns:
+            IO[Any]: File object
+        """
+        opener = COMPRESSION_OPENERS.get(self.compression)
+        if opener is None:
+            return open(file_path, mode, encoding=encoding)
+        return opener(file_path, mode if "b" in mode else f"{mode}t", encoding=encoding)
 
     def is_of_format(self, file: str) -> bool:
         """If the file is of this format
@@ -0,0 +1,216 @@
+"""This module contains the SaveIndex class, a persisted index of the saves of a directory caching
+their metadata, so listing them doesn't stat nor open every save, and listing their metadata
+only stats them. Changes to single saves are
+appended to a log of the index, which is compacted into it once it has as many changes as saves
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from json import JSONDecodeError, dump, dumps, load, loads
+from os import listdir, makedirs, path, remove, replace, stat
+from typing import Any, Callable, NamedTuple
+
+# The index is kept in a sub directory, so writing it doesn't change the saves directory mtime
+INDEX_DIR = ".index"
+INDEX_FILE_END = ".index.json"
+INDEX_LOG_END = ".index.log"
+MIN_LOG_RECORDS = 64
+INDEX_VERSION = 1
+INDEX_ENCODING = "utf-8"
+_TEMP_FILE_END = ".tmp"
+_UNKNOWN_MTIME = -1
+
+class SaveInfo(NamedTuple):
+    """Indexed save
+
+    Attributes:
+        mtime_ns (int): Modification time of the save in nanoseconds.
+        size (int): Size of the save in bytes.
+        metadata (dict[str, Any] | None): Metadata of the saved object, None until read.
+    """
+
+    mtime_ns: int
+    size: int
+    metadata: dict[str, Any] | None
+
+@dataclass
+class SaveIndex:
+    """Index of the saves of a directory, reconciled with the directory when its mtime changes,
+    as it does when a save is added, replaced or removed, and optionally with the saves' mtime
+    and size, which change when a save is rewritten in place
+
+    Attributes:
+        dir_path (str): Saves directory
+        index_name (str): Index filename, inside the directory's INDEX_DIR
+        dir_mtime_ns (int): Directory mtime the index was reconciled at
+        saves (dict[str, SaveInfo]): Indexed saves by file name
+        log_records (int): Changes appended to the log since the index was written
+        files_stamp (tuple[Any, ...]): Stats of the index and log files when last read or
+            written, telling whether another process changed them
+    """
+
+    dir_path: str
+    index_name: str
+    dir_mtime_ns: int = _UNKNOWN_MTIME
+    saves: dict[str, SaveInfo] = field(default_factory=dict)
+    log_records: int = 0
+    files_stamp: tuple[Any, ...] = ()
+
+    @property
+    def index_path(self) -> str:
+        """Path of the index file"""
+        return path.join(self.dir_path, INDEX_DIR, self.index_name + INDEX_FILE_END)
+
+    @property
+    def log_path(self) -> str:
+        """Path of the index log file"""
+        return path.join(self.dir_path, INDEX_DIR, self.index_name + INDEX_LOG_END)
+
+    @classmethod
+    def load(cls, dir_path: str, index_name: str, cached: SaveIndex | None = None) -> SaveIndex:
+        """Reads the index of the directory with its log replayed, an empty one if missing or
+        invalid
+
+        Args:
+            dir_path (str): Saves directory
+            index_name (str): Index filename
+            cached (SaveIndex | None, optional): Index previously loaded, returned if its
+                files didn't change since. Defaults to None.
+
+        Returns:
+            SaveIndex: Index
+        """
+        index = SaveIndex(dir_path, index_name)
+        files_stamp = index._get_files_stamp()
+        if cached is not None and cached.files_stamp == files_stamp:
+            return cached
+
+        index.files_stamp = files_stamp
+        try:
+            with open(index.index_path, "r", encoding=INDEX_ENCODING) as file:
+                attrs = load(file)
+            if attrs["version"] != INDEX_VERSION:
+                return index
+            saves = {name: SaveInfo(*info) for name, info in attrs["saves"].items()}
+            index.dir_mtime_ns, index.saves = attrs["dirMtime"], saves
+        except (OSError, JSONDecodeError, KeyError, TypeError, AttributeError):
+            return index
+
+        try:
+            with open(index.log_path, "r", encoding=INDEX_ENCODING) as file:
+                for line in file:
+                    index.dir_mtime_ns, name, info = loads(line)
+                    if info is None:
+                        index.saves.pop(name, None)
+                    else:
+                        index.saves[name] = SaveInfo(*info)
+                    index.log_records += 1
+        except FileNotFoundError:
+            pass
+        except (OSError, JSONDecodeError, ValueError, TypeError):
+            # Partially written change, the directory mtime left behind makes it reconcile
+            pass
+        return index
+
+    def save(self) -> None:
+        """Writes the index, replacing the previous one once complete, and empties the log"""
+        makedirs(path.dirname(self.index_path), exist_ok=True)
+        attrs = {
+            "version" : INDEX_VERSION,
+            "dirMtime" : self.dir_mtime_ns,
+            "saves" : {name: list(info) for name, info in self.saves.items()}
+        }
+        with open(self.index_path + _TEMP_FILE_END, "w", encoding=INDEX_ENCODING) as file:
+            dump(attrs, file)
+        replace(self.index_path + _TEMP_FILE_END, self.index_path)
+        if self.log_records > 0:
+            try:
+                remove(self.log_path)
+            except FileNotFoundError:
+                # Compacted by another process
+                pass
+            self.log_records = 0
+        self.files_stamp = self._get_files_stamp()
+
+    def reconcile(self, is_save: Callable[[str], bool], check_saves: bool = False) -> bool:
+        """Updates the index with the saves of the directory if its mtime changed, the metadata
+        of the saves added or modified is left to read
+
+        Args:
+            is_save (Callable[[str], bool]): Whether a file name is of a save
+            check_saves (bool, optional): Whether to compare the mtime and size of the indexed
+                saves even if the directory's mtime didn't change. Defaults to False.
+
+        Returns:
+            bool: Whether the index changed
+        """
+        dir_mtime_ns = stat(self.dir_path).st_mtime_ns
+        changed = dir_mtime_ns != self.dir_mtime_ns
+        if changed:
+            names = list(filter(is_save, listdir(self.dir_path)))
+        elif check_saves:
+            names = list(self.saves)
+        else:
+            return False
+
+        saves: dict[str, SaveInfo] = {}
+        for name in names:
+            try:
+                file_stat = stat(path.join(self.dir_path, name))
+            except FileNotFoundError:
+                changed = True
+                continue
+            info = self.saves.get(name)
+            if info is None or info[:2] != (file_stat.st_mtime_ns, file_stat.st_size):
+                info = SaveInfo(file_stat.st_mtime_ns, file_stat.st_size, None)
+                changed = True
+            saves[name] = info
+        self.saves, self.dir_mtime_ns = saves, dir_mtime_ns
+        return changed
+
+    def update(self, name: str, metadata: dict[str, Any] | None) -> None:
+        """Indexes the save after it's written, persisting the change
+
+        Args:
+            name (str): Save file name
+            metadata (dict[str, Any] | None): Metadata of the saved object
+        """
+        file_stat = stat(path.join(self.dir_path, name))
+        info = SaveInfo(file_stat.st_mtime_ns, file_stat.st_size, metadata)
+        self.saves[name] = info
+        self._record_change(name, info)
+
+    def remove(self, name: str) -> None:
+        """Removes the save from the index after it's deleted, persisting the change if it was
+        indexed
+
+        Args:
+            name (str): Save file name
+        """
+        if self.saves.pop(name, None) is not None:
+            self._record_change(name, None)
+
+    def _record_change(self, name: str, info: SaveInfo | None) -> None:
+        # Keeps the index reconciled if it was, the change being the only one since
+        if self.dir_mtime_ns != _UNKNOWN_MTIME:
+            self.dir_mtime_ns = stat(self.dir_path).st_mtime_ns
+        if self.log_records >= max(MIN_LOG_RECORDS, len(self.saves)) or \
+           not path.isfile(self.index_path):
+            self.save()
+            return
+
+        with open(self.log_path, "a", encoding=INDEX_ENCODING) as file:
+            file.write(dumps([self.dir_mtime_ns, name, info]) + "\n")
+        self.log_records += 1
+        self.files_stamp = self._get_files_stamp()
+
+    def _get_files_stamp(self) -> tuple[Any, ...]:
+        stamp: list[Any] = []
+        for file_path in (self.index_path, self.log_path):
+            try:
+                file_stat = stat(file_path)
+                stamp.append((file_stat.st_mtime_ns, file_stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
@@ -0,0 +1,179 @@
+"""This module contains the SaveQueue class, which writes the saves of a serializer from a
+background thread, so requesting a save never blocks the caller, as the game loop"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from logging import getLogger
+from threading import Condition, Thread
+from time import monotonic
+from typing import Generic
+
+from serialization.enums import SaveState, SerializeStatus
+from serialization.serializer import Ser, Serializer
+from utils.errors import SaveQueueClosedError
+
+# Save filename and sub directories
+SaveKey = tuple[str, tuple[str, ...]]
+LOGGER = getLogger(__name__)
+
+@dataclass
+class SaveQueue(Generic[Ser]):
+    """Queue of saves written by a worker thread, started on the first request. Requested objects
+    are snapshotted, and requesting a save again before it's written replaces the pending one,
+    so rapid successive saves of the same object write it once. The serializer writes to a
+    temporary file first, a save is never left partially written
+
+    Attributes:
+        serializer (Serializer[Ser]): Serializer of the saves
+    """
+
+    serializer: Serializer[Ser]
+    _pending: dict[SaveKey, Ser] = field(init=False, repr=False, default_factory=dict)
+    _states: dict[SaveKey, SaveState] = field(init=False, repr=False, default_factory=dict)
+    _statuses: dict[SaveKey, SerializeStatus] = field(init=False, repr=False,
+                                                      default_factory=dict)
+    _errors: dict[SaveKey, Exception] = field(init=False, repr=False, default_factory=dict)
+    _condition: Condition = field(init=False, repr=False, default_factory=Condition)
+    _worker: Thread | None = field(init=False, repr=False, default=None)
+    _saving: SaveKey | None = field(init=False, repr=False, default=None)
+    _closed: bool = field(init=False, repr=False, default=False)
+
+    def save(self, obj: Ser, filename: str, *directories: str) -> None:
+        """Requests the save of a snapshot of the object, replacing the pending save of the
+        same file if any
+
+        Args:
+            obj (Ser): Object to serialize
+            filename (str): Filename
+            *directories (str): Sub directories in the serializer's Asset Type
+
+        Raises:
+            SaveQueueClosedError: If the queue was closed
+        """
+        snapshot = obj.get_snapshot()
+        with self._condition:
+            if self._closed:
+                raise SaveQueueClosedError("Save queue closed")
+            key = (filename, directories)
+            self._pending[key] = snapshot
+            self._states[key] = SaveState.PENDING
+            if self._worker is None:
+                self._worker = Thread(target=self._work, name="SaveQueue", daemon=True)
+                self._worker.start()
+            self._condition.notify_all()
+
+    def get_state(self, filename: str, *directories: str) -> SaveState:
+        """State of the last save requested of the file, PENDING while a request waits even if
+        a previous one is being written
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the serializer's Asset Type
+
+        Returns:
+            SaveState: State
+        """
+        with self._condition:
+            return self._states.get((filename, directories), SaveState.NOT_REQUESTED)
+
+    def get_status(self, filename: str, *directories: str) -> SerializeStatus | None:
+        """Result status of the last save written of the file
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the serializer's Asset Type
+
+        Returns:
+            SerializeStatus | None: Result status, None if none was written or the last one
+                raised
+        """
+        with self._condition:
+            return self._statuses.get((filename, directories))
+
+    def get_error(self, filename: str, *directories: str) -> Exception | None:
+        """Exception raised by the serializer on the last save written of the file
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the serializer's Asset Type
+
+        Returns:
+            Exception | None: Exception, None if the last save didn't raise
+        """
+        with self._condition:
+            return self._errors.get((filename, directories))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits for the requested saves to be written
+
+        Args:
+            timeout (float | None, optional): Maximum seconds to wait, waits until written if
+                None. Defaults to None.
+
+        Returns:
+            bool: Whether the saves were written
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while len(self._pending) > 0 or self._saving is not None:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def close(self, timeout: float | None = None) -> bool:
+        """Writes the requested saves and stops the worker, the queue can't be used afterwards
+
+        Args:
+            timeout (float | None, optional): Maximum seconds to wait, waits until written if
+                None. Defaults to None.
+
+        Returns:
+            bool: Whether the saves were written
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            return not self._worker.is_alive()
+        return True
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while len(self._pending) == 0 and not self._closed:
+                    self._condition.wait()
+                if len(self._pending) == 0:
+                    return
+                key = next(iter(self._pending))
+                obj = self._pending.pop(key)
+                self._saving = key
+                self._states[key] = SaveState.SAVING
+
+            status: SerializeStatus | None = None
+            exception: Exception | None = None
+            try:
+                status = self.serializer.serialize(obj, key[0], *key[1])
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # The save is reported FAILED, the worker keeps writing the others
+                exception = e
+                LOGGER.exception("Save of %s in %s failed", key[0], key[1])
+            finally:
+                with self._condition:
+                    self._saving = None
+                    if status is None:
+                        self._statuses.pop(key, None)
+                    else:
+                        self._statuses[key] = status
+                    if exception is None:
+                        self._errors.pop(key, None)
+                    else:
+                        self._errors[key] = exception
+                    # A save requested while writing stays pending
+                    if key not in self._pending:
+                        self._states[key] = SaveState.SAVED \
+                            if status is SerializeStatus.SUCCESFULL else SaveState.FAILED
+                    self._condition.notify_all()
@@ -4,8 +4,10 @@ which represents an object that can be serialized with the Serializer Class"""
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from copy import deepcopy
+from typing import Any, TypeVar
 
+S = TypeVar("S", bound="Serializable")
 
 class Serializable(ABC):
     """Serializable class interface
@@ -19,6 +21,24 @@ class Serializable(ABC):
             dict[str, Any]: Dictionary
         """
 
+    def get_save_metadata(self) -> dict[str, Any]:
+        """Gives a small dictionary describing the object, indexed along its saves for listing
+        them without loading them
+
+        Returns:
+            dict[str, Any]: Dictionary
+        """
+        return {}
+
+    def get_snapshot(self: S) -> S:
+        """Gives a copy of the object which later changes to the object don't affect, for
+        serializing it from another thread
+
+        Returns:
+            S: Snapshot
+        """
+        return deepcopy(self)
+
     @classmethod
     @abstractmethod
     def get_from_deserialize(cls, attrs: dict[str, Any], **kwargs: Any) -> Serializable:
@@ -31,3 +51,28 @@ class Serializable(ABC):
         Returns:
             Serializable: Contructed object
         """
+
+class BinarySerializable(Serializable):
+    """Serializable class interface, which can be serialized to a compact binary encoding too
+    """
+
+    @abstractmethod
+    def get_serialization_bytes(self) -> bytes:
+        """Gives the object's binary encoding
+
+        Returns:
+            bytes: Encoding
+        """
+
+    @classmethod
+    @abstractmethod
+    def get_from_bytes(cls, data: bytes, **kwargs: Any) -> BinarySerializable:
+        """Contructs the Object from its binary encoding
+
+        Args:
+            data (bytes): Encoding
+            **kwargs (Any): Aditional arguments for the contructor
+
+        Returns:
+            BinarySerializable: Contructed object
+        """
@@ -3,19 +3,82 @@ it's in charge of managing the savings and loadings of Serializable objects,
 plus some utilities relate"""
 #TODO build a ConsistantDataPath to serialize to
 
+import re
 from dataclasses import dataclass, field
-from json import dumps, load
-from os import listdir, path
+from json import JSONEncoder, load
+from os import SEEK_END, listdir, path, remove, replace
+from struct import Struct
+from threading import RLock
+from zlib import crc32
 from typing import Any, Callable, Generic, Optional, TypeVar
-from serialization.enums import DeserializeStatus, SerializeStatus
+from serialization.enums import (DeserializeStatus, SaveCompression, SaveEncoding,
+                                 SerializeStatus)
 
-from serialization.file_format import FileFormat
-from serialization.serializable import Serializable
+from serialization.archive import Archive
+from serialization.file_format import COMPRESSION_ERRORS, FileFormat
+from serialization.save_index import SaveIndex, SaveInfo
+from serialization.serializable import BinarySerializable, Serializable
 from utils.utils import get_asset_path
 
 JSON_INDENT = 4
 ENCODING = "utf-8"
 FILE_EXTENSION = "json"
+BINARY_FILE_EXTENSION = "bin"
+FILE_EXTENSIONS = {
+    SaveEncoding.JSON : FILE_EXTENSION,
+    SaveEncoding.BINARY : BINARY_FILE_EXTENSION
+}
+# Saves are written to a temporary file first, replacing the save once complete
+TEMP_FILE_END = ".tmp"
+
+# Journal files, a header with the magic and the checksum of the snapshot they follow, then the
+# fixed size records appended since
+JOURNAL_FILE_END = ".journal"
+JOURNAL_MAGIC = b"JRNL"
+JOURNAL_HEADER = Struct("<4sI")
+
+# Archive files, many objects in a single file, see Archive
+ARCHIVE_FILE_END = ".archive"
+
+# Strings, brackets and the whitespace the indented encoder writes between elements
+_JSON_LAYOUT_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\[|\]|[\n ]+')
+
+@dataclass
+class JsonLayout:
+    """Formats indented JSON for fixing visualization, the elements of the arrays nested in
+    the document's first array are written without whitespace, chunk by chunk as the encoder
+    streams them, which must not split strings
+
+    Attributes:
+        seen_array (bool): Whether the first array was opened
+        in_brackets (bool): Whether inside a nested array, up to its first closing bracket
+    """
+
+    seen_array: bool = False
+    in_brackets: bool = False
+
+    def format(self, chunk: str) -> str:
+        """Formats the next chunk of the document
+
+        Args:
+            chunk (str): Chunk
+
+        Returns:
+            str: Formatted chunk
+        """
+        return _JSON_LAYOUT_RE.sub(self._format_token, chunk)
+
+    def _format_token(self, match: re.Match[str]) -> str:
+        token = match.group()
+        if token == '[':
+            if self.seen_array:
+                self.in_brackets = True
+            self.seen_array = True
+        elif token == ']':
+            self.in_brackets = False
+        elif self.in_brackets and token[0] != '"':
+            return ""
+        return token
 
 
 Ser = TypeVar("Ser", bound=Serializable)
@@ -23,10 +86,18 @@ Ser = TypeVar("Ser", bound=Serializable)
 class Serializer(Generic[Ser]):
     """Serializer for Serializable Objects, requires a Serializable Type for it's Ser Generic type
 
+    Its public methods hold the serializer's lock, so it can be shared with the worker thread of
+    a SaveQueue
+
     Attributes:
         format (FileFormat): File format
         constructor (Callable[[dict[str, Any]], Ser]): The Serializable Object constructor
         max_saves_count (int): The maximum amount of saves if any
+        binary_constructor (Optional[Callable[[bytes], Ser]]): The Serializable Object
+            constructor from its binary encoding, required by binary file formats
+        journal_record_size (int): Size of the journal records, journal mode is enabled if
+            it's positive
+        use_index (bool): Whether to keep a SaveIndex of the saves of each directory
         has_max_saves (bool): Whether the serializable has or not a limit in savings
 
     """
@@ -34,11 +105,18 @@ class Serializer(Generic[Ser]):
     format: FileFormat
     constructor: Callable[[dict[str, Any]], Ser]
     max_saves_count: int = 0
+    binary_constructor: Optional[Callable[[bytes], Ser]] = None
+    journal_record_size: int = 0
+    use_index: bool = True
     has_max_saves: bool = field(init=False)
+    _indexes: dict[str, SaveIndex] = field(init=False, repr=False, default_factory=dict)
+    _lock: RLock = field(init=False, repr=False, compare=False, default_factory=RLock)
 
     def __post_init__(self) -> None:
-        if not self.format.is_valid_format(FILE_EXTENSION):
+        if not self.format.is_valid_format(FILE_EXTENSIONS[self.format.encoding]):
             raise ValueError("Invalid file format provided")
+        if self.format.encoding is SaveEncoding.BINARY and self.binary_constructor is None:
+            raise ValueError("Binary file format requires a binary constructor")
         self.has_max_saves = self.max_saves_count > 0
 
     def get_saves(self, dir_path: str) -> list[str]:
@@ -50,14 +128,48 @@ class Serializer(Generic[Ser]):
         Returns:
             list[str]: File names of saves in directory
         """
-        files = filter(lambda f: path.isfile(path.join(dir_path, f)), listdir(dir_path))
-        saves = filter(self.format.is_of_format, files)
-        return list(saves)
+        with self._lock:
+            if self.use_index:
+                return list(self._get_index(dir_path).saves)
+            files = filter(lambda f: path.isfile(path.join(dir_path, f)), listdir(dir_path))
+            saves = filter(self.format.is_of_format, files)
+            return list(saves)
+
+    def get_saves_info(self, dir_path: str) -> dict[str, SaveInfo]:
+        """Get the indexed saves in a directory with their metadata, reading only the saves
+        whose metadata isn't indexed yet or which changed since it was
 
-    def _validate_max_saves(self, dir_path: str) -> bool:
+        Args:
+            dir_path (str): Directory
+
+        Returns:
+            dict[str, SaveInfo]: Saves by file name in directory
+        """
+        with self._lock:
+            # Saves rewritten in place don't change the directory's mtime
+            index = self._get_index(dir_path, check_saves=True)
+            unread = [name for name, info in index.saves.items() if info.metadata is None]
+            for name in unread:
+                # Serializables may load lazily the parts not needed by the metadata
+                obj = self._try_deserialize(path.join(dir_path, name), lazy=True)
+                metadata = {} if isinstance(obj, DeserializeStatus) else obj.get_save_metadata()
+                index.saves[name] = index.saves[name]._replace(metadata=metadata)
+            if len(unread) > 0:
+                index.save()
+            return dict(index.saves)
+
+    def _get_index(self, dir_path: str, check_saves: bool = False) -> SaveIndex:
+        index = SaveIndex.load(dir_path, self.format.get_fullname(""),
+                               self._indexes.get(dir_path))
+        if index.reconcile(self.format.is_of_format, check_saves):
+            index.save()
+        self._indexes[dir_path] = index
+        return index
+
+    def _validate_max_saves(self, dir_path: str, index: SaveIndex | None) -> bool:
         if not self.has_max_saves:
             return False
-        saves_count = len(self.get_saves(dir_path))
+        saves_count = len(self.get_saves(dir_path) if index is None else index.saves)
         return saves_count >= self.max_saves_count
 
     def serialize(self, obj: Ser, filename: str, *directories: str) -> SerializeStatus:
@@ -71,50 +183,198 @@ class Serializer(Generic[Ser]):
         Returns:
             SerializeResult: Result status
         """
-        # Format Json for fixing visualization
-        def format_json(json: str) -> str:
-            removed = 0
-            second_char = False
-            in_brackets = False
-            for i, c in enumerate(json):
-                if c == '[':
-                    if second_char is False:
-                        second_char = True
-                        continue
-                    in_brackets = True
-                if c == ']':
-                    in_brackets = False
-                if in_brackets and c in ('\n', ' '):
-                    json = json[:i-removed] + json[i+1-removed:]
-                    removed += 1
-            return json
-
-        # Validate Maximum Saves Reached
-        dir_path = get_asset_path(self.format.asset_type, *directories)
-        if self._validate_max_saves(*directories):
-            return SerializeStatus.MAX_SAVES_REACHED
-
-        try:
+        with self._lock:
+            # Validate Maximum Saves Reached
+            dir_path = get_asset_path(self.format.asset_type, *directories)
+            if not path.isdir(dir_path):
+                return SerializeStatus.NOT_FOUND
+            index = self._get_index(dir_path) if self.use_index else None
             file_fullname = self.format.get_fullname(filename)
             file_path = path.join(dir_path, file_fullname)
-            with open(file_path, "w", encoding=ENCODING) as file:
-                json_dict = obj.get_serialization_attrs()
-                json = format_json(dumps(json_dict, indent=JSON_INDENT))
-                file.write(json)
+            # Overwriting a save doesn't add a save
+            if not path.isfile(file_path) and self._validate_max_saves(dir_path, index):
+                return SerializeStatus.MAX_SAVES_REACHED
+
+            is_binary = self.format.encoding is SaveEncoding.BINARY
+            if is_binary and not isinstance(obj, BinarySerializable):
+                return SerializeStatus.INCORRECT_OBJ_TYPE
+
+            temp_path = file_path + TEMP_FILE_END
+            try:
+                if isinstance(obj, BinarySerializable) and is_binary:
+                    with self.format.open_file(temp_path, "wb") as file:
+                        file.write(obj.get_serialization_bytes())
+                else:
+                    with self.format.open_file(temp_path, "w", ENCODING) as file:
+                        json_layout = JsonLayout()
+                        encoder = JSONEncoder(indent=JSON_INDENT)
+                        for chunk in encoder.iterencode(obj.get_serialization_attrs()):
+                            file.write(json_layout.format(chunk))
+                replace(temp_path, file_path)
+            except FileNotFoundError:
+                return SerializeStatus.NOT_FOUND
+            finally:
+                # A write failed partway doesn't leave its temporary file behind
+                if path.isfile(temp_path):
+                    remove(temp_path)
+
+            if index is not None:
+                index.update(file_fullname, obj.get_save_metadata())
+            return SerializeStatus.SUCCESFULL
+
+    def delete(self, filename: str, *directories: str) -> bool:
+        """Deletes the save and its journal if found
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the specified Asset Type
+
+        Returns:
+            bool: Whether the save was found
+        """
+        with self._lock:
+            dir_path = get_asset_path(self.format.asset_type, *directories)
+            file_path = self._get_file_path(filename, *directories)
+            if not path.isfile(file_path):
+                return False
+            index = self._get_index(dir_path) if self.use_index else None
+            remove(file_path)
+            if path.isfile(file_path + JOURNAL_FILE_END):
+                remove(file_path + JOURNAL_FILE_END)
+            if index is not None:
+                index.remove(self.format.get_fullname(filename))
+            return True
+
+    def compact_journal(self, obj: Ser, filename: str, *directories: str) -> SerializeStatus:
+        """Serializes the object as the snapshot of the journal, emptying the journal
+
+        Args:
+            obj (Ser): Object to serialize
+            filename (str): Filename
+            *directories (str): Sub directories in the specified Asset Type
+
+        Returns:
+            SerializeStatus: Result status
+        """
+        with self._lock:
+            status = self.serialize(obj, filename, *directories)
+            if status is not SerializeStatus.SUCCESFULL:
+                return status
+
+            file_path = self._get_file_path(filename, *directories)
+            with open(file_path, "rb") as file:
+                checksum = crc32(file.read())
+            # A crash before the journal is replaced leaves the previous journal, which the
+            # checksum tells apart from the new snapshot's
+            with open(file_path + JOURNAL_FILE_END + TEMP_FILE_END, "wb") as file:
+                file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, checksum))
+            replace(file_path + JOURNAL_FILE_END + TEMP_FILE_END, file_path + JOURNAL_FILE_END)
+            return SerializeStatus.SUCCESFULL
+
+    def append_journal(self, record: bytes, filename: str, *directories: str) -> SerializeStatus:
+        """Appends the record to the journal of the snapshot, the journal is created with its
+        header by compact_journal, it's NOT_FOUND until then
+
+        Args:
+            record (bytes): Record, journal_record_size long
+            filename (str): Filename
+            *directories (str): Sub directories in the specified Asset Type
+
+        Returns:
+            SerializeStatus: Result status
+        """
+        with self._lock:
+            if self.journal_record_size <= 0 or len(record) != self.journal_record_size:
+                raise ValueError("Invalid journal record")
+            try:
+                with open(self._get_file_path(filename, *directories) + JOURNAL_FILE_END,
+                          "r+b") as file:
+                    header = file.read(JOURNAL_HEADER.size)
+                    if len(header) < JOURNAL_HEADER.size or \
+                        JOURNAL_HEADER.unpack(header)[0] != JOURNAL_MAGIC:
+                        return SerializeStatus.NOT_FOUND
+                    file.seek(0, SEEK_END)
+                    file.write(record)
                 return SerializeStatus.SUCCESFULL
+            except FileNotFoundError:
+                return SerializeStatus.NOT_FOUND
 
-        except FileNotFoundError:
-            return SerializeStatus.NOT_FOUND
+    def read_journal(self, filename: str, *directories: str) -> list[bytes]:
+        """Records appended to the journal since the snapshot was serialized, a journal of a
+        previous snapshot has none, and a partially written last record is dropped
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the specified Asset Type
+
+        Returns:
+            list[bytes]: Records
+        """
+        with self._lock:
+            if self.journal_record_size <= 0:
+                raise ValueError("Journal mode isn't enabled")
+            file_path = self._get_file_path(filename, *directories)
+            try:
+                with open(file_path, "rb") as file:
+                    checksum = crc32(file.read())
+                with open(file_path + JOURNAL_FILE_END, "rb") as file:
+                    journal = file.read()
+            except FileNotFoundError:
+                return []
+
+            if len(journal) < JOURNAL_HEADER.size or \
+                JOURNAL_HEADER.unpack_from(journal) != (JOURNAL_MAGIC, checksum):
+                return []
+            size = self.journal_record_size
+            end = len(journal) - (len(journal) - JOURNAL_HEADER.size) % size
+            return [journal[i:i + size] for i in range(JOURNAL_HEADER.size, end, size)]
+
+    def open_archive(self, filename: str, *directories: str,
+                     writable: bool = False) -> Archive[Ser]:
+        """Opens the archive of binary encoded objects, created if writable and not found
+
+        Args:
+            filename (str): Filename
+            *directories (str): Sub directories in the specified Asset Type
+            writable (bool, optional): Whether to append objects. Defaults to False.
+
+        Raises:
+            ValueError: If the serializer has no binary constructor or the file isn't an archive
+            FileNotFoundError: If not writable and not found
+
+        Returns:
+            Archive[Ser]: Archive
+        """
+        if self.binary_constructor is None:
+            raise ValueError("Archives require a binary constructor")
+        file_path = self._get_file_path(filename, *directories) + ARCHIVE_FILE_END
+        return Archive(file_path, self.binary_constructor, writable)
+
+    def _get_file_path(self, filename: str, *directories: str) -> str:
+        file_fullname = self.format.get_fullname(filename)
+        return get_asset_path(self.format.asset_type, *[*directories, file_fullname])
 
     def _try_deserialize(self, file_path: str, **kwargs: Any) -> Ser | DeserializeStatus:
         try:
-            with open(file_path, "r", encoding=ENCODING) as file:
+            if self.binary_constructor is not None and \
+                self.format.encoding is SaveEncoding.BINARY:
+                with self.format.open_file(file_path, "rb") as file:
+                    data = file.read()
+                return self.binary_constructor(data, **kwargs)
+
+            with self.format.open_file(file_path, "r", ENCODING) as file:
                 json = load(file)
             return self.constructor(json, **kwargs)
         except KeyError:
             return DeserializeStatus.MISSING_ATTRS
         except FileNotFoundError:
             return DeserializeStatus.NOT_FOUND
+        except ValueError:
+            return DeserializeStatus.CORRUPTED
+        except COMPRESSION_ERRORS:
+            if self.format.compression is SaveCompression.NONE:
+                raise
+            return DeserializeStatus.CORRUPTED
 
     def deserialize(self, filename: str, *directories: str,
                     **kwargs: Any) -> tuple[Optional[Ser], DeserializeStatus]:
@@ -128,10 +388,10 @@ class Serializer(Generic[Ser]):
         Returns:
             tuple[Optional[Ser], DeserializeResult]: Loaded object if valid and result status
         """
-        file_fullname = self.format.get_fullname(filename)
-        file_path = get_asset_path(self.format.asset_type, *[*directories, file_fullname])
-        obj = self._try_deserialize(file_path, **kwargs)
+        with self._lock:
+            file_path = self._get_file_path(filename, *directories)
+            obj = self._try_deserialize(file_path, **kwargs)
 
-        if isinstance(obj, DeserializeStatus):
-            return None, obj
-        return obj, DeserializeStatus.SUCCESFULL
+            if isinstance(obj, DeserializeStatus):
+                return None, obj
+            return obj, DeserializeStatus.SUCCESFULL
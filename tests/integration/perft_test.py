@@ -0,0 +1,41 @@
+"""TODO"""
+
+from copy import deepcopy
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.enums import BoardBackend
+from chess_engine.perft import REFERENCE_POSITIONS, divide, perft
+
+# Deepest depth per reference position kept under ~10k leaf nodes
+TEST_DEPTHS = {
+    "start" : 3,
+    "kiwipete" : 2,
+    "position3" : 3,
+    "position4" : 3,
+    "position4_mirrored" : 3,
+    "position5" : 2,
+    "position6" : 2,
+}
+
+@pytest.mark.parametrize("backend", list(BoardBackend))
+@pytest.mark.parametrize("name", list(TEST_DEPTHS))
+def test_perft_reference_positions(name: str, backend: BoardBackend) -> None:
+    """Tests perft node counts of the reference positions"""
+    fen, expected_counts = REFERENCE_POSITIONS[name]
+    game = ChessGame.from_fen(fen, backend)
+    for depth in range(1, TEST_DEPTHS[name] + 1):
+        assert perft(game, depth) == expected_counts[depth - 1]
+
+@pytest.mark.parametrize("name", list(TEST_DEPTHS))
+def test_perft_restores_game(name: str) -> None:
+    """TODO
+    """
+    game = ChessGame.from_fen(REFERENCE_POSITIONS[name][0])
+    prev_grid, prev_data = deepcopy(game.grid), deepcopy(game.data)
+
+    root_nodes = divide(game, 2)
+    assert sum(root_nodes.values()) == REFERENCE_POSITIONS[name][1][1]
+    assert game.grid == prev_grid
+    assert game.data == prev_data
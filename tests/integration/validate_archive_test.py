@@ -0,0 +1,49 @@
+"""TODO"""
+
+import json
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import get_serializer
+from chess_engine.structs import Coord
+from chess_engine.validate_archive import validate_archive
+from serialization.enums import SaveCompression, SaveEncoding
+
+
+def _save(dir_path: Path, name: str, attrs: dict[str, Any]) -> None:
+    (dir_path / f"game_{name}.json").write_text(json.dumps(attrs), encoding="utf-8")
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_archive(tmp_path: Path, workers: int) -> None:
+    """Tests the report records of valid and invalid saves, in file order"""
+    game = ChessGame.new_game()
+    for origin, dest in ((Coord(6, 4), Coord(4, 4)), (Coord(1, 4), Coord(3, 4)),
+                         (Coord(7, 6), Coord(5, 5))):
+        game.attempt_move(origin, dest)
+    attrs = json.loads(json.dumps(game.data.get_serialization_attrs()))
+
+    _save(tmp_path, "a_valid", attrs)
+    get_serializer(SaveEncoding.BINARY, SaveCompression.LZMA).serialize(
+        game.data, "b_valid_binary", str(tmp_path))
+    bad_history = json.loads(json.dumps(attrs))
+    bad_history["moveHistory"][1][1] = [2, 3]
+    _save(tmp_path, "c_bad_history", bad_history)
+    _save(tmp_path, "d_bad_castling", {**attrs, "whiteCastle_l": False})
+    _save(tmp_path, "e_bad_turn", {**attrs, "turn": "w"})
+    (tmp_path / "game_f_broken.json").write_text("{", encoding="utf-8")
+    (tmp_path / "not_a_save.txt").write_text("", encoding="utf-8")
+
+    report = StringIO()
+    assert validate_archive(str(tmp_path), workers, report) == (6, 2)
+
+    records = [json.loads(line) for line in report.getvalue().splitlines()]
+    assert [Path(r["file"]).name.split(".")[0] for r in records] == ["game_a_valid",
+        "game_b_valid_binary", "game_c_bad_history", "game_d_bad_castling", "game_e_bad_turn",
+        "game_f_broken"]
+    assert [r["valid"] for r in records] == [True, True, False, False, False, False]
+    assert [r["first_bad_ply"] for r in records] == [None, None, 1, None, None, None]
+    assert records[1]["plies"] == 3 and records[5]["plies"] is None
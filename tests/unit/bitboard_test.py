@@ -0,0 +1,35 @@
+"""TODO"""
+
+from copy import deepcopy
+
+from hypothesis import given
+
+from chess_engine.bitboard import Bitboards
+from chess_engine.chess_validator import ChessValidator
+from chess_engine.enums import SideColor
+from chess_engine.grid import Grid
+from chess_engine.structs import Coord
+from utils.test_strategies import coords, grids
+
+
+@given(grids(), coords())
+def test_bitboard_attacks(grid: Grid, given_coord: Coord) -> None:
+    """Tests the bitboard backend answers attack queries as the grid backend"""
+    bit_grid = deepcopy(grid)
+    bit_grid.enable_bitboards()
+
+    for turn in SideColor:
+        # pylint: disable=protected-access
+        expected = ChessValidator._is_coord_attacked(given_coord, (turn, grid))
+        assert ChessValidator._is_coord_attacked(given_coord, (turn, bit_grid)) == expected
+
+@given(grids(), coords(), coords())
+def test_bitboard_sync(grid: Grid, coord1: Coord, coord2: Coord) -> None:
+    """TODO
+    """
+    bitboards = grid.enable_bitboards()
+    if coord1 != coord2:
+        grid.swap_pieces(coord1, coord2)
+    grid.set_at(coord1, None)
+
+    assert bitboards == Bitboards.from_pieces(grid.white_pieces, grid.black_pieces)
@@ -0,0 +1,150 @@
+"""TODO"""
+
+from copy import deepcopy
+
+import pytest
+
+from chess_engine.chess_game import POSITION_BYTES, ChessGame
+from chess_engine.perft import REFERENCE_POSITIONS
+from chess_engine.enums import GameState, MoveStatus, TurnState
+from chess_engine.structs import Coord
+from utils.errors import InvalidChessGameError, InvalidMoveHistoryError
+
+
+def test_position_key_transposition() -> None:
+    """Tests equal positions reached by different moves share the position key"""
+    game = ChessGame.new_game()
+    start_key = game.position_key
+
+    game.attempt_move(Coord(7, 6), Coord(5, 5))
+    assert game.position_key != start_key
+    game.attempt_move(Coord(0, 6), Coord(2, 5))
+    game.attempt_move(Coord(5, 5), Coord(7, 6))
+    game.attempt_move(Coord(2, 5), Coord(0, 6))
+    assert game.position_key == start_key
+
+    game.undo_move()
+    game.undo_move()
+    game.undo_move()
+    game.undo_move()
+    assert game.position_key == start_key
+
+def test_position_key_state() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    game.attempt_move(Coord(6, 4), Coord(4, 4))
+    en_passant_key = game.position_key
+
+    game.attempt_move(Coord(0, 6), Coord(2, 5))
+    game.attempt_move(Coord(7, 6), Coord(5, 5))
+    game.attempt_move(Coord(2, 5), Coord(0, 6))
+    assert game.position_key != en_passant_key
+
+    game.attempt_move(Coord(5, 5), Coord(7, 6))
+    game.attempt_move(Coord(0, 6), Coord(2, 5))
+    game.attempt_move(Coord(7, 6), Coord(5, 5))
+    assert game.position_key != en_passant_key
+
+    fen = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1"
+    assert ChessGame.from_fen(fen).position_key == en_passant_key
+
+def test_load_game_history() -> None:
+    """Tests loading a game replays its history up to the terminal state"""
+    game = ChessGame.new_game()
+    # Fool's mate
+    for origin, dest in ((Coord(6, 5), Coord(5, 5)), (Coord(1, 4), Coord(3, 4)),
+                         (Coord(6, 6), Coord(4, 6)), (Coord(0, 3), Coord(4, 7))):
+        game.attempt_move(origin, dest)
+    assert game.data.state == GameState.BLACK_WIN
+
+    loaded = ChessGame.load_game(deepcopy(game.grid), deepcopy(game.data))
+    assert loaded.turn_state == TurnState.CHECKMATE
+    assert loaded.grid == game.grid
+
+def test_load_game_illegal_ply() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    for origin, dest in ((Coord(6, 4), Coord(4, 4)), (Coord(1, 4), Coord(3, 4)),
+                         (Coord(7, 6), Coord(5, 5))):
+        game.attempt_move(origin, dest)
+
+    data = deepcopy(game.data)
+    piece, _ = data.move_history[1]
+    data.move_history[1] = (piece, Coord(2, 3))
+    with pytest.raises(InvalidMoveHistoryError) as error:
+        ChessGame.load_game(deepcopy(game.grid), data)
+    assert error.value.ply == 1
+
+def test_position_encoding() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    game.attempt_move(Coord(6, 4), Coord(4, 4))
+    games = [game] + [ChessGame.from_fen(fen) for fen, _ in REFERENCE_POSITIONS.values()]
+    for given_game in games:
+        encoding = given_game.encode_position()
+        assert len(encoding) == POSITION_BYTES
+        decoded = ChessGame.decode_position(encoding)
+        assert decoded.position_key == given_game.position_key
+        assert decoded.encode_position() == encoding
+
+def test_fen_export() -> None:
+    """Tests FEN strings round trip through from_fen and to_fen"""
+    fens = [fen for fen, _ in REFERENCE_POSITIONS.values()]
+    fens.append("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1")
+    for fen in fens:
+        assert ChessGame.from_fen(fen).to_fen() == fen
+
+    game = ChessGame.new_game()
+    game.attempt_move(Coord(6, 4), Coord(4, 4))
+    assert game.to_fen() == fens[-1]
+
+def test_fen_move_counters() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    game.attempt_move(Coord(7, 6), Coord(5, 5))
+    game.attempt_move(Coord(0, 6), Coord(2, 5))
+    assert (game.data.halfmove_clock, game.data.fullmove_number) == (2, 2)
+    game.attempt_move(Coord(6, 4), Coord(4, 4))
+    assert (game.data.halfmove_clock, game.data.fullmove_number) == (0, 2)
+    assert game.to_fen().endswith(" b KQkq e3 0 2")
+
+    game.undo_move()
+    assert (game.data.halfmove_clock, game.data.fullmove_number) == (2, 2)
+    game.undo_move()
+    assert (game.data.halfmove_clock, game.data.fullmove_number) == (1, 1)
+
+    with pytest.raises(InvalidChessGameError):
+        ChessGame.from_fen("8/8/8/8/8/8/8/K6k w KX - 0 1")
+    with pytest.raises(InvalidChessGameError):
+        ChessGame.from_fen("8/8/8/8/8/8/8/K6k w - - x 1")
+
+def test_fen_start_position() -> None:
+    """Tests games from a FEN record its position as the start of the history, which is
+    replayed from it, with its en passant target"""
+    fen = "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2"
+    game = ChessGame.from_fen(fen)
+    assert not game.data.move_history and game.data.start_fen == fen
+    assert ChessGame.replay(game.data).to_fen() == fen
+    assert ChessGame.new_game().data.start_fen is None
+    assert ChessGame.from_fen(ChessGame.new_game().to_fen()).data.start_fen is None
+
+    fen = "4k3/8/8/3pP3/8/8/8/4K2R w K d6 0 1"
+    game = ChessGame.from_fen(fen)
+    assert game.attempt_move(Coord(3, 4), Coord(2, 3)) is MoveStatus.PERFORMED
+    game.attempt_move(Coord(0, 4), Coord(0, 3))
+    game.attempt_move(Coord(7, 4), Coord(7, 6))
+    replayed = ChessGame.replay(game.data)
+    assert replayed.grid == game.grid and replayed.to_fen() == game.to_fen()
+    assert ChessGame.load_game(replayed.grid, game.data).position_key == game.position_key
+    game.undo_move()
+    game.undo_move()
+    game.undo_move()
+    assert game.to_fen() == fen
+    assert ChessGame.decode_position(game.encode_position()).data.start_fen == fen
+
+    with pytest.raises(InvalidChessGameError):
+        ChessGame.from_fen("4k3/8/8/3pP3/8/8/8/4K2R w K d3 0 1")
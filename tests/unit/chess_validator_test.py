@@ -0,0 +1,58 @@
+"""TODO"""
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import OptMovement
+from chess_engine.chess_validator import ChessValidator, LegalMove
+from chess_engine.enums import PieceType, SideColor, TurnState
+from chess_engine.grid import Grid
+from chess_engine.piece import Piece
+from chess_engine.structs import CastlingState, Coord
+from utils.test_strategies import grid_with
+
+
+def legal_moves(grid: Grid, turn: SideColor=SideColor.WHITE, last_mov: OptMovement=None,
+                castling: CastlingState=CastlingState(False, False)) -> set[LegalMove]:
+    """TODO
+    """
+    context = (last_mov, TurnState.MOVE_TURN, castling, (turn, grid))
+    return set(ChessValidator.generate_legal_moves(context))
+
+def test_start_legal_moves() -> None:
+    """Tests the legal moves of the start position"""
+    game = ChessGame.new_game()
+    moves = list(game.legal_moves())
+
+    assert len(moves) == 20
+    assert all(origin.row in (6, 7) and promotion is None for origin, _, promotion in moves)
+
+def test_castling_legal_moves() -> None:
+    """TODO
+    """
+    grid = grid_with((7, 4, '@', 'w'), (7, 0, 'R', 'w'), (7, 7, 'R', 'w'), (0, 4, '@', 'b'))
+    moves = legal_moves(grid, castling=CastlingState(True, True))
+    assert (Coord(7, 4), Coord(7, 2), None) in moves
+    assert (Coord(7, 4), Coord(7, 6), None) in moves
+
+    grid.set_at(Coord(0, 5), Piece(PieceType.ROOK, SideColor.BLACK, Coord(0, 5)))
+    moves = legal_moves(grid, castling=CastlingState(True, True))
+    assert (Coord(7, 4), Coord(7, 2), None) in moves
+    assert (Coord(7, 4), Coord(7, 6), None) not in moves
+
+    assert (Coord(7, 4), Coord(7, 2), None) not in legal_moves(grid)
+
+def test_enpassant_legal_moves() -> None:
+    """TODO
+    """
+    grid = grid_with((7, 4, '@', 'w'), (3, 4, 'P', 'w'), (3, 3, 'P', 'b'), (0, 4, '@', 'b'))
+    last_mov = (Piece(PieceType.PAWN, SideColor.BLACK, Coord(1, 3)), Coord(3, 3))
+
+    assert (Coord(3, 4), Coord(2, 3), None) in legal_moves(grid, last_mov=last_mov)
+    assert (Coord(3, 4), Coord(2, 3), None) not in legal_moves(grid)
+
+def test_promotion_legal_moves() -> None:
+    """TODO
+    """
+    grid = grid_with((7, 4, '@', 'w'), (1, 0, 'P', 'w'), (0, 7, '@', 'b'))
+    promotions = {m for m in legal_moves(grid) if m[0] == Coord(1, 0)}
+
+    assert promotions == {(Coord(1, 0), Coord(0, 0), t) for t in ChessValidator.promotion_types}
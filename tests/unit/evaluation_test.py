@@ -0,0 +1,47 @@
+"""TODO"""
+
+import numpy as np
+import pytest
+from hypothesis import given
+
+from chess_engine.batch_evaluation import encode_batch, evaluate_batch
+from chess_engine.evaluation import evaluate_grid
+from chess_engine.grid import Grid
+from chess_engine.structs import Coord
+from utils.test_strategies import coords, grids
+
+
+@given(grids(), coords(), coords())
+def test_evaluation_incremental(grid: Grid, coord1: Coord, coord2: Coord) -> None:
+    """Tests the grid's incremental evaluation matches the evaluation from scratch"""
+    assert grid.evaluation == evaluate_grid(grid)
+    prev_evaluation = grid.evaluation
+
+    if grid.get_at(coord1) is not None and coord1 != coord2:
+        undo = grid.make_move(coord1, coord2)
+        assert grid.evaluation == evaluate_grid(grid)
+        grid.unmake_move(undo)
+        assert grid.evaluation == prev_evaluation
+
+    grid.set_at(coord1, None)
+    assert grid.evaluation == evaluate_grid(grid)
+
+def test_evaluation_symmetry() -> None:
+    """TODO
+    """
+    assert Grid.get_start_grid().evaluation == 0
+    grid = Grid.from_fen("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR")
+    assert grid.evaluation > 0
+
+@given(grids())
+def test_evaluation_batch(grid: Grid) -> None:
+    """TODO
+    """
+    codes = encode_batch([grid, Grid.get_start_grid(), grid])
+    assert codes.shape == (3, 64) and codes.dtype == np.int8
+    assert evaluate_batch(codes).tolist() == [grid.evaluation, 0, grid.evaluation]
+
+    with pytest.raises(ValueError):
+        evaluate_batch(codes.astype(np.int16))
+    with pytest.raises(ValueError):
+        evaluate_batch(codes[:, :10])
@@ -0,0 +1,79 @@
+"""TODO"""
+
+from pathlib import Path
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from chess_engine.game_journal import JOURNAL_RECORD, GameJournal
+from serialization.enums import SaveEncoding, SerializeStatus
+from serialization.serializer import JOURNAL_FILE_END, Serializer
+from utils.test_strategies import GAME_MOVES
+
+def _get_serializer(encoding: SaveEncoding) -> Serializer[ChessGameData]:
+    serializer = get_serializer(encoding)
+    serializer.journal_record_size = JOURNAL_RECORD.size
+    return serializer
+
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_journal_recover(tmp_path: Path, encoding: SaveEncoding) -> None:
+    """Tests a journaled game recovers its moves and undos, across compactions"""
+    journal = GameJournal(_get_serializer(encoding), "game", (str(tmp_path),), 4)
+    game = ChessGame.new_game()
+    game.journal = journal
+    journal.compact(game.data)
+    for origin, dest in GAME_MOVES:
+        game.attempt_move(origin, dest)
+    game.undo_move()
+    assert journal.records == 3
+
+    recovered = ChessGame.recover(GameJournal(journal.serializer, "game", (str(tmp_path),)))
+    assert recovered.data.move_history == game.data.move_history
+    assert recovered.grid == game.grid
+    assert recovered.to_fen() == game.to_fen()
+
+def test_journal_crash(tmp_path: Path) -> None:
+    """TODO
+    """
+    serializer = _get_serializer(SaveEncoding.BINARY)
+    journal = GameJournal(serializer, "game", (str(tmp_path),))
+    game = ChessGame.new_game()
+    game.journal = journal
+    journal.compact(game.data)
+    for origin, dest in GAME_MOVES[:3]:
+        game.attempt_move(origin, dest)
+
+    journal_path = tmp_path / (serializer.format.get_fullname("game") + JOURNAL_FILE_END)
+    stale_journal = journal_path.read_bytes()
+    # Partially written record
+    with open(journal_path, "ab") as file:
+        file.write(b"\x01")
+    game_data, _ = GameJournal(serializer, "game", (str(tmp_path),)).recover()
+    assert game_data is not None and game_data.move_history == game.data.move_history
+
+    # Journal of the previous snapshot, left by a crash while compacting
+    journal.compact(game.data)
+    journal_path.write_bytes(stale_journal)
+    game_data, _ = GameJournal(serializer, "game", (str(tmp_path),)).recover()
+    assert game_data is not None and game_data.move_history == game.data.move_history
+
+def test_journal_without_compact(tmp_path: Path) -> None:
+    """Tests the moves of a game are recoverable from its first one, the snapshot the journal
+    follows being written when the game is constructed with it or on the first record"""
+    serializer = _get_serializer(SaveEncoding.BINARY)
+    assert serializer.append_journal(JOURNAL_RECORD.pack(1), "game", str(tmp_path)) is \
+        SerializeStatus.NOT_FOUND
+
+    game = ChessGame.new_game()
+    game.journal = GameJournal(serializer, "game", (str(tmp_path),))
+    for origin, dest in GAME_MOVES[:3]:
+        game.attempt_move(origin, dest)
+    recovered = ChessGame.recover(GameJournal(serializer, "game", (str(tmp_path),)))
+    assert recovered.data.move_history == game.data.move_history
+
+    game = ChessGame.from_fen("4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+    game = ChessGame(game.grid, game.data, journal=GameJournal(serializer, "fen",
+                                                               (str(tmp_path),)))
+    recovered = ChessGame.recover(GameJournal(serializer, "fen", (str(tmp_path),)))
+    assert recovered.to_fen() == game.to_fen()
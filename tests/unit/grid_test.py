@@ -9,7 +9,7 @@ import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
-from chess_engine.enums import SideColor
+from chess_engine.enums import PieceType, SideColor
 from chess_engine.grid import BOARD_START, L_COLUMNS, L_ROWS, Grid, GridIter
 from chess_engine.piece import Piece
 from chess_engine.structs import Coord
@@ -133,6 +133,42 @@ def test_grid_swap(grid: Grid, coord1: Coord, coord2: Coord) -> None:
         swaped2.coord == coord1 and swaped2.same_as(prev2)
     assert assert_grid_inmutability(grid, prev_grid, coord1, coord2)
 
+@given(grids(), coords(), coords())
+def test_grid_make_unmake(grid: Grid, origin: Coord, destination: Coord) -> None:
+    """TODO
+    """
+    prev_grid = deepcopy(grid)
+    piece = grid.get_at(origin)
+    if piece is None or origin == destination:
+        with pytest.raises(GridInvalidCoordError):
+            grid.make_move(origin, destination)
+        return
+
+    undo = grid.make_move(origin, destination)
+    assert grid.get_at(origin) is None
+    assert grid.get_at(destination) is piece and piece.coord == destination
+    assert undo.captured == prev_grid.get_at(destination)
+    assert assert_grid_inmutability(grid, prev_grid, origin, destination)
+
+    grid.unmake_move(undo)
+    assert grid == prev_grid
+    assert grid.white_pieces == prev_grid.white_pieces
+    assert grid.black_pieces == prev_grid.black_pieces
+
+@given(grids(), coords(), coords(), opt_pieces)
+def test_grid_zobrist_key(grid: Grid, coord1: Coord, coord2: Coord, piece: Piece | None) -> None:
+    """Tests the incremental zobrist key matches the key of the grid built from scratch"""
+    prev_key = grid.zobrist_key
+    if coord1 != coord2:
+        grid.swap_pieces(coord1, coord2)
+        grid.swap_pieces(coord1, coord2)
+        assert grid.zobrist_key == prev_key
+
+        grid.swap_pieces(coord1, coord2)
+    grid.set_at(coord1, piece)
+
+    assert grid.zobrist_key == Grid.from_str_grid(grid.get_str_grid()).zobrist_key
+
 @given(grids(), out_of_bounds_coords, out_of_bounds_coords)
 def test_grid_opt_bounds(grid: Grid, coord1: Coord, coord2: Coord) -> None:
     """TODO
@@ -155,6 +191,36 @@ def test_grid_piece_sets(given_pieces: set[Piece]) -> None:
     assert grid.white_pieces == {p for p in given_pieces if p.color == SideColor.WHITE}
     assert grid.black_pieces == {p for p in given_pieces if p.color == SideColor.BLACK}
 
+@given(grids(), coords(), coords())
+def test_grid_piece_index(grid: Grid, coord1: Coord, coord2: Coord) -> None:
+    """Tests the per color pieces and kings stay indexed after moving pieces"""
+    if coord1 != coord2:
+        grid.swap_pieces(coord1, coord2)
+    grid.set_at(coord1, None)
+
+    for color in SideColor:
+        color_pieces = {p for p, _ in GridIter(grid) if p is not None and p.color == color}
+        assert set(grid.get_pieces(color)) == color_pieces
+        assert all(grid.get_at(p.coord) is p for p in grid.get_pieces(color))
+
+        king = grid.get_king(color)
+        kings = {p for p in color_pieces if p.type == PieceType.KING}
+        assert king in kings if len(kings) > 0 else king is None
+
+@given(grids())
+def test_grid_encoding(grid: Grid) -> None:
+    """TODO
+    """
+    codes = grid.encode()
+    assert len(codes) == L_ROWS * L_COLUMNS
+    assert Grid.decode(codes) == grid
+
+@given(grids())
+def test_grid_fen(grid: Grid) -> None:
+    """TODO
+    """
+    assert Grid.from_fen(grid.to_fen()) == grid
+
 @given(matrix_grids(opt_str_pieces))
 def test_grid_get_str_grid(grid: list[list[str]]) -> None:
     """TODO
@@ -0,0 +1,49 @@
+"""TODO"""
+
+from copy import deepcopy
+
+from hypothesis import given
+
+from chess_engine.move_tables import get_path, get_rays, get_target
+from chess_engine.piece import Piece
+from chess_engine.structs import Coord
+from utils.test_strategies import coords, pieces
+
+
+@given(pieces(coords()), coords())
+def test_move_tables_targets(piece: Piece, dest: Coord) -> None:
+    """Tests the precomputed targets match the piece's movement directions"""
+    origin = piece.coord
+    direction = origin.get_dir_to(dest)
+    if piece.can_extend():
+        direction = direction.normalized()
+    mov_case = None if origin == dest else piece.movements.get(direction, None)
+
+    target = get_target(piece, origin, dest)
+    assert (target.mov_case if target is not None else None) == mov_case
+    if target is not None:
+        assert target.path == get_path(origin, dest)
+        assert any(dest in ray for ray in get_rays(piece, origin))
+
+@given(coords(), coords())
+def test_move_tables_path(origin: Coord, dest: Coord) -> None:
+    """TODO
+    """
+    direction = origin.get_dir_to(dest).normalized()
+    path = get_path(origin, dest)
+    if abs(direction.row) > 1 or abs(direction.column) > 1:
+        assert path == ()
+        return
+
+    _coord = origin.to_dir(direction)
+    expected = []
+    while _coord != dest:
+        expected.append(_coord)
+        _coord = _coord.to_dir(direction)
+    assert path == tuple(expected)
+
+@given(pieces(coords()))
+def test_move_tables_shared(piece: Piece) -> None:
+    """Tests pieces of the same type and color share their movements table"""
+    assert Piece(piece.type, piece.color, Coord(0, 0)).movements is piece.movements
+    assert deepcopy(piece).movements is piece.movements
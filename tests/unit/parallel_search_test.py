@@ -0,0 +1,53 @@
+"""TODO"""
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.grid import Grid
+from chess_engine.parallel_search import (RootMoveResult, merge_results,
+                                          parallel_best_move)
+from chess_engine.search import MATE_SCORE, SearchLimits, best_move
+
+
+def test_parallel_search_matches_search() -> None:
+    """Tests the parallel search scores as the sequential one, for any worker count"""
+    game = ChessGame.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    expected = best_move(game, SearchLimits(depth=2))
+
+    results = [parallel_best_move(game, SearchLimits(depth=2), workers) for workers in (1, 2)]
+    for result in results:
+        assert result.score == expected.score
+        assert result.best_move == expected.best_move
+        assert result.depth == 2
+    assert results[0].pv == results[1].pv and results[0].nodes == results[1].nodes
+
+def test_parallel_search_mate() -> None:
+    """TODO
+    """
+    game = ChessGame.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = parallel_best_move(game, SearchLimits(depth=2), 2)
+    assert result.best_move == (Grid.coord_from_str("a1"), Grid.coord_from_str("a8"), None)
+    assert result.score == MATE_SCORE - 1
+
+def test_parallel_search_incomplete_root_moves() -> None:
+    """Tests root moves out of budget before depth 1 aren't reported as searched"""
+    game = ChessGame.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    root_moves = list(game.legal_moves())
+    result = parallel_best_move(game, SearchLimits(depth=3, nodes=len(root_moves)), 2)
+    assert result.depth == 0 and not result.pv
+    assert result.best_move in root_moves
+
+def test_parallel_search_merge_depth() -> None:
+    """Tests root moves are compared at the deepest iteration all of them completed, final
+    scores holding at any depth"""
+    game = ChessGame.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    root_moves = list(game.legal_moves())[:3]
+    results: list[RootMoveResult] = [([(50, [])], 10, False),
+                                     ([(40, []), (20, []), (900, [])], 30, False),
+                                     ([], 1, False)]
+    result = merge_results(root_moves, results, 4)
+    assert result.best_move == root_moves[0] and result.score == 50 and result.depth == 2
+    assert result.nodes == 42
+
+    results[0] = ([(10, []), (30, [])], 20, False)
+    results[2] = ([(MATE_SCORE - 3, [])], 5, True)
+    result = merge_results(root_moves, results, 4)
+    assert result.best_move == root_moves[2] and result.depth == 3
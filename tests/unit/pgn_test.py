@@ -0,0 +1,96 @@
+"""TODO"""
+
+from io import StringIO
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.enums import GameState, PieceType
+from chess_engine.grid import Grid
+from chess_engine.pgn import get_san, iter_pgn, parse_san, read_pgn, write_pgn
+from utils.errors import InvalidPgnError
+
+PGN = """[Event "Opera Game"]
+[White "Morphy"]
+[Black "Duke of Brunswick and Count Isouard"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 d6 3. d4 Bg4 {This is a weak move} 4. dxe5 Bxf3 5. Qxf3 dxe5
+6. Bc4 Nf6 7. Qb3 Qe7 8. Nc3 c6 9. Bg5 b5 $2 10. Nxb5 cxb5 11. Bxb5+ Nbd7
+12. O-O-O Rd8 13. Rxd7 Rxd7 (13... Nxd7 14. Qb3) 14. Rd1 Qe6 15. Bxd7+ Nxd7
+16. Qb8+ Nxb8 17. Rd8# 1-0
+
+[Event "Resigned"]
+[Result "0-1"]
+
+1. f3 e5 2. g4 ; a blunder
+2... Qh4# 0-1
+
+1. e4 e5 *
+"""
+
+def test_read_pgn() -> None:
+    """Tests reading games with comments, variations and annotations"""
+    games = list(iter_pgn(StringIO(PGN)))
+    assert len(games) == 3
+    assert games[0].tags["White"] == "Morphy"
+    assert len(games[0].moves) == 33 and games[0].moves[-1] == "Rd8#"
+    assert games[1].moves == ["f3", "e5", "g4", "Qh4#"]
+    assert games[2] == ({}, ["e4", "e5"], "*")
+
+    datas = list(read_pgn(StringIO(PGN)))
+    assert [data.state for data in datas] == [GameState.WHITE_WIN, GameState.BLACK_WIN,
+                                              GameState.PENDING]
+    assert ChessGame.replay(datas[0]).data.state == GameState.WHITE_WIN
+
+def test_pgn_round_trip() -> None:
+    """TODO
+    """
+    datas = list(read_pgn(StringIO(PGN)))
+    file = StringIO()
+    for data in datas:
+        write_pgn(file, data, {"Event": 'The "Opera" Game'})
+
+    file.seek(0)
+    pgn_games = list(iter_pgn(file))
+    assert pgn_games[0].tags["Event"] == 'The "Opera" Game'
+    assert pgn_games[0].moves == next(iter_pgn(StringIO(PGN))).moves
+    file.seek(0)
+    assert [data.move_history for data in read_pgn(file)] == \
+        [data.move_history for data in datas]
+
+def test_pgn_set_up() -> None:
+    """Tests games from a set up position round trip through their FEN tag"""
+    fen = "4k3/8/8/8/8/8/8/4K2R b K - 0 7"
+    pgn = f'[FEN "{fen}"]\n[SetUp "1"]\n\n7... Kd7 8. O-O Kc6 *\n'
+    data = next(read_pgn(StringIO(pgn)))
+    assert data.start_fen == fen and len(data.move_history) == 3
+
+    file = StringIO()
+    write_pgn(file, data)
+    assert "7... Kd7 8. O-O Kc6 *" in file.getvalue()
+    file.seek(0)
+    assert next(read_pgn(file)) == data
+
+    with pytest.raises(InvalidPgnError):
+        next(read_pgn(StringIO('[FEN "8/8/8/8 w - - 0 1"]\n\n*\n')))
+
+def test_san() -> None:
+    """TODO
+    """
+    game = ChessGame.from_fen("r3k2r/1P6/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    castle = (Grid.coord_from_str("e1"), Grid.coord_from_str("c1"), None)
+    assert parse_san(game, "O-O-O") == castle
+    assert get_san(game, castle) == "O-O-O"
+    promotion = (Grid.coord_from_str("b7"), Grid.coord_from_str("a8"), PieceType.KNIGTH)
+    assert parse_san(game, "bxa8=N") == promotion
+    assert get_san(game, promotion) == "bxa8=N"
+
+    rooks = ChessGame.from_fen("4k3/8/8/8/8/8/4K3/R6R w - - 0 1")
+    rook_move = (Grid.coord_from_str("h1"), Grid.coord_from_str("f1"), None)
+    assert get_san(rooks, rook_move) == "Rhf1"
+    assert parse_san(rooks, "Rhf1") == rook_move
+    with pytest.raises(InvalidPgnError):
+        parse_san(rooks, "Rf1")
+    with pytest.raises(InvalidPgnError):
+        parse_san(rooks, "Nf3")
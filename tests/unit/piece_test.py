@@ -42,3 +42,12 @@ def test_piece_hashing(given_piece: Piece) -> None:
     assert hash(given_piece) != hash(Piece(diff_type, given_piece.color, given_piece.coord))
     assert hash(given_piece) != hash(Piece(given_piece.type, diff_color, given_piece.coord))
     assert hash(given_piece) != hash(Piece(given_piece.type, given_piece.color, diff_coord))
+
+@given(pieces(coords()))
+def test_piece_encoding(given_piece: Piece) -> None:
+    """TODO
+    """
+    coord = given_piece.coord
+    assert Piece.decode(Piece.encode(given_piece), coord) == given_piece
+    assert Piece.decode(Piece.encode(None), coord) is None
+    assert Coord.from_square(coord.square) == coord
@@ -0,0 +1,93 @@
+"""TODO"""
+
+from pathlib import Path
+from threading import Event
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import ChessGameData, get_serializer
+from serialization.enums import SaveEncoding, SaveState, SerializeStatus
+from serialization.save_queue import SaveQueue
+from serialization.serializer import Serializer
+from utils.errors import SaveQueueClosedError
+from utils.test_strategies import GAME_MOVES
+
+class BlockingSerializer(Serializer[ChessGameData]):
+    """Serializer which holds the writes until released, counting them"""
+    def __init__(self, serializer: Serializer[ChessGameData]) -> None:
+        super().__init__(serializer.format, serializer.constructor,
+                         binary_constructor=serializer.binary_constructor)
+        self.release = Event()
+        self.writes: list[int] = []
+
+    def serialize(self, obj: ChessGameData, filename: str, *directories: str) -> SerializeStatus:
+        self.release.wait()
+        self.writes.append(len(obj.move_history))
+        return super().serialize(obj, filename, *directories)
+
+class RaisingSerializer(Serializer[ChessGameData]):
+    """Serializer which raises on the writes of games with moves"""
+    def serialize(self, obj: ChessGameData, filename: str, *directories: str) -> SerializeStatus:
+        if len(obj.move_history) > 0:
+            raise RuntimeError("Serializer failure")
+        return super().serialize(obj, filename, *directories)
+
+def test_save_queue_coalesces(tmp_path: Path) -> None:
+    """Tests the saves requested while the worker is busy are coalesced into the last one,
+    saving snapshots of the game data"""
+    serializer = BlockingSerializer(get_serializer(SaveEncoding.BINARY))
+    save_queue = SaveQueue[ChessGameData](serializer)
+    game = ChessGame.new_game()
+    save_queue.save(game.data, "other", str(tmp_path))
+    for origin, dest in GAME_MOVES:
+        game.attempt_move(origin, dest)
+        save_queue.save(game.data, "game", str(tmp_path))
+    assert save_queue.get_state("game", str(tmp_path)) is SaveState.PENDING
+    assert not save_queue.flush(0.01)
+
+    saved_data = game.data.get_snapshot()
+    game.undo_move()
+    serializer.release.set()
+    assert save_queue.flush(5)
+    assert serializer.writes == [0, 6]
+    assert save_queue.get_state("game", str(tmp_path)) is SaveState.SAVED
+    assert save_queue.get_status("game", str(tmp_path)) is SerializeStatus.SUCCESFULL
+    assert serializer.deserialize("game", str(tmp_path))[0] == saved_data
+
+def test_save_queue_close(tmp_path: Path) -> None:
+    """TODO
+    """
+    save_queue = SaveQueue[ChessGameData](get_serializer(SaveEncoding.JSON))
+    assert save_queue.get_state("game") is SaveState.NOT_REQUESTED
+    save_queue.save(ChessGameData.get_new_data(), "game", str(tmp_path / "missing"))
+    save_queue.save(ChessGameData.get_new_data(), "game", str(tmp_path))
+    assert save_queue.close(5)
+    assert save_queue.get_state("game", str(tmp_path / "missing")) is SaveState.FAILED
+    assert save_queue.get_status("game", str(tmp_path / "missing")) is SerializeStatus.NOT_FOUND
+    assert save_queue.get_state("game", str(tmp_path)) is SaveState.SAVED
+    with pytest.raises(SaveQueueClosedError):
+        save_queue.save(ChessGameData.get_new_data(), "game", str(tmp_path))
+
+def test_save_queue_serializer_error(tmp_path: Path) -> None:
+    """Tests a save whose serializer raises is reported failed with its error, without stopping
+    the worker nor keeping the status of the previous save"""
+    serializer = get_serializer(SaveEncoding.JSON)
+    save_queue = SaveQueue[ChessGameData](RaisingSerializer(serializer.format,
+                                                            serializer.constructor))
+    game = ChessGame.new_game()
+    save_queue.save(game.data, "game", str(tmp_path))
+    assert save_queue.flush(5)
+    assert save_queue.get_status("game", str(tmp_path)) is SerializeStatus.SUCCESFULL
+
+    game.attempt_move(*GAME_MOVES[0])
+    save_queue.save(game.data, "game", str(tmp_path))
+    assert save_queue.flush(5)
+    assert save_queue.get_state("game", str(tmp_path)) is SaveState.FAILED
+    assert save_queue.get_status("game", str(tmp_path)) is None
+    assert isinstance(save_queue.get_error("game", str(tmp_path)), RuntimeError)
+    save_queue.save(ChessGameData.get_new_data(), "other", str(tmp_path))
+    assert save_queue.flush(None)
+    assert save_queue.get_state("other", str(tmp_path)) is SaveState.SAVED
+    assert save_queue.get_error("other", str(tmp_path)) is None
+    assert save_queue.close(5)
@@ -0,0 +1,41 @@
+"""TODO"""
+
+from copy import deepcopy
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.grid import Grid
+from chess_engine.search import MATE_SCORE, SearchLimits, best_move
+
+
+def test_search_mate_in_one() -> None:
+    """Tests the search finds a back rank mate"""
+    game = ChessGame.from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    prev_grid, prev_data = deepcopy(game.grid), deepcopy(game.data)
+
+    result = best_move(game, SearchLimits(depth=3))
+    assert result.best_move == (Grid.coord_from_str("a1"), Grid.coord_from_str("a8"), None)
+    assert result.score == MATE_SCORE - 1
+    assert result.pv[0] == result.best_move
+    assert game.grid == prev_grid
+    assert game.data.move_history == prev_data.move_history
+
+def test_search_wins_material() -> None:
+    """TODO
+    """
+    game = ChessGame.from_fen("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    result = best_move(game, SearchLimits(depth=2))
+    assert result.best_move == (Grid.coord_from_str("d2"), Grid.coord_from_str("d5"), None)
+    assert result.score > 0
+    assert result.nodes > 0 and result.nps > 0
+
+def test_search_limits() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    result = best_move(game, SearchLimits(nodes=100))
+    assert result.best_move is not None
+    assert result.nodes <= 101
+
+    stalemate = ChessGame.from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    result = best_move(stalemate)
+    assert result.best_move is None and result.score == 0 and not result.pv
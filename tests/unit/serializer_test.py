@@ -0,0 +1,231 @@
+"""TODO"""
+
+from copy import deepcopy
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.chess_game_data import (BINARY_HEADER, BINARY_MOVE, ChessGameData,
+                                          Movement, get_serializer)
+from chess_engine.grid import Grid
+from chess_engine.save_benchmark import get_benchmark_game
+from chess_engine.structs import Coord
+from serialization.enums import (DeserializeStatus, SaveCompression, SaveEncoding,
+                                 SerializeStatus)
+from serialization.save_index import INDEX_DIR, SaveIndex
+from serialization.serializer import ARCHIVE_FILE_END, JsonLayout
+
+
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_serializer_round_trip(tmp_path: Path, encoding: SaveEncoding) -> None:
+    """Tests game datas load back equal in every save encoding"""
+    serializer = get_serializer(encoding)
+    for seed in range(5):
+        data = get_benchmark_game(60 * seed, seed)
+        assert serializer.serialize(data, str(seed), str(tmp_path)) is SerializeStatus.SUCCESFULL
+        loaded, status = serializer.deserialize(str(seed), str(tmp_path))
+        assert status is DeserializeStatus.SUCCESFULL
+        assert loaded == data
+
+def test_binary_encoding(tmp_path: Path) -> None:
+    """TODO
+    """
+    data = get_benchmark_game(100, 0)
+    encoding = data.get_serialization_bytes()
+    assert len(encoding) == BINARY_HEADER.size + BINARY_MOVE.size * len(data.move_history)
+    assert ChessGameData.get_from_bytes(encoding) == data
+    with pytest.raises(ValueError):
+        ChessGameData.get_from_bytes(encoding[:-1])
+
+    serializer = get_serializer(SaveEncoding.BINARY)
+    status = serializer.serialize(Grid.get_start_grid(), "grid", str(tmp_path))  # type: ignore
+    assert status is SerializeStatus.INCORRECT_OBJ_TYPE
+    (tmp_path / serializer.format.get_fullname("corrupted")).write_bytes(encoding[:-1])
+    assert serializer.deserialize("corrupted", str(tmp_path)) == (None,
+                                                                  DeserializeStatus.CORRUPTED)
+
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_fen_game_round_trip(tmp_path: Path, encoding: SaveEncoding) -> None:
+    """Tests game datas from a set up position load back with their start position"""
+    game = ChessGame.from_fen("4k3/8/8/3pP3/8/8/8/4K2R w K d6 0 1")
+    game.attempt_move(Coord(3, 4), Coord(2, 3))
+    game.attempt_move(Coord(0, 4), Coord(0, 3))
+    serializer = get_serializer(encoding)
+    assert serializer.serialize(game.data, "fen", str(tmp_path)) is SerializeStatus.SUCCESFULL
+    loaded, _ = serializer.deserialize("fen", str(tmp_path))
+    assert loaded == game.data
+    assert ChessGame.replay(cast(ChessGameData, loaded)).to_fen() == game.to_fen()
+    if encoding is SaveEncoding.BINARY:
+        lazy = ChessGameData.get_from_bytes(game.data.get_serialization_bytes(), lazy=True)
+        assert lazy.load_move_history() == game.data.move_history
+
+def test_serialize_error(tmp_path: Path) -> None:
+    """Tests a write failed partway doesn't leave its temporary file nor replace the save"""
+    serializer = get_serializer(SaveEncoding.JSON)
+    data = get_benchmark_game(10, 0)
+    serializer.serialize(data, "game", str(tmp_path))
+    broken = data.get_snapshot()
+    broken.move_history.append(cast(Movement, (broken.move_history[0][0], None)))
+    with pytest.raises(AttributeError):
+        serializer.serialize(broken, "game", str(tmp_path))
+    assert [file.name for file in tmp_path.iterdir() if file.is_file()] == \
+        [serializer.format.get_fullname("game")]
+    assert serializer.deserialize("game", str(tmp_path))[0] == data
+
+def test_json_layout() -> None:
+    """Tests the nested arrays are compacted across chunks, keeping the strings whitespace"""
+    chunks = ['{\n    "moves": [\n        [6', ',\n 4]', ',\n        [4, 4]\n    ],',
+              '\n    "grid": [["  ", "[ "]]\n}']
+    json_layout = JsonLayout()
+    assert "".join(json_layout.format(chunk) for chunk in chunks) == \
+        '{\n    "moves": [\n        [6,4],\n        [4,4]\n    ],\n    "grid": [["  ","[ "]]\n}'
+
+def test_save_index(tmp_path: Path) -> None:
+    """Tests the index lists the saves with their metadata, reconciled with the saves written
+    or deleted behind the serializer"""
+    serializer = get_serializer(SaveEncoding.BINARY)
+    datas = [get_benchmark_game(10 * i, i) for i in range(3)]
+    for i, data in enumerate(datas):
+        serializer.serialize(data, str(i), str(tmp_path))
+    assert sorted(serializer.get_saves(str(tmp_path))) == \
+        sorted(serializer.format.get_fullname(str(i)) for i in range(3))
+    assert (tmp_path / INDEX_DIR).is_dir()
+    # Another serializer reads the index and its log, without reading the saves
+    saves_info = get_serializer(SaveEncoding.BINARY).get_saves_info(str(tmp_path))
+    assert saves_info[serializer.format.get_fullname("2")].metadata == datas[2].get_save_metadata()
+
+    (tmp_path / serializer.format.get_fullname("0")).unlink()
+    (tmp_path / serializer.format.get_fullname("copy")).write_bytes(
+        datas[2].get_serialization_bytes())
+    saves_info = serializer.get_saves_info(str(tmp_path))
+    assert sorted(saves_info) == sorted(serializer.format.get_fullname(name)
+                                        for name in ("1", "2", "copy"))
+    for name, data in (("1", datas[1]), ("copy", datas[2])):
+        info = saves_info[serializer.format.get_fullname(name)]
+        assert info.metadata == data.get_save_metadata()
+        assert info.metadata["plies"] == len(data.move_history)
+
+    # Rewritten in place, the directory mtime doesn't change
+    with open(tmp_path / serializer.format.get_fullname("copy"), "r+b") as file:
+        file.write(datas[1].get_serialization_bytes())
+        file.truncate()
+    saves_info = serializer.get_saves_info(str(tmp_path))
+    assert saves_info[serializer.format.get_fullname("copy")].metadata == \
+        datas[1].get_save_metadata()
+
+    assert serializer.delete("1", str(tmp_path))
+    assert not serializer.delete("1", str(tmp_path))
+    index = SaveIndex.load(str(tmp_path), serializer.format.get_fullname(""))
+    log_records = index.log_records
+    index.remove(serializer.format.get_fullname("1"))
+    assert index.log_records == log_records
+    serializer.use_index = False
+    assert sorted(serializer.get_saves(str(tmp_path))) == \
+        sorted(serializer.format.get_fullname(name) for name in ("2", "copy"))
+
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_lazy_deserialize(tmp_path: Path, encoding: SaveEncoding) -> None:
+    """Tests lazily loaded game datas build their move history on load_move_history, equal to
+    the eagerly loaded ones"""
+    serializer = get_serializer(encoding)
+    data = get_benchmark_game(80, 1)
+    serializer.serialize(data, "game", str(tmp_path))
+    loaded, status = serializer.deserialize("game", str(tmp_path), lazy=True)
+    assert status is DeserializeStatus.SUCCESFULL and loaded is not None
+    assert loaded.is_lazy() and loaded.get_plies() == len(data.move_history)
+    assert loaded.get_save_metadata() == data.get_save_metadata()
+    assert list(loaded.iter_moves()) == data.move_history
+    snapshot = loaded.get_snapshot()
+    assert loaded.is_lazy() and snapshot.is_lazy()
+
+    assert not loaded.move_history
+    assert loaded.load_move_history() == data.move_history
+    assert not loaded.is_lazy() and loaded == data
+    loaded.move_history.pop()
+    assert snapshot.get_plies() == len(data.move_history)
+    assert snapshot.load_move_history() == data.move_history
+
+def test_lazy_corrupted() -> None:
+    """TODO
+    """
+    encoding = bytearray(get_benchmark_game(10, 0).get_serialization_bytes())
+    encoding[BINARY_HEADER.size:BINARY_HEADER.size + BINARY_MOVE.size] = bytes(BINARY_MOVE.size)
+    data = ChessGameData.get_from_bytes(bytes(encoding), lazy=True)
+    with pytest.raises(ValueError):
+        data.load_move_history()
+    with pytest.raises(ValueError):
+        ChessGameData.get_from_bytes(bytes(encoding))
+
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_lazy_load_game(tmp_path: Path, encoding: SaveEncoding) -> None:
+    """Tests a lazily loaded game data equals the eager one and loads as the same game, with
+    its history's en passant"""
+    game = ChessGame.new_game()
+    for move in ("e2", "e4"), ("a7", "a6"), ("e4", "e5"), ("d7", "d5"):
+        game.attempt_move(*(Grid.coord_from_str(coord) for coord in move))
+    serializer = get_serializer(encoding)
+    serializer.serialize(game.data, "game", str(tmp_path))
+    eager, _ = serializer.deserialize("game", str(tmp_path))
+    lazy, _ = serializer.deserialize("game", str(tmp_path), lazy=True)
+    assert eager is not None and lazy is not None
+    assert lazy.is_lazy() and lazy == eager
+
+    loaded = ChessGame.load_game(deepcopy(game.grid), lazy)
+    assert not lazy.is_lazy() and lazy == eager == game.data
+    en_passant = (Grid.coord_from_str("e5"), Grid.coord_from_str("d6"), None)
+    assert en_passant in loaded.legal_moves_to(Grid.coord_from_str("d6"))
+    assert loaded.data.get_plies() == 4
+
+def test_archive(tmp_path: Path) -> None:
+    """Tests the archived game datas are read back in random access and order, across appends,
+    rebuilding the index of an archive left without it"""
+    serializer = get_serializer(SaveEncoding.BINARY)
+    datas = [get_benchmark_game(20 * i, i) for i in range(6)]
+    with serializer.open_archive("archive", str(tmp_path), writable=True) as archive:
+        assert len(archive) == 0
+        assert archive.append(datas[:4]) == 4
+        assert archive.append(iter(datas[4:])) == 2
+        assert archive[3] == datas[3] and archive[-1] == datas[-1]
+
+    with serializer.open_archive("archive", str(tmp_path)) as archive:
+        assert list(archive) == datas
+        lazy = archive.get(2, lazy=True)
+        assert lazy.is_lazy() and lazy.get_plies() == datas[2].get_plies()
+        lazy.load_move_history()
+        assert lazy == datas[2]
+        with pytest.raises(ValueError):
+            archive.append(datas)
+
+    archive_path = tmp_path / (serializer.format.get_fullname("archive") + ARCHIVE_FILE_END)
+    # Crash while appending, after the first records
+    with open(archive_path, "r+b") as file:
+        file.truncate(archive_path.stat().st_size - 10)
+    with serializer.open_archive("archive", str(tmp_path), writable=True) as archive:
+        assert list(archive) == datas
+        archive.append(datas[:1])
+    with serializer.open_archive("archive", str(tmp_path)) as archive:
+        assert list(archive) == datas + datas[:1]
+
+@pytest.mark.parametrize("compression", list(SaveCompression))
+@pytest.mark.parametrize("encoding", list(SaveEncoding))
+def test_compressed_saves(tmp_path: Path, encoding: SaveEncoding,
+                          compression: SaveCompression) -> None:
+    """Tests saves are compressed by the codec of their extension and load back, truncated ones
+    being corrupted"""
+    serializer = get_serializer(encoding, compression)
+    assert serializer.format.compression is compression
+    data = get_benchmark_game(120, 2)
+    assert serializer.serialize(data, "game", str(tmp_path)) is SerializeStatus.SUCCESFULL
+    assert serializer.deserialize("game", str(tmp_path)) == (data, DeserializeStatus.SUCCESFULL)
+    assert serializer.get_saves(str(tmp_path)) == [serializer.format.get_fullname("game")]
+
+    save_path = tmp_path / serializer.format.get_fullname("game")
+    if compression is not SaveCompression.NONE and encoding is SaveEncoding.JSON:
+        uncompressed = get_serializer(encoding)
+        uncompressed.serialize(data, "game", str(tmp_path))
+        uncompressed_path = tmp_path / uncompressed.format.get_fullname("game")
+        assert save_path.stat().st_size < uncompressed_path.stat().st_size
+    save_path.write_bytes(save_path.read_bytes()[:save_path.stat().st_size // 2])
+    assert serializer.deserialize("game", str(tmp_path)) == (None, DeserializeStatus.CORRUPTED)
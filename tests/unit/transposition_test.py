@@ -0,0 +1,72 @@
+"""TODO"""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.enums import BoundType, PieceType
+from chess_engine.search import SearchLimits, best_move
+from chess_engine.structs import Coord
+from chess_engine.transposition import (BUCKET_SIZE, ENTRY_BYTES, TableEntry,
+                                        TranspositionTable, decode_move,
+                                        encode_move)
+from utils.test_strategies import coords
+
+
+@given(coords(), coords(), st.sampled_from([None, *PieceType]))
+def test_transposition_move_encoding(origin: Coord, dest: Coord,
+                                     promotion: PieceType | None) -> None:
+    """TODO
+    """
+    code = encode_move((origin, dest, promotion))
+    assert 0 <= code < 2**16
+    assert decode_move(code) == (origin, dest, promotion)
+
+def test_transposition_store_probe() -> None:
+    """TODO
+    """
+    table = TranspositionTable(1)
+    assert table.capacity == 2**20 // ENTRY_BYTES
+    assert table.probe(1234) is None
+
+    entry = TableEntry(3, BoundType.EXACT, -25, (Coord(6, 4), Coord(4, 4), None))
+    table.store(1234, entry)
+    assert table.probe(1234) == entry
+    assert (table.hits, table.misses, table.hit_rate) == (1, 1, 0.5)
+
+    table.clear()
+    assert table.probe(1234) is None
+    assert table.usage() == 0
+
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+
+def test_transposition_replacement() -> None:
+    """Tests deeper entries keep the depth preferred slot and the rest share the other slot"""
+    table = TranspositionTable(1)
+    buckets = table.capacity // BUCKET_SIZE
+    deep, shallow, newer = 7, 7 + buckets, 7 + 2*buckets
+
+    table.store(deep, TableEntry(5, BoundType.LOWER, 10, None))
+    table.store(shallow, TableEntry(2, BoundType.UPPER, 20, None))
+    table.store(newer, TableEntry(1, BoundType.EXACT, 30, None))
+    assert table.probe(deep) == TableEntry(5, BoundType.LOWER, 10, None)
+    assert table.probe(shallow) is None
+    assert table.probe(newer) == TableEntry(1, BoundType.EXACT, 30, None)
+    assert table.overwrites == 1
+
+    table.store(shallow, TableEntry(6, BoundType.EXACT, 40, None))
+    assert table.probe(shallow) == TableEntry(6, BoundType.EXACT, 40, None)
+    assert table.probe(deep) is None
+
+def test_transposition_search_reuse() -> None:
+    """TODO
+    """
+    game = ChessGame.new_game()
+    table = TranspositionTable(1)
+    first = best_move(game, SearchLimits(depth=3), table)
+    second = best_move(game, SearchLimits(depth=3), table)
+    assert second.best_move == first.best_move
+    assert second.nodes < first.nodes
+    assert table.hit_rate > 0
@@ -0,0 +1,50 @@
+"""TODO"""
+
+import pytest
+
+from chess_engine.chess_game import ChessGame
+from chess_engine.enums import CacheScope, ValidationStatus
+from chess_engine.structs import Coord
+from chess_engine.validation_cache import ValidationCache
+
+MOV = (Coord(6, 4), Coord(4, 4))
+
+def test_cache_hits_and_misses() -> None:
+    """TODO
+    """
+    cache = ValidationCache()
+    assert cache.get(1, MOV) is None
+    cache.save(1, MOV, ValidationStatus.VALID)
+    assert cache.get(1, MOV) is ValidationStatus.VALID
+    assert cache.get(2, MOV) is None
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.hit_rate == pytest.approx(1/3)
+
+def test_cache_lru_eviction() -> None:
+    """Tests the least recently used position is evicted when the cache is full"""
+    cache = ValidationCache(max_positions=2)
+    cache.save(1, MOV, ValidationStatus.VALID)
+    cache.save(2, MOV, ValidationStatus.INVALID)
+    cache.get(1, MOV)
+    cache.save(3, MOV, ValidationStatus.VALID)
+
+    assert len(cache) == 2
+    assert cache.get(1, MOV) is ValidationStatus.VALID
+    assert cache.get(2, MOV) is None
+    assert cache.get(3, MOV) is ValidationStatus.VALID
+
+def test_cache_scope() -> None:
+    """TODO
+    """
+    shared_game1, shared_game2 = ChessGame.new_game(), ChessGame.new_game()
+    assert shared_game1.validation_cache is shared_game2.validation_cache
+
+    game = ChessGame.new_game()
+    game_scoped = ChessGame(game.grid, game.data, cache_scope=CacheScope.GAME)
+    assert game_scoped.validation_cache is not shared_game1.validation_cache
+
+    assert len(list(game_scoped.legal_moves())) == 20
+    misses = game_scoped.validation_cache.misses
+    assert len(list(game_scoped.legal_moves())) == 20
+    assert game_scoped.validation_cache.misses == misses
@@ -7,6 +7,12 @@ class EnumParseError(Exception):
 class InvalidChessGameError(Exception):
     """Raise when a chess game it's initialized with invalid data"""
 
+class InvalidMoveHistoryError(InvalidChessGameError):
+    """Raise when a chess game's move history contains an illegal move"""
+    def __init__(self, ply: int):
+        super().__init__(f"Invalid move history, illegal move at ply {ply}")
+        self.ply = ply
+
 class InvalidGridError(Exception):
     """Raise when a chess game it's initialized with invalid data"""
 
@@ -18,3 +24,12 @@ class StaticClassInstanceError(Exception):
     def __init__(self, callee_class: type):
         message = f"{callee_class.__name__} is a static class, thus cannot be instanced"
         super().__init__(message)
+
+class SearchLimitError(Exception):
+    """Raise when a search runs out of its node or time budget"""
+
+class InvalidPgnError(Exception):
+    """Raise when a PGN game can't be read"""
+
+class SaveQueueClosedError(Exception):
+    """Raise when requesting a save to a closed save queue"""
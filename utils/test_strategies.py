@@ -40,6 +40,13 @@ str_pieces = st.builds(piece_str_build,
                        )
 opt_str_pieces = st.just(NULL_PIECE_STR) | str_pieces
 
+# Game Moves
+
+# Origin and destination of the moves of a short game, from the start position
+GAME_MOVES = ((Coord(6, 4), Coord(4, 4)), (Coord(1, 3), Coord(3, 3)),
+              (Coord(4, 4), Coord(3, 3)), (Coord(0, 3), Coord(3, 3)),
+              (Coord(7, 6), Coord(5, 5)), (Coord(3, 3), Coord(3, 0)))
+
 # Grid Strategies
 
 @st.composite